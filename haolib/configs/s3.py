@@ -1,6 +1,6 @@
 """S3 config."""
 
-from pydantic import AnyHttpUrl, Field
+from pydantic import AliasChoices, AnyHttpUrl, Field
 from pydantic_settings import BaseSettings
 
 
@@ -34,6 +34,11 @@ class S3Config(BaseSettings):
             If False, SSL verification is disabled (not recommended for production).
             If a string, it's the path to a CA bundle to use for verification.
             Can be set via AWS_VERIFY or S3_VERIFY environment variable. Defaults to None.
+        max_pool_connections (int | None): The maximum number of pooled HTTP connections of the client.
+            Raise it together with the request concurrency to avoid "Connection pool is full" warnings.
+            Can be set via HAOLIB_S3_MAX_POOL environment variable. Defaults to None (client default).
+        dns_cache_ttl (int | None): Seconds the resolved S3 endpoint addresses are cached by the client.
+            Can be set via HAOLIB_S3_DNS_CACHE_TTL environment variable. Defaults to None (client default).
 
     """
 
@@ -56,3 +61,13 @@ class S3Config(BaseSettings):
         default=None,
         description="Controls SSL certificate verification. True to verify, False to disable, or path to CA bundle.",
     )
+    max_pool_connections: int | None = Field(
+        default=None,
+        validation_alias=AliasChoices("max_pool_connections", "HAOLIB_S3_MAX_POOL"),
+        description="The maximum number of pooled HTTP connections of the client.",
+    )
+    dns_cache_ttl: int | None = Field(
+        default=None,
+        validation_alias=AliasChoices("dns_cache_ttl", "HAOLIB_S3_DNS_CACHE_TTL"),
+        description="Seconds the resolved S3 endpoint addresses are cached by the client.",
+    )
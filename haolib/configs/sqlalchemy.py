@@ -11,9 +11,25 @@ class SQLAlchemyConfig(BaseSettings):
 
     Attributes:
         url (str): The url of the sqlalchemy.
-        use_pool (bool): Whether to use a connection pool. Defaults to False.
+        use_pool (bool): Whether to use a connection pool. Without it, every session opens a new
+            connection. Defaults to True.
+        pool_size (int): The number of connections kept open in the pool. Defaults to 20.
+        max_overflow (int): The number of connections opened beyond pool_size under load. Defaults to 10.
+        pool_timeout (float): Seconds to wait for a free connection before giving up. Defaults to 30.
+        pool_recycle (int): Seconds after which a connection is replaced, so connections closed by the
+            server or a proxy for being idle are not reused. -1 disables recycling. Defaults to 1800.
+        pool_pre_ping (bool): Whether to test connections on checkout. Costs a round trip per checkout.
+            Defaults to False.
+        pool_warmup (bool): Whether to open pool_size connections when the engine is created, so the
+            first requests do not pay the connection latency. Defaults to False.
 
     """
 
     url: str
-    use_pool: bool = Field(default=False)
+    use_pool: bool = Field(default=True)
+    pool_size: int = Field(default=20)
+    max_overflow: int = Field(default=10)
+    pool_timeout: float = Field(default=30)
+    pool_recycle: int = Field(default=1800)
+    pool_pre_ping: bool = Field(default=False)
+    pool_warmup: bool = Field(default=False)
@@ -4,13 +4,19 @@ IMPORTANT: THIS MODULE HAS BEEN VIBE CODED
 
 """
 
+import os
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import datetime
-from typing import Literal, Protocol
+from typing import Any, Literal, Protocol
 
 from haolib.database.files.s3.clients.pydantic import (
     S3AccessControlPolicy,
+    S3BatchJobManifest,
+    S3BatchJobOperation,
+    S3BatchJobReport,
     S3CopyObjectResponse,
     S3CORSConfiguration,
+    S3CreateBatchJobResponse,
     S3CreateBucketConfiguration,
     S3CreateBucketResponse,
     S3DeleteBucketCorsResponse,
@@ -26,6 +32,7 @@ from haolib.database.files.s3.clients.pydantic import (
     S3GetBucketPolicyResponse,
     S3GetObjectAclResponse,
     S3GetObjectResponse,
+    S3GetObjectStreamResponse,
     S3LifecycleConfiguration,
     S3ListBucketsResponse,
     S3ListObjectsResponse,
@@ -42,6 +49,8 @@ from haolib.database.files.s3.clients.pydantic import (
     S3PutObjectLockConfigurationResponse,
     S3PutObjectResponse,
     S3PutObjectRetentionResponse,
+    S3SelectInputSerialization,
+    S3SelectOutputSerialization,
 )
 
 
@@ -264,6 +273,46 @@ class AbstractS3Client(Protocol):
         """
         ...
 
+    async def create_batch_job(
+        self,
+        operation: S3BatchJobOperation,
+        manifest: S3BatchJobManifest,
+        role_arn: str,
+        account_id: str | None = None,
+        report: S3BatchJobReport | None = None,
+        priority: int = 10,
+        confirmation_required: bool = False,
+        client_request_token: str | None = None,
+        description: str | None = None,
+    ) -> S3CreateBatchJobResponse:
+        """Create an S3 Batch Operations job.
+
+        The job applies a single operation to every object listed in the manifest, with
+        the parallelism handled server-side by S3. This replaces N per-object requests with
+        a single job creation, which matters for sweeps over large numbers of objects.
+
+        Args:
+            operation: The operation to run on every object in the manifest.
+            manifest: The location of the CSV manifest listing the objects.
+            role_arn: The ARN of the IAM role that S3 Batch Operations assumes to run the job.
+            account_id: The AWS account ID that creates the job. Defaults to the client's account ID.
+            report: The configuration of the job completion report.
+            priority: The numerical priority of the job. Higher numbers mean higher priority.
+            confirmation_required: Whether the job must be confirmed before it runs.
+            client_request_token: An idempotency token to ensure that the job is created only once.
+            description: A description of the job.
+
+        Returns:
+            A response containing the ID of the created job.
+
+        Raises:
+            S3AccessDeniedClientException: If access is denied.
+            S3InvalidRequestClientException: If the request is invalid.
+            S3ServiceClientException: For other S3 service errors.
+
+        """
+        ...
+
     async def create_bucket(
         self,
         bucket: str,
@@ -593,6 +642,30 @@ class AbstractS3Client(Protocol):
         """
         ...
 
+    async def get_bucket_policy_parsed(
+        self,
+        bucket: str,
+        expected_bucket_owner: str | None = None,
+    ) -> dict[str, Any]:
+        """Get the policy for a bucket as a parsed JSON document.
+
+        Args:
+            bucket: The name of the bucket.
+            expected_bucket_owner: The account ID of the expected bucket owner.
+
+        Returns:
+            The bucket policy.
+
+        Raises:
+            S3NoSuchBucketClientException: If the bucket does not exist.
+            S3NoSuchPolicyClientException: If the bucket policy does not exist.
+            S3AccessDeniedClientException: If access is denied.
+            S3InvalidRequestClientException: If the request is invalid.
+            S3ServiceClientException: For other S3 service errors.
+
+        """
+        ...
+
     async def get_object(
         self,
         bucket: str,
@@ -653,6 +726,116 @@ class AbstractS3Client(Protocol):
         """
         ...
 
+    async def get_object_stream(
+        self,
+        bucket: str,
+        key: str,
+        if_match: str | None = None,
+        if_modified_since: datetime | None = None,
+        if_none_match: str | None = None,
+        if_unmodified_since: datetime | None = None,
+        range_header: str | None = None,
+        response_cache_control: str | None = None,
+        response_content_disposition: str | None = None,
+        response_content_encoding: str | None = None,
+        response_content_language: str | None = None,
+        response_content_type: str | None = None,
+        response_expires: datetime | None = None,
+        version_id: str | None = None,
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        request_payer: Literal["requester", "requester_payer"] | None = None,
+        expected_bucket_owner: str | None = None,
+        checksum_mode: Literal["ENABLED"] | None = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> S3GetObjectStreamResponse:
+        """Get an object from a bucket without buffering its body.
+
+        The body is returned as an async iterator of chunks, so large objects can be
+        piped to disk or a socket while they are downloaded, with at most one chunk
+        held in memory.
+
+        Args:
+            bucket: The name of the bucket.
+            key: The object key.
+            if_match: Return the object only if its entity tag (ETag) is the same as the one specified.
+            if_modified_since: Return the object only if it has been modified since the specified time.
+            if_none_match: Return the object only if its entity tag (ETag) is different from the one specified.
+            if_unmodified_since: Return the object only if it has not been modified since the specified time.
+            range_header: Downloads the specified range bytes of an object.
+            response_cache_control: Sets the Cache-Control header of the response.
+            response_content_disposition: Sets the Content-Disposition header of the response.
+            response_content_encoding: Sets the Content-Encoding header of the response.
+            response_content_language: Sets the Content-Language header of the response.
+            response_content_type: Sets the Content-Type header of the response.
+            response_expires: Sets the Expires header of the response.
+            version_id: Version ID used to reference a specific version of the object.
+            sse_customer_algorithm: Specifies the algorithm to use to when decrypting the object.
+            sse_customer_key: Specifies the customer-provided encryption key.
+            request_payer: Confirms that the requester knows that they will be charged for the request.
+            expected_bucket_owner: The account ID of the expected bucket owner.
+            checksum_mode: To retrieve the checksum, this parameter must be enabled.
+            chunk_size: Maximum size in bytes of the chunks yielded by the body.
+
+        Returns:
+            The object metadata and a body that yields the object data in chunks.
+
+        Raises:
+            S3NoSuchBucketClientException: If the bucket does not exist.
+            S3NoSuchKeyClientException: If the object key does not exist.
+            S3AccessDeniedClientException: If access is denied.
+            S3PreconditionFailedClientException: If a precondition check fails.
+            S3InvalidObjectStateClientException: If the object is in an invalid state.
+            S3InvalidRequestClientException: If the request is invalid.
+            S3ServiceClientException: For other S3 service errors.
+
+        """
+        ...
+
+    async def get_object_ranged(
+        self,
+        bucket: str,
+        key: str,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
+        version_id: str | None = None,
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        request_payer: Literal["requester", "requester_payer"] | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> S3GetObjectResponse:
+        """Get an object from a bucket with concurrent byte-range requests.
+
+        The object is downloaded in parts of ``part_size`` bytes over up to
+        ``max_concurrency`` connections, which is faster than a single stream for
+        large objects. Parts are written into one preallocated buffer, and all of
+        them are pinned to the ETag of the first part.
+
+        Args:
+            bucket: The name of the bucket.
+            key: The object key.
+            part_size: Size of each byte range in bytes.
+            max_concurrency: Maximum number of parts downloaded concurrently.
+            version_id: Version ID used to reference a specific version of the object.
+            sse_customer_algorithm: Specifies the algorithm to use to when decrypting the object.
+            sse_customer_key: Specifies the customer-provided encryption key.
+            request_payer: Confirms that the requester knows that they will be charged for the request.
+            expected_bucket_owner: The account ID of the expected bucket owner.
+
+        Returns:
+            The object data and metadata.
+
+        Raises:
+            S3NoSuchBucketClientException: If the bucket does not exist.
+            S3NoSuchKeyClientException: If the object key does not exist.
+            S3AccessDeniedClientException: If access is denied.
+            S3PreconditionFailedClientException: If the object changed during the download.
+            S3InvalidRequestClientException: If the request is invalid.
+            S3ServiceClientException: For other S3 service errors.
+
+        """
+        ...
+
     async def get_object_acl(
         self,
         bucket: str,
@@ -832,7 +1015,7 @@ class AbstractS3Client(Protocol):
     async def put_bucket_policy(
         self,
         bucket: str,
-        policy: str,
+        policy: str | dict[str, Any],
         content_md5: str | None = None,
         checksum_algorithm: Literal["CRC32", "CRC32C", "SHA1", "SHA256", "CRC64NVME"] | None = None,
         confirm_remove_self_bucket_access: bool | None = None,
@@ -842,7 +1025,7 @@ class AbstractS3Client(Protocol):
 
         Args:
             bucket: The name of the bucket.
-            policy: The bucket policy as a JSON document.
+            policy: The bucket policy as a JSON document, or as a dictionary to be serialized to one.
             content_md5: The base64-encoded 128-bit MD5 digest of the data.
             checksum_algorithm: Indicates the algorithm used to create the checksum.
             confirm_remove_self_bucket_access: Set this parameter to true to confirm that you want to remove your
@@ -856,7 +1039,7 @@ class AbstractS3Client(Protocol):
         self,
         bucket: str,
         key: str,
-        body: bytes | str | None = None,
+        body: bytes | str | AsyncIterable[bytes] | os.PathLike[str] | None = None,
         acl: Literal[
             "private",
             "public-read",
@@ -914,13 +1097,21 @@ class AbstractS3Client(Protocol):
         object_lock_legal_hold_status: Literal["ON", "OFF"] | None = None,
         expected_bucket_owner: str | None = None,
         metadata_directive: Literal["COPY", "REPLACE"] | None = None,
+        multipart_threshold: int | None = 8 * 1024 * 1024,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
     ) -> S3PutObjectResponse:
         """Put an object into a bucket.
 
+        Bodies of at least ``multipart_threshold`` bytes are uploaded as a multipart upload
+        with up to ``max_concurrency`` parts in flight, so large objects saturate the bandwidth
+        and a failed part is retried on its own instead of the whole object. Async iterables and
+        file paths are streamed part by part, so they are never held in memory as a whole.
+
         Args:
             bucket: The name of the bucket.
             key: The object key.
-            body: Object data.
+            body: Object data, as bytes, a string, an async iterable of chunks or a file path.
             acl: The canned ACL to apply to the object.
             cache_control: Can be used to specify caching behavior along the request/reply chain.
             content_disposition: Specifies presentational information for the object.
@@ -957,6 +1148,11 @@ class AbstractS3Client(Protocol):
             expected_bucket_owner: The account ID of the expected bucket owner.
             metadata_directive: Specifies whether the metadata is copied from the source object or
                 replaced with metadata provided in the request.
+            multipart_threshold: Body size in bytes from which a multipart upload is used. If None,
+                the body is always sent in a single request. Bodies with a ``content_length``,
+                ``content_md5`` or precomputed checksum are always sent in a single request.
+            part_size: Size of each part of a multipart upload. S3 requires at least 5 MiB.
+            max_concurrency: Maximum number of parts uploaded concurrently.
 
         Returns:
             A dictionary containing the response metadata.
@@ -1101,6 +1297,46 @@ class AbstractS3Client(Protocol):
         """
         ...
 
+    def select_object_content(
+        self,
+        bucket: str,
+        key: str,
+        expression: str,
+        input_serialization: S3SelectInputSerialization,
+        output_serialization: S3SelectOutputSerialization,
+        expression_type: Literal["SQL"] = "SQL",
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Filter the contents of an object server-side with S3 Select.
+
+        Only the records matching the SQL expression are sent over the network, instead of
+        downloading the whole object and filtering it client-side.
+
+        Args:
+            bucket: The name of the bucket.
+            key: The object key.
+            expression: The SQL expression used to query the object.
+            input_serialization: The format of the object.
+            output_serialization: The format of the returned records.
+            expression_type: The type of the expression.
+            sse_customer_algorithm: The server-side encryption algorithm used when the object was created.
+            sse_customer_key: The server-side encryption key used when the object was created.
+            expected_bucket_owner: The account ID of the expected bucket owner.
+
+        Returns:
+            An async iterator over chunks of the returned records.
+
+        Raises:
+            S3NoSuchBucketClientException: If the bucket does not exist.
+            S3NoSuchKeyClientException: If the object does not exist.
+            S3InvalidRequestClientException: If the request is invalid or S3 Select is not supported.
+            S3ServiceClientException: For other S3 service errors.
+
+        """
+        ...
+
     async def generate_presigned_url(
         self,
         bucket: str,
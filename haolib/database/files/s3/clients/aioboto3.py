@@ -1,17 +1,33 @@
 """AIOboto3 S3 client."""
 
+import asyncio
+import base64
+import contextlib
+import functools
+import hashlib
+import html
+import os
+import re
+import ssl
+import time
+import uuid
+import weakref
+import zlib
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Sequence
 from datetime import datetime
 from types import TracebackType
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, NoReturn, Self
 
-import aioboto3  # type: ignore[import-untyped]
 from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+from pydantic_core import from_json, to_json
 
 from haolib.database.files.s3.clients.abstract import (
     S3AccessDeniedClientException,
     S3BucketAlreadyExistsClientException,
     S3BucketAlreadyOwnedByYouClientException,
     S3BucketNotEmptyClientException,
+    S3ClientException,
     S3InvalidBucketNameClientException,
     S3InvalidObjectStateClientException,
     S3InvalidRequestClientException,
@@ -29,12 +45,14 @@ from haolib.database.files.s3.clients.abstract import (
 )
 from haolib.database.files.s3.clients.pydantic import (
     S3AccessControlPolicy,
-    S3Bucket,
-    S3CommonPrefix,
+    S3BatchJobManifest,
+    S3BatchJobOperation,
+    S3BatchJobPutObjectAcl,
+    S3BatchJobReport,
     S3CopyObjectResponse,
     S3CopyObjectResult,
     S3CORSConfiguration,
-    S3CORSRule,
+    S3CreateBatchJobResponse,
     S3CreateBucketConfiguration,
     S3CreateBucketResponse,
     S3DeleteBucketCorsResponse,
@@ -44,41 +62,498 @@ from haolib.database.files.s3.clients.pydantic import (
     S3DeleteObjectResponse,
     S3DeleteObjectsDelete,
     S3DeleteObjectsResponse,
-    S3DeleteObjectsResponseDeletedItem,
-    S3DeleteObjectsResponseErrorItem,
     S3GetBucketAclResponse,
     S3GetBucketCorsResponse,
     S3GetBucketLifecycleConfigurationResponse,
     S3GetBucketPolicyResponse,
     S3GetObjectAclResponse,
     S3GetObjectResponse,
-    S3Grant,
-    S3Grantee,
+    S3GetObjectStreamResponse,
     S3LifecycleConfiguration,
-    S3LifecycleExpiration,
-    S3LifecycleRule,
-    S3LifecycleRuleFilter,
-    S3LifecycleTransition,
     S3ListBucketsResponse,
     S3ListObjectsResponse,
     S3ListObjectsV2Response,
-    S3NoncurrentVersionExpiration,
-    S3NoncurrentVersionTransition,
     S3Object,
     S3ObjectLockConfiguration,
     S3ObjectLockLegalHold,
     S3ObjectLockRetention,
-    S3Owner,
     S3PutBucketAclResponse,
     S3PutBucketCorsResponse,
     S3PutBucketLifecycleConfigurationResponse,
     S3PutBucketPolicyResponse,
+    S3PutObjectAclBulkResponse,
     S3PutObjectAclResponse,
     S3PutObjectLegalHoldResponse,
     S3PutObjectLockConfigurationResponse,
     S3PutObjectResponse,
     S3PutObjectRetentionResponse,
+    S3SelectInputSerialization,
+    S3SelectOutputSerialization,
 )
+from haolib.database.files.s3.clients.ratelimit import S3AdaptiveRateLimiter
+from haolib.database.files.s3.clients.sigv4 import S3QueryPresigner, quote_s3_key
+
+if TYPE_CHECKING:
+    import aioboto3  # type: ignore[import-untyped]
+    import aiohttp
+
+# Above this total body size, checksums are computed in a worker thread. hashlib releases
+# the GIL while hashing, so this overlaps with socket I/O on the event loop.
+_THREADED_CHECKSUM_THRESHOLD = 1024 * 1024
+# Request checksum parameters by ChecksumAlgorithm, for the algorithms computed by the client itself.
+_CHECKSUM_ARGS = {
+    "CRC32": "ChecksumCRC32",
+    "CRC32C": "ChecksumCRC32C",
+    "SHA1": "ChecksumSHA1",
+    "SHA256": "ChecksumSHA256",
+}
+
+# Lifetime of the URLs signed for native requests. They are sent right away, this only covers clock skew.
+_NATIVE_URL_EXPIRES_IN = 60
+# Fields of the flat XML error document S3 answers failed requests with.
+_XML_ERROR_FIELD = re.compile(r"<(Code|Message)>([^<]*)</\1>")
+
+# Maximum number of keys S3 accepts in a single DeleteObjects request.
+_DELETE_OBJECTS_MAX_KEYS = 1000
+
+# Default part size and concurrency of ranged downloads, the same as boto3's TransferConfig.
+# 8 MiB parts are large enough to amortize the per-request latency over the transfer time.
+_RANGED_GET_PART_SIZE = 8 * 1024 * 1024
+_RANGED_GET_MAX_CONCURRENCY = 10
+
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+_MULTIPART_MAX_CONCURRENCY = 10
+_MULTIPART_MAX_PARTS = 10_000
+# put_object arguments that also apply to the part, completion and abort calls of a multipart upload.
+_UPLOAD_PART_ARGS = (
+    "ChecksumAlgorithm",
+    "SSECustomerAlgorithm",
+    "SSECustomerKey",
+    "RequestPayer",
+    "ExpectedBucketOwner",
+)
+_COMPLETE_MULTIPART_UPLOAD_ARGS = ("SSECustomerAlgorithm", "SSECustomerKey", "RequestPayer", "ExpectedBucketOwner")
+_ABORT_MULTIPART_UPLOAD_ARGS = ("RequestPayer", "ExpectedBucketOwner")
+
+# Above this number of deleted and failed items, delete_objects responses are parsed in a worker thread.
+_THREADED_DELETE_PARSE_THRESHOLD = 256
+
+_ERROR_CODE_EXCEPTIONS: dict[str, type[Exception]] = {
+    "BucketAlreadyExists": S3BucketAlreadyExistsClientException,
+    "BucketAlreadyOwnedByYou": S3BucketAlreadyOwnedByYouClientException,
+    "NoSuchBucket": S3NoSuchBucketClientException,
+    "NoSuchKey": S3NoSuchKeyClientException,
+    "AccessDenied": S3AccessDeniedClientException,
+    "BucketNotEmpty": S3BucketNotEmptyClientException,
+    "NoSuchLifecycleConfiguration": S3NoSuchLifecycleConfigurationClientException,
+    "NoSuchCORSConfiguration": S3NoSuchCORSConfigurationClientException,
+    "NoSuchBucketPolicy": S3NoSuchPolicyClientException,
+    "InvalidBucketName": S3InvalidBucketNameClientException,
+    "ObjectNotInActiveTierError": S3ObjectNotInActiveTierClientException,
+    "InvalidObjectState": S3InvalidObjectStateClientException,
+    "PreconditionFailed": S3PreconditionFailedClientException,
+    "InvalidSecurity": S3InvalidSecurityClientException,
+    "InvalidToken": S3InvalidTokenClientException,
+    "RequestTimeout": S3RequestTimeoutClientException,
+    "InvalidRequest": S3InvalidRequestClientException,
+    "NotImplemented": S3InvalidRequestClientException,  # MinIO may return this for unsupported features
+    "InvalidBucketState": S3InvalidRequestClientException,  # MinIO may return this for object lock
+}
+
+_REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+_REGEX_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+
+def _regex_literal_prefix(pattern: str) -> str:
+    """Get the literal prefix that every match of a regular expression starts with.
+
+    Args:
+        pattern: The regular expression, matched from the start of the string.
+
+    Returns:
+        The longest literal prefix that can be pushed down as an S3 listing prefix.
+
+    """
+    if "|" in pattern:
+        return ""
+
+    prefix: list[str] = []
+    i = 1 if pattern.startswith("^") else 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            char = pattern[i + 1]
+            i += 2
+        elif char in _REGEX_SPECIAL_CHARACTERS:
+            break
+        else:
+            i += 1
+        # A quantified character may be absent from the match.
+        if i < len(pattern) and pattern[i] in _REGEX_OPTIONAL_QUANTIFIERS:
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+def _native_client_error(status: int, body: str, operation_name: str) -> ClientError:
+    """Build the ClientError botocore raises for an S3 error response to a native request."""
+    fields = dict(_XML_ERROR_FIELD.findall(body))
+    error = {
+        "Code": html.unescape(fields.get("Code", str(status))),
+        "Message": html.unescape(fields.get("Message", "")),
+    }
+    return ClientError({"Error": error, "ResponseMetadata": {"HTTPStatusCode": status}}, operation_name)
+
+
+def _client_error_details(error: ClientError) -> dict[str, str]:
+    """Get the code and message of a boto3 ClientError, as in the Errors entries of S3 responses."""
+    details = error.response.get("Error", {})
+    return {"Code": details.get("Code", ""), "Message": details.get("Message", str(error))}
+
+
+def _parse_delete_objects_response(response: dict[str, Any]) -> S3DeleteObjectsResponse:
+    """Build a delete objects response from a boto3 response.
+
+    Args:
+        response: The boto3 delete_objects response.
+
+    Returns:
+        The delete objects response.
+
+    """
+    # Responses can hold thousands of items, so they are validated from the boto3 entries in a
+    # single call instead of building every item model from Python.
+    return S3DeleteObjectsResponse.model_validate(
+        {
+            "deleted": response.get("Deleted", []),
+            "error": response.get("Errors", []),
+            "request_charged": response.get("RequestCharged"),
+        }
+    )
+
+
+async def _iter_body(body: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield a streaming body in chunks, releasing the connection once it is consumed or closed.
+
+    Args:
+        body: The aiobotocore streaming body.
+        chunk_size: Maximum size of the chunks in bytes.
+
+    Yields:
+        The body chunks.
+
+    """
+    try:
+        async for chunk in body.iter_chunks(chunk_size):
+            yield chunk
+    finally:
+        body.close()
+
+
+async def _iter_file(path: os.PathLike[str], chunk_size: int) -> AsyncIterator[bytes]:
+    """Read a file in chunks without blocking the event loop.
+
+    Args:
+        path: The path of the file.
+        chunk_size: Size of the chunks in bytes.
+
+    Yields:
+        The file chunks.
+
+    """
+    file = await asyncio.to_thread(open, path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(file.read, chunk_size):
+            yield chunk
+    finally:
+        file.close()
+
+
+async def _iter_parts(chunks: AsyncIterable[bytes], part_size: int) -> AsyncIterator[bytes | bytearray]:
+    """Regroup chunks of any size into parts of ``part_size`` bytes, except for the last one.
+
+    Every part is preallocated and filled through a memoryview, so each byte is copied once
+    instead of being appended to a growing buffer, sliced out and converted to bytes.
+
+    Args:
+        chunks: The body chunks.
+        part_size: Size of the parts in bytes.
+
+    Yields:
+        The parts. Parts are handed over as they are, so a new one is allocated after each.
+
+    """
+    part = bytearray(part_size)
+    view = memoryview(part)
+    filled = 0
+    async for chunk in chunks:
+        if not filled and len(chunk) == part_size:
+            yield chunk
+            continue
+        chunk_view = memoryview(chunk)
+        offset = 0
+        while offset < len(chunk_view):
+            size = min(part_size - filled, len(chunk_view) - offset)
+            view[filled : filled + size] = chunk_view[offset : offset + size]
+            filled += size
+            offset += size
+            if filled == part_size:
+                view.release()
+                yield part
+                part = bytearray(part_size)
+                view = memoryview(part)
+                filled = 0
+    view.release()
+    if filled:
+        del part[filled:]
+        yield part
+
+
+async def _prepend_parts(
+    head: Sequence[bytes | bytearray], parts: AsyncIterator[bytes | bytearray]
+) -> AsyncIterator[bytes | bytearray]:
+    """Yield already read parts, then the rest of the parts."""
+    for part in head:
+        yield part
+    async for part in parts:
+        yield part
+
+
+def _compute_checksum(body: bytes | bytearray, algorithm: str) -> str | None:
+    """Compute the base64-encoded checksum of a body, as sent in the ``x-amz-checksum-*`` headers.
+
+    Args:
+        body: The body.
+        algorithm: The checksum algorithm, one of the keys of ``_CHECKSUM_ARGS``.
+
+    Returns:
+        The checksum, or None if it is left to botocore (CRC32C without ``google-crc32c``).
+
+    """
+    if algorithm == "SHA256":
+        digest = hashlib.sha256(body).digest()
+    elif algorithm == "SHA1":
+        digest = hashlib.sha1(body, usedforsecurity=False).digest()
+    elif algorithm == "CRC32":
+        digest = zlib.crc32(body).to_bytes(4, "big")
+    else:
+        try:
+            import google_crc32c  # type: ignore[import-not-found]  # noqa: PLC0415
+        except ImportError:
+            return None
+        digest = google_crc32c.value(body).to_bytes(4, "big")
+    return base64.b64encode(digest).decode("ascii")
+
+
+async def _add_checksum(kwargs: dict[str, Any]) -> None:
+    """Add the checksum of the body for the requested ``ChecksumAlgorithm``, unless it is already set.
+
+    botocore computes missing checksums itself, on the event loop and in the middle of request
+    serialization, and needs the CRT extension for CRC32C. Computing them here uses hashlib, zlib or
+    google-crc32c (if installed), in a worker thread for large bodies.
+
+    Args:
+        kwargs: The ``put_object`` or ``upload_part`` kwargs.
+
+    """
+    algorithm = kwargs.get("ChecksumAlgorithm", "").upper()
+    checksum_name = _CHECKSUM_ARGS.get(algorithm)
+    if checksum_name is None or checksum_name in kwargs:
+        return
+    body = kwargs.get("Body", b"")
+    if len(body) > _THREADED_CHECKSUM_THRESHOLD:
+        checksum = await asyncio.to_thread(_compute_checksum, body, algorithm)
+    else:
+        checksum = _compute_checksum(body, algorithm)
+    if checksum is not None:
+        kwargs[checksum_name] = checksum
+
+
+async def _gather_per_item[T](
+    calls: Iterable[Callable[[], Awaitable[T]]], concurrency: int
+) -> list[T | S3ClientException]:
+    """Run many S3 calls concurrently, with per-item failures.
+
+    Args:
+        calls: The calls, as functions without arguments. They are only called once a slot is free,
+            so no coroutine is left unawaited if the batch is cancelled.
+        concurrency: Maximum number of concurrent calls.
+
+    Returns:
+        The results, in the order of the calls. A call that fails with an S3 client exception gets
+        the exception instead, so it does not fail the others.
+
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: Callable[[], Awaitable[T]]) -> T | S3ClientException:
+        async with semaphore:
+            try:
+                return await call()
+            except S3ClientException as e:
+                return e
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+async def _split_body(body: bytes, part_size: int) -> AsyncIterator[bytes]:
+    """Split a body into parts of ``part_size`` bytes, except for the last one."""
+    for start in range(0, len(body), part_size):
+        yield body[start : start + part_size]
+
+
+@functools.lru_cache(maxsize=32)
+def _get_session(
+    aws_access_key_id: str | None,
+    aws_secret_access_key: str | None,
+    aws_session_token: str | None,
+    region_name: str | None,
+    profile_name: str | None,
+    aws_account_id: str | None,
+) -> aioboto3.Session:
+    """Get a shared aioboto3 session for a set of credentials.
+
+    Creating a session reads the AWS config and credential files synchronously, so
+    sessions are memoized by their (immutable) arguments instead of being created per
+    client. Call ``_get_session.cache_clear()`` after rotating credentials on disk.
+
+    Args:
+        aws_access_key_id: AWS access key ID.
+        aws_secret_access_key: AWS secret access key.
+        aws_session_token: AWS session token.
+        region_name: AWS region name.
+        profile_name: AWS profile name.
+        aws_account_id: AWS account ID.
+
+    Returns:
+        The aioboto3 session.
+
+    """
+    # aioboto3 takes a few hundred milliseconds to import, so it is only loaded once a client is used.
+    import aioboto3  # type: ignore[import-untyped]  # noqa: PLC0415
+
+    return aioboto3.Session(
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        aws_session_token=aws_session_token,
+        region_name=region_name,
+        profile_name=profile_name,
+        aws_account_id=aws_account_id,
+    )
+
+
+# botocore Config options used unless overridden. botocore defaults to 60 second timeouts and no TCP
+# keepalive, which lets stalled sockets pile up on bursty traffic. Adaptive retries add client-side
+# rate limiting on top of jittered back-off, so throttled bursts slow down instead of retrying in lockstep.
+_DEFAULT_CLIENT_CONFIG: dict[str, Any] = {
+    "tcp_keepalive": True,
+    "connect_timeout": 5,
+    "read_timeout": 30,
+    "max_pool_connections": 50,
+    "retries": {"mode": "adaptive", "max_attempts": 10},
+}
+
+# botocore retries used with a rate limiter. The limiter retries throttled writes itself, so botocore only
+# retries once, e.g. on a dropped connection, instead of multiplying the limiter's attempts.
+_RATE_LIMITED_RETRIES: dict[str, Any] = {"mode": "standard", "total_max_attempts": 2}
+
+# Seconds a bucket that answered NoSuchLifecycleConfiguration is remembered as having no lifecycle
+# configuration, which bounds how long a configuration put through another client goes unseen.
+_NO_LIFECYCLE_TTL = 30.0
+
+# botocore Config options that change the host or the signature of presigned URLs in ways the local
+# presigner does not implement.
+_PRESIGNED_URL_CLIENT_CONFIG_OPTIONS = frozenset({"region_name", "use_fips_endpoint", "use_dualstack_endpoint"})
+
+# Underlying aiobotocore clients shared by every Aioboto3S3Client with the same session, client options
+# and event loop, so fan-out over many instances reuses connection pools instead of opening new ones.
+_CLIENT_POOL: dict[tuple[Any, ...], tuple[Any, Any]] = {}
+_CLIENT_REFCOUNTS: Counter[tuple[Any, ...]] = Counter()
+_CLIENT_POOL_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+
+def _freeze_options(options: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    """Turn client options, including nested ones, into a hashable pool key part."""
+    return tuple(
+        sorted((name, _freeze_options(value) if isinstance(value, dict) else value) for name, value in options.items())
+    )
+
+
+def _drop_empty(value: Any) -> Any:
+    """Recursively drop empty dicts and lists left in a dumped model by all-None sub-models."""
+    if isinstance(value, dict):
+        value = {key: _drop_empty(item) for key, item in value.items()}
+        return {key: item for key, item in value.items() if item not in ({}, [])}
+    if isinstance(value, list):
+        return [item for item in map(_drop_empty, value) if item not in ({}, [])]
+    return value
+
+
+def _client_pool_lock() -> asyncio.Lock:
+    """Get the client pool lock of the running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _CLIENT_POOL_LOCKS.get(loop)
+    if lock is None:
+        lock = _CLIENT_POOL_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+async def _acquire_client(
+    session: aioboto3.Session, client_kwargs: dict[str, Any], client_config: dict[str, Any], service_name: str = "s3"
+) -> tuple[tuple[Any, ...], Any]:
+    """Get a shared client, creating it on first use.
+
+    Args:
+        session: The aioboto3 session.
+        client_kwargs: The client options.
+        client_config: The aiobotocore ``AioConfig`` options.
+        service_name: The AWS service of the client.
+
+    Returns:
+        The pool key and the aiobotocore client.
+
+    """
+    key = (
+        asyncio.get_running_loop(),
+        session,
+        service_name,
+        _freeze_options(client_kwargs),
+        _freeze_options(client_config),
+    )
+    async with _client_pool_lock():
+        if key not in _CLIENT_POOL:
+            # Imported here for the same reason as aioboto3, the config modules are slow to import.
+            from aiobotocore.config import AioConfig  # noqa: PLC0415
+
+            client_cm = session.client(service_name, config=AioConfig(**client_config), **client_kwargs)
+            _CLIENT_POOL[key] = (client_cm, await client_cm.__aenter__())
+        _CLIENT_REFCOUNTS[key] += 1
+        return key, _CLIENT_POOL[key][1]
+
+
+async def _release_client(
+    key: tuple[Any, ...],
+    exc_type: type[BaseException] | None,
+    exc_value: BaseException | None,
+    traceback: TracebackType | None,
+) -> None:
+    """Release a shared client, closing it when it is no longer used.
+
+    Args:
+        key: The pool key returned by ``_acquire_client``.
+        exc_type: The exception type.
+        exc_value: The exception value.
+        traceback: The traceback.
+
+    """
+    async with _client_pool_lock():
+        _CLIENT_REFCOUNTS[key] -= 1
+        if _CLIENT_REFCOUNTS[key] > 0:
+            return
+        del _CLIENT_REFCOUNTS[key]
+        client_cm, _ = _CLIENT_POOL.pop(key)
+        await client_cm.__aexit__(exc_type, exc_value, traceback)
 
 
 class Aioboto3S3Client:
@@ -97,8 +572,15 @@ class Aioboto3S3Client:
         profile_name: str | None = None,
         aws_account_id: str | None = None,
         use_ssl: bool = True,
-        verify: bool | None = None,
+        verify: bool | str | None = None,
         endpoint_url: str | None = None,
+        rate_limiter: S3AdaptiveRateLimiter | None = None,
+        max_concurrent_reads: int | None = None,
+        max_concurrent_writes: int | None = None,
+        max_pool_connections: int | None = None,
+        dns_cache_ttl: int | None = None,
+        client_config: dict[str, Any] | None = None,
+        use_native: bool = False,
     ) -> None:
         """Initialize the client.
 
@@ -110,48 +592,249 @@ class Aioboto3S3Client:
             profile_name: AWS profile name.
             aws_account_id: AWS account ID.
             use_ssl: Whether to use SSL.
-            verify: Whether to verify SSL certificates.
+            verify: Whether to verify SSL certificates, or the path of the CA bundle to verify them with.
             endpoint_url: Custom endpoint URL.
+            rate_limiter: Adaptive rate limiter shared by the write operations. If set, write bursts
+                back off on 503 SlowDown responses instead of failing, and botocore's own retries are
+                reduced to a single standard retry unless ``client_config`` sets ``retries``.
+            max_concurrent_reads: Maximum number of concurrent object reads and listings. Reads and
+                writes are limited separately, so large uploads never delay downloads and listings.
+            max_concurrent_writes: Maximum number of concurrent object writes, copies and deletes.
+            max_pool_connections: Maximum number of pooled HTTP connections. Defaults to 50, or to
+                the sum of the read and write limits if any of them is set.
+            dns_cache_ttl: Seconds the endpoint's resolved addresses are cached by the connection pool.
+                New connections rotate over the cached addresses, so a short TTL spreads long-lived
+                clients over more S3 front-ends. Defaults to the aiohttp default of 10 seconds.
+            client_config: aiobotocore ``AioConfig`` options merged over the defaults (TCP keepalive,
+                5s connect and 30s read timeouts, 50 pooled connections, adaptive retries).
+                Options of the aiohttp connector go to ``connector_args``.
+            use_native: Whether to send ``put_object_legal_hold`` as a locally signed aiohttp request
+                instead of going through botocore's request pipeline. Requires static credentials.
+                Calls with options the native request does not support, and native requests that
+                cannot be sent, go through botocore. S3 errors are raised as they are, and are not
+                retried unless a ``rate_limiter`` retries the throttled ones.
 
         """
-        self._session = aioboto3.Session(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            aws_session_token=aws_session_token,
-            region_name=region_name,
-            profile_name=profile_name,
-            aws_account_id=aws_account_id,
+        self._session_args = (
+            aws_access_key_id,
+            aws_secret_access_key,
+            aws_session_token,
+            region_name,
+            profile_name,
+            aws_account_id,
         )
-        self._use_ssl = use_ssl
-        self._verify = verify
-        self._endpoint_url = endpoint_url
+        self._aws_account_id = aws_account_id
+        self._rate_limiter = rate_limiter
+        self._client_kwargs: dict[str, Any] = {}
+        if endpoint_url:
+            self._client_kwargs["endpoint_url"] = endpoint_url
+        if verify is not None:
+            self._client_kwargs["verify"] = verify
+        if not use_ssl:
+            self._client_kwargs["use_ssl"] = False
+        self._client_config = dict(_DEFAULT_CLIENT_CONFIG)
+        if rate_limiter is not None:
+            self._client_config["retries"] = _RATE_LIMITED_RETRIES
+
+        self._read_semaphore: contextlib.AbstractAsyncContextManager[Any] = contextlib.nullcontext()
+        self._write_semaphore: contextlib.AbstractAsyncContextManager[Any] = contextlib.nullcontext()
+        if max_concurrent_reads is not None:
+            self._read_semaphore = asyncio.Semaphore(max_concurrent_reads)
+        if max_concurrent_writes is not None:
+            self._write_semaphore = asyncio.Semaphore(max_concurrent_writes)
+        if max_concurrent_reads is not None or max_concurrent_writes is not None:
+            # Size the connection pool so that neither side waits for a connection held by the other.
+            default_connections = _DEFAULT_CLIENT_CONFIG["max_pool_connections"]
+            read_connections = max_concurrent_reads or default_connections
+            write_connections = max_concurrent_writes or default_connections
+            self._client_config["max_pool_connections"] = read_connections + write_connections
+        if max_pool_connections is not None:
+            self._client_config["max_pool_connections"] = max_pool_connections
+        if client_config:
+            self._client_config.update(client_config)
+        if dns_cache_ttl is not None:
+            self._client_config["connector_args"] = {
+                **self._client_config.get("connector_args", {}),
+                "ttl_dns_cache": dns_cache_ttl,
+            }
+
         self._client: Any = None
+        self._pool_key: tuple[Any, ...] | None = None
+        self._s3control: Any = None
+        self._s3control_pool_key: tuple[Any, ...] | None = None
+        self._entered = 0
+        self._client_lock = asyncio.Lock()
+        self._use_native = use_native
+        self._http: aiohttp.ClientSession | None = None
+
+        # Expiry times of (bucket, expected bucket owner) pairs known to have no lifecycle configuration.
+        # This client's own lifecycle writes keep it up to date, changes made through other clients are
+        # seen once the entry expires.
+        self._no_lifecycle_buckets: dict[tuple[str, str | None], float] = {}
+
+        # Presigned URLs can be signed locally only with static credentials, and only if the client config
+        # does not change how botocore builds them beyond the addressing style. The presigner is built once
+        # the client has resolved the region, which may come from the environment or a profile.
+        self._presigner: S3QueryPresigner | None = None
+        s3_options = self._client_config.get("s3") or {}
+        self._presign_locally = (
+            bool(aws_access_key_id and aws_secret_access_key)
+            and s3_options.keys() <= {"addressing_style"}
+            and not (endpoint_url and s3_options.get("addressing_style") == "virtual")
+            and self._client_config.get("signature_version") in {None, "s3v4"}
+            and not self._client_config.keys() & _PRESIGNED_URL_CLIENT_CONFIG_OPTIONS
+        )
+
+    @property
+    def _session(self) -> aioboto3.Session:
+        """The aioboto3 session, created (and aioboto3 imported) on first use."""
+        return _get_session(*self._session_args)
 
     async def __aenter__(self) -> Self:
-        """Enter the context manager."""
-        client_kwargs: dict[str, Any] = {}
-        if self._endpoint_url:
-            client_kwargs["endpoint_url"] = self._endpoint_url
-        if self._verify is not None:
-            client_kwargs["verify"] = self._verify
-        if not self._use_ssl:
-            client_kwargs["use_ssl"] = False
-
-        self._client = await self._session.client("s3", **client_kwargs).__aenter__()
+        """Enter the context manager.
+
+        Nested and concurrent ``async with`` blocks on the same instance share one
+        underlying aiobotocore client, which is acquired on the first entry only. Instances
+        with the same credentials and options share it too, within an event loop.
+        """
+        async with self._client_lock:
+            if self._entered == 0:
+                self._pool_key, self._client = await _acquire_client(
+                    self._session, self._client_kwargs, self._client_config
+                )
+                if self._presigner is None and self._presign_locally and self._client.meta.region_name:
+                    aws_access_key_id, aws_secret_access_key, aws_session_token, *_ = self._session_args
+                    self._presigner = S3QueryPresigner(
+                        aws_access_key_id=aws_access_key_id,
+                        aws_secret_access_key=aws_secret_access_key,
+                        aws_session_token=aws_session_token,
+                        region_name=self._client.meta.region_name,
+                        endpoint_url=self._client_kwargs.get("endpoint_url"),
+                        use_ssl=self._client_kwargs.get("use_ssl", True),
+                        addressing_style=(self._client_config.get("s3") or {}).get("addressing_style", "auto"),
+                    )
+                if self._use_native and self._presigner is not None:
+                    import aiohttp  # noqa: PLC0415
+
+                    # Like botocore, a string verifies certificates against that CA bundle.
+                    verify = self._client_kwargs.get("verify")
+                    ssl_option = (
+                        ssl.create_default_context(cafile=verify) if isinstance(verify, str) else verify is not False
+                    )
+                    self._http = aiohttp.ClientSession(
+                        timeout=aiohttp.ClientTimeout(
+                            sock_connect=self._client_config["connect_timeout"],
+                            sock_read=self._client_config["read_timeout"],
+                        ),
+                        connector=aiohttp.TCPConnector(
+                            limit=self._client_config["max_pool_connections"],
+                            ssl=ssl_option,
+                        ),
+                    )
+            self._entered += 1
         return self
 
     async def __aexit__(
         self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
     ) -> None:
-        """Exit the context manager."""
-        if self._client:
-            await self._client.__aexit__(exc_type, exc_value, traceback)
+        """Exit the context manager.
+
+        The underlying client is closed when the last ``async with`` block of every instance
+        sharing it exits.
+        """
+        async with self._client_lock:
+            self._entered -= 1
+            if self._entered > 0 or self._pool_key is None:
+                return
+            pool_key, self._pool_key, self._client = self._pool_key, None, None
+            await _release_client(pool_key, exc_type, exc_value, traceback)
+            if self._http is not None:
+                http, self._http = self._http, None
+                await http.close()
+            if self._s3control_pool_key is not None:
+                pool_key, self._s3control_pool_key, self._s3control = self._s3control_pool_key, None, None
+                await _release_client(pool_key, exc_type, exc_value, traceback)
+
+    async def _get_s3control_client(self) -> Any:
+        """Get the S3 Control client, acquired on first use and released with the S3 client."""
+        async with self._client_lock:
+            if self._s3control is None:
+                # The custom endpoint is an S3 endpoint, it does not apply to S3 Control.
+                client_kwargs = {k: v for k, v in self._client_kwargs.items() if k != "endpoint_url"}
+                self._s3control_pool_key, self._s3control = await _acquire_client(
+                    self._session, client_kwargs, self._client_config, "s3control"
+                )
+            return self._s3control
 
     def _build_kwargs(self, **kwargs: Any) -> dict[str, Any]:
         """Build kwargs for boto3 calls, filtering out None values."""
         return {k: v for k, v in kwargs.items() if v is not None}
 
-    def _handle_client_error(self, error: ClientError) -> None:
+    def _forget_no_lifecycle_bucket(self, bucket: str) -> None:
+        """Forget that a bucket has no lifecycle configuration, for every expected bucket owner."""
+        for key in [key for key in self._no_lifecycle_buckets if key[0] == bucket]:
+            del self._no_lifecycle_buckets[key]
+
+    async def _call_write(self, operation: str, **kwargs: Any) -> Any:
+        """Call a write operation, through the write limit and the rate limiter if configured.
+
+        Only the requests themselves hold a write slot. Waiting for a rate limiter token and backing
+        off after a throttling response happen outside of it, so they do not hold up other writes.
+        """
+        func = getattr(self._client, operation)
+        if self._rate_limiter is None:
+            async with self._write_semaphore:
+                return await func(**kwargs)
+
+        async def send(**kwargs: Any) -> Any:
+            async with self._write_semaphore:
+                return await func(**kwargs)
+
+        return await self._rate_limiter.call(send, **kwargs)
+
+    async def _put_object_legal_hold_native(
+        self, bucket: str, key: str, status: str, version_id: str | None
+    ) -> S3PutObjectLegalHoldResponse | None:
+        """Put the legal hold for an object with a locally signed request.
+
+        The request goes through the write limit and the rate limiter like botocore requests.
+
+        Returns:
+            The response, or None if the request could not be sent and has to go through botocore.
+
+        Raises:
+            S3ClientException: If S3 answers with an error.
+
+        """
+        if self._http is None or self._presigner is None:
+            return None
+        import aiohttp  # noqa: PLC0415
+
+        http, presigner = self._http, self._presigner
+        params = {"legal-hold": ""}
+        if version_id:
+            params["versionId"] = version_id
+        body = f'<LegalHold xmlns="http://s3.amazonaws.com/doc/2006-03-01/"><Status>{status}</Status></LegalHold>'
+        headers = {"Content-MD5": base64.b64encode(hashlib.md5(body.encode(), usedforsecurity=False).digest()).decode()}
+
+        async def send() -> S3PutObjectLegalHoldResponse:
+            # Signed per attempt, so rate limiter back-off does not outlive the URL.
+            url = presigner.presign("PUT", bucket, key, _NATIVE_URL_EXPIRES_IN, params)
+            async with self._write_semaphore, http.put(url, data=body, headers=headers) as response:
+                if response.status != 200:  # noqa: PLR2004
+                    raise _native_client_error(response.status, await response.text(), "PutObjectLegalHold")
+                return S3PutObjectLegalHoldResponse(request_charged=response.headers.get("x-amz-request-charged"))
+
+        try:
+            if self._rate_limiter is None:
+                return await send()
+            return await self._rate_limiter.call(send)
+        except (aiohttp.ClientError, TimeoutError):
+            return None
+        except ClientError as e:
+            self._handle_client_error(e)
+
+    def _handle_client_error(self, error: ClientError) -> NoReturn:
         """Map boto3 ClientError to custom S3 exceptions.
 
         Args:
@@ -178,35 +861,16 @@ class Aioboto3S3Client:
             S3ServiceClientException: For other S3 service errors.
 
         """
-        error_code = error.response.get("Error", {}).get("Code", "")
-        error_message = error.response.get("Error", {}).get("Message", str(error))
-
-        exception_map: dict[str, type[Exception]] = {
-            "BucketAlreadyExists": S3BucketAlreadyExistsClientException,
-            "BucketAlreadyOwnedByYou": S3BucketAlreadyOwnedByYouClientException,
-            "NoSuchBucket": S3NoSuchBucketClientException,
-            "NoSuchKey": S3NoSuchKeyClientException,
-            "AccessDenied": S3AccessDeniedClientException,
-            "BucketNotEmpty": S3BucketNotEmptyClientException,
-            "NoSuchLifecycleConfiguration": S3NoSuchLifecycleConfigurationClientException,
-            "NoSuchCORSConfiguration": S3NoSuchCORSConfigurationClientException,
-            "NoSuchBucketPolicy": S3NoSuchPolicyClientException,
-            "InvalidBucketName": S3InvalidBucketNameClientException,
-            "ObjectNotInActiveTierError": S3ObjectNotInActiveTierClientException,
-            "InvalidObjectState": S3InvalidObjectStateClientException,
-            "PreconditionFailed": S3PreconditionFailedClientException,
-            "InvalidSecurity": S3InvalidSecurityClientException,
-            "InvalidToken": S3InvalidTokenClientException,
-            "RequestTimeout": S3RequestTimeoutClientException,
-            "InvalidRequest": S3InvalidRequestClientException,
-            "NotImplemented": S3InvalidRequestClientException,  # MinIO may return this for unsupported features
-            "InvalidBucketState": S3InvalidRequestClientException,  # MinIO may return this for object lock
-        }
+        try:
+            error_details = error.response["Error"]
+            error_code = error_details.get("Code", "")
+            error_message = error_details.get("Message", str(error))
+        except (KeyError, TypeError, AttributeError):
+            error_code, error_message = "", str(error)
 
-        exception_class = exception_map.get(error_code, S3ServiceClientException)
-        raise exception_class(error_message) from error
+        raise _ERROR_CODE_EXCEPTIONS.get(error_code, S3ServiceClientException)(error_message) from error
 
-    async def copy_object(
+    async def copy_object(  # noqa: PLR0915
         self,
         bucket: str,
         copy_source: str,
@@ -251,54 +915,90 @@ class Aioboto3S3Client:
         expected_source_bucket_owner: str | None = None,
     ) -> S3CopyObjectResponse:
         """Copy an object from one bucket to another."""
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            CopySource=copy_source,
-            Key=key,
-            ACL=acl,
-            CacheControl=cache_control,
-            ChecksumAlgorithm=checksum_algorithm,
-            ContentDisposition=content_disposition,
-            ContentEncoding=content_encoding,
-            ContentLanguage=content_language,
-            ContentType=content_type,
-            CopySourceIfMatch=copy_source_if_match,
-            CopySourceIfModifiedSince=copy_source_if_modified_since,
-            CopySourceIfNoneMatch=copy_source_if_none_match,
-            CopySourceIfUnmodifiedSince=copy_source_if_unmodified_since,
-            Expires=expires,
-            GrantFullControl=grant_full_control,
-            GrantRead=grant_read,
-            GrantReadACP=grant_read_acp,
-            GrantWriteACP=grant_write_acp,
-            IfMatch=if_match,
-            IfNoneMatch=if_none_match,
-            Metadata=metadata,
-            MetadataDirective=metadata_directive,
-            TaggingDirective=tagging_directive,
-            ServerSideEncryption=server_side_encryption,
-            StorageClass=storage_class,
-            WebsiteRedirectLocation=website_redirect_location,
-            SSECustomerAlgorithm=sse_customer_algorithm,
-            SSECustomerKey=sse_customer_key,
-            SSEKMSKeyId=sse_kms_key_id,
-            SSEKMSEncryptionContext=sse_kms_encryption_context,
-            BucketKeyEnabled=bucket_key_enabled,
-            CopySourceSSECustomerAlgorithm=copy_source_sse_customer_algorithm,
-            CopySourceSSECustomerKey=copy_source_sse_customer_key,
-            RequestPayer=request_payer,
-            Tagging=tagging,
-            ObjectLockMode=object_lock_mode,
-            ObjectLockRetainUntilDate=object_lock_retain_until_date,
-            ObjectLockLegalHoldStatus=object_lock_legal_hold_status,
-            ExpectedBucketOwner=expected_bucket_owner,
-            ExpectedSourceBucketOwner=expected_source_bucket_owner,
-        )
+        # Most of the parameters are None, so only the set ones are added instead of filtering a full dict.
+        kwargs: dict[str, Any] = {"Bucket": bucket, "CopySource": copy_source, "Key": key}
+        if acl is not None:
+            kwargs["ACL"] = acl
+        if cache_control is not None:
+            kwargs["CacheControl"] = cache_control
+        if checksum_algorithm is not None:
+            kwargs["ChecksumAlgorithm"] = checksum_algorithm
+        if content_disposition is not None:
+            kwargs["ContentDisposition"] = content_disposition
+        if content_encoding is not None:
+            kwargs["ContentEncoding"] = content_encoding
+        if content_language is not None:
+            kwargs["ContentLanguage"] = content_language
+        if content_type is not None:
+            kwargs["ContentType"] = content_type
+        if copy_source_if_match is not None:
+            kwargs["CopySourceIfMatch"] = copy_source_if_match
+        if copy_source_if_modified_since is not None:
+            kwargs["CopySourceIfModifiedSince"] = copy_source_if_modified_since
+        if copy_source_if_none_match is not None:
+            kwargs["CopySourceIfNoneMatch"] = copy_source_if_none_match
+        if copy_source_if_unmodified_since is not None:
+            kwargs["CopySourceIfUnmodifiedSince"] = copy_source_if_unmodified_since
+        if expires is not None:
+            kwargs["Expires"] = expires
+        if grant_full_control is not None:
+            kwargs["GrantFullControl"] = grant_full_control
+        if grant_read is not None:
+            kwargs["GrantRead"] = grant_read
+        if grant_read_acp is not None:
+            kwargs["GrantReadACP"] = grant_read_acp
+        if grant_write_acp is not None:
+            kwargs["GrantWriteACP"] = grant_write_acp
+        if if_match is not None:
+            kwargs["IfMatch"] = if_match
+        if if_none_match is not None:
+            kwargs["IfNoneMatch"] = if_none_match
+        if metadata is not None:
+            kwargs["Metadata"] = metadata
+        if metadata_directive is not None:
+            kwargs["MetadataDirective"] = metadata_directive
+        if tagging_directive is not None:
+            kwargs["TaggingDirective"] = tagging_directive
+        if server_side_encryption is not None:
+            kwargs["ServerSideEncryption"] = server_side_encryption
+        if storage_class is not None:
+            kwargs["StorageClass"] = storage_class
+        if website_redirect_location is not None:
+            kwargs["WebsiteRedirectLocation"] = website_redirect_location
+        if sse_customer_algorithm is not None:
+            kwargs["SSECustomerAlgorithm"] = sse_customer_algorithm
+        if sse_customer_key is not None:
+            kwargs["SSECustomerKey"] = sse_customer_key
+        if sse_kms_key_id is not None:
+            kwargs["SSEKMSKeyId"] = sse_kms_key_id
+        if sse_kms_encryption_context is not None:
+            kwargs["SSEKMSEncryptionContext"] = sse_kms_encryption_context
+        if bucket_key_enabled is not None:
+            kwargs["BucketKeyEnabled"] = bucket_key_enabled
+        if copy_source_sse_customer_algorithm is not None:
+            kwargs["CopySourceSSECustomerAlgorithm"] = copy_source_sse_customer_algorithm
+        if copy_source_sse_customer_key is not None:
+            kwargs["CopySourceSSECustomerKey"] = copy_source_sse_customer_key
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if tagging is not None:
+            kwargs["Tagging"] = tagging
+        if object_lock_mode is not None:
+            kwargs["ObjectLockMode"] = object_lock_mode
+        if object_lock_retain_until_date is not None:
+            kwargs["ObjectLockRetainUntilDate"] = object_lock_retain_until_date
+        if object_lock_legal_hold_status is not None:
+            kwargs["ObjectLockLegalHoldStatus"] = object_lock_legal_hold_status
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
+        if expected_source_bucket_owner is not None:
+            kwargs["ExpectedSourceBucketOwner"] = expected_source_bucket_owner
         try:
-            response = await self._client.copy_object(**kwargs)
+            response = await self._call_write("copy_object", **kwargs)
+            # botocore output is already typed and trusted, so models are built without validation.
             copy_object_result = None
             if copy_result := response.get("CopyObjectResult"):
-                copy_object_result = S3CopyObjectResult(
+                copy_object_result = S3CopyObjectResult.model_construct(
                     etag=copy_result.get("ETag"),
                     last_modified=copy_result.get("LastModified"),
                     checksum_crc32=copy_result.get("ChecksumCRC32"),
@@ -306,7 +1006,7 @@ class Aioboto3S3Client:
                     checksum_sha1=copy_result.get("ChecksumSHA1"),
                     checksum_sha256=copy_result.get("ChecksumSHA256"),
                 )
-            return S3CopyObjectResponse(
+            return S3CopyObjectResponse.model_construct(
                 copy_object_result=copy_object_result,
                 copy_source_version_id=response.get("CopySourceVersionId"),
                 expiration=response.get("Expiration"),
@@ -321,7 +1021,72 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
+
+    async def create_batch_job(
+        self,
+        operation: S3BatchJobOperation,
+        manifest: S3BatchJobManifest,
+        role_arn: str,
+        account_id: str | None = None,
+        report: S3BatchJobReport | None = None,
+        priority: int = 10,
+        confirmation_required: bool = False,
+        client_request_token: str | None = None,
+        description: str | None = None,
+    ) -> S3CreateBatchJobResponse:
+        """Create an S3 Batch Operations job."""
+        account_id = account_id or self._aws_account_id
+        if not account_id:
+            raise S3InvalidRequestClientException("An AWS account ID is required to create a batch job.")
+
+        job_operation: dict[str, Any] = {}
+        if operation.put_object_acl:
+            job_operation["S3PutObjectAcl"] = {
+                "AccessControlPolicy": {"CannedAccessControlList": operation.put_object_acl.acl}
+            }
+        if operation.put_object_legal_hold:
+            job_operation["S3PutObjectLegalHold"] = {"LegalHold": {"Status": operation.put_object_legal_hold.status}}
+        if operation.put_object_retention:
+            job_operation["S3PutObjectRetention"] = {
+                "Retention": self._build_kwargs(
+                    Mode=operation.put_object_retention.mode,
+                    RetainUntilDate=operation.put_object_retention.retain_until_date,
+                )
+            }
+        if len(job_operation) != 1:
+            raise S3InvalidRequestClientException("Exactly one batch job operation must be set.")
+
+        job_report: dict[str, Any] = {"Enabled": False}
+        if report and report.enabled:
+            job_report = self._build_kwargs(
+                Enabled=True,
+                Bucket=f"arn:aws:s3:::{report.bucket}",
+                Prefix=report.prefix,
+                Format="Report_CSV_20180820",
+                ReportScope=report.report_scope or "AllTasks",
+            )
+
+        kwargs = self._build_kwargs(
+            AccountId=account_id,
+            ConfirmationRequired=confirmation_required,
+            Operation=job_operation,
+            Report=job_report,
+            ClientRequestToken=client_request_token or str(uuid.uuid4()),
+            Manifest={
+                "Spec": {"Format": "S3BatchOperations_CSV_20180820", "Fields": list(manifest.fields)},
+                "Location": {"ObjectArn": f"arn:aws:s3:::{manifest.bucket}/{manifest.key}", "ETag": manifest.etag},
+            },
+            Description=description,
+            Priority=priority,
+            RoleArn=role_arn,
+        )
+
+        try:
+            s3control = await self._get_s3control_client()
+            response = await s3control.create_job(**kwargs)
+            return S3CreateBatchJobResponse(job_id=response.get("JobId"))
+        except ClientError as e:
+            self._handle_client_error(e)
 
     async def create_bucket(
         self,
@@ -342,22 +1107,15 @@ class Aioboto3S3Client:
             kwargs["ACL"] = acl
         if create_bucket_configuration:
             config: dict[str, Any] = {}
-            if (
-                hasattr(create_bucket_configuration, "location_constraint")
-                and create_bucket_configuration.location_constraint
-            ):
+            if create_bucket_configuration.location_constraint:
                 config["LocationConstraint"] = create_bucket_configuration.location_constraint
-            if hasattr(create_bucket_configuration, "location") and create_bucket_configuration.location:
-                config["Location"] = {
-                    "Type": create_bucket_configuration.location.type,
-                    "Name": create_bucket_configuration.location.name,
-                }
-            if hasattr(create_bucket_configuration, "bucket") and create_bucket_configuration.bucket:
-                config["Bucket"] = {
-                    "DataRedundancy": create_bucket_configuration.bucket.data_redundancy,
-                    "Type": create_bucket_configuration.bucket.type,
-                }
-            if hasattr(create_bucket_configuration, "tags") and create_bucket_configuration.tags:
+            location = create_bucket_configuration.location
+            if location:
+                config["Location"] = {"Type": location.type, "Name": location.name}
+            bucket_info = create_bucket_configuration.bucket
+            if bucket_info:
+                config["Bucket"] = {"DataRedundancy": bucket_info.data_redundancy, "Type": bucket_info.type}
+            if create_bucket_configuration.tags:
                 config["TagSet"] = [{"Key": tag.key, "Value": tag.value} for tag in create_bucket_configuration.tags]
             if config:
                 kwargs["CreateBucketConfiguration"] = config
@@ -384,7 +1142,6 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def delete_bucket(
         self,
@@ -395,12 +1152,12 @@ class Aioboto3S3Client:
         kwargs = self._build_kwargs(Bucket=bucket, ExpectedBucketOwner=expected_bucket_owner)
         try:
             response = await self._client.delete_bucket(**kwargs)
+            self._forget_no_lifecycle_bucket(bucket)
             return S3DeleteBucketResponse(
                 request_charged=response.get("RequestCharged"),
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def delete_bucket_cors(
         self, bucket: str, expected_bucket_owner: str | None = None
@@ -414,7 +1171,6 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def delete_bucket_lifecycle(
         self, bucket: str, expected_bucket_owner: str | None = None
@@ -423,12 +1179,12 @@ class Aioboto3S3Client:
         kwargs = self._build_kwargs(Bucket=bucket, ExpectedBucketOwner=expected_bucket_owner)
         try:
             response = await self._client.delete_bucket_lifecycle(**kwargs)
+            self._no_lifecycle_buckets[bucket, expected_bucket_owner] = time.monotonic() + _NO_LIFECYCLE_TTL
             return S3DeleteBucketLifecycleResponse(
                 request_charged=response.get("RequestCharged"),
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def delete_bucket_policy(
         self, bucket: str, expected_bucket_owner: str | None = None
@@ -442,7 +1198,6 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def delete_object(
         self,
@@ -458,20 +1213,25 @@ class Aioboto3S3Client:
         if_match_size: int | None = None,
     ) -> S3DeleteObjectResponse:
         """Delete an object from a bucket."""
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            Key=key,
-            MFA=mfa,
-            VersionId=version_id,
-            RequestPayer=request_payer,
-            BypassGovernanceRetention=bypass_governance_retention,
-            ExpectedBucketOwner=expected_bucket_owner,
-            IfMatch=if_match,
-            IfMatchLastModifiedTime=if_match_last_modified_time,
-            IfMatchSize=if_match_size,
-        )
+        kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
+        if mfa is not None:
+            kwargs["MFA"] = mfa
+        if version_id is not None:
+            kwargs["VersionId"] = version_id
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if bypass_governance_retention is not None:
+            kwargs["BypassGovernanceRetention"] = bypass_governance_retention
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
+        if if_match is not None:
+            kwargs["IfMatch"] = if_match
+        if if_match_last_modified_time is not None:
+            kwargs["IfMatchLastModifiedTime"] = if_match_last_modified_time
+        if if_match_size is not None:
+            kwargs["IfMatchSize"] = if_match_size
         try:
-            response = await self._client.delete_object(**kwargs)
+            response = await self._call_write("delete_object", **kwargs)
             return S3DeleteObjectResponse(
                 delete_marker=response.get("DeleteMarker"),
                 version_id=response.get("VersionId"),
@@ -479,7 +1239,6 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def delete_objects(
         self,
@@ -491,59 +1250,72 @@ class Aioboto3S3Client:
         expected_bucket_owner: str | None = None,
         checksum_algorithm: str | None = None,
     ) -> S3DeleteObjectsResponse:
-        """Delete objects from a bucket."""
-        delete_dict: dict[str, Any] = {
-            "Objects": [
-                {
-                    "Key": obj.key,
-                    **({"VersionId": obj.version_id} if obj.version_id else {}),
-                }
-                for obj in delete.objects
-            ]
-        }
-        if hasattr(delete, "quiet") and delete.quiet is not None:
-            delete_dict["Quiet"] = delete.quiet
+        """Delete objects from a bucket.
+
+        Requests with more than 1000 objects (the S3 limit per call) are split into
+        chunks that are deleted concurrently, and their results are merged. The objects
+        of a chunk whose request fails are reported as errors with the chunk's error, so
+        the objects of the other chunks are still reported as deleted. The error is
+        raised only if the requests of all the chunks fail.
+        """
+        objects = [
+            {"Key": obj.key, "VersionId": obj.version_id} if obj.version_id else {"Key": obj.key}
+            for obj in delete.objects
+        ]
+
+        kwargs: dict[str, Any] = {"Bucket": bucket}
+        if mfa is not None:
+            kwargs["MFA"] = mfa
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if bypass_governance_retention is not None:
+            kwargs["BypassGovernanceRetention"] = bypass_governance_retention
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
+        if checksum_algorithm is not None:
+            kwargs["ChecksumAlgorithm"] = checksum_algorithm
+
+        async def delete_chunk(chunk: list[dict[str, str]]) -> dict[str, Any]:
+            delete_dict: dict[str, Any] = {"Objects": chunk}
+            if delete.quiet is not None:
+                delete_dict["Quiet"] = delete.quiet
+            return await self._call_write("delete_objects", Delete=delete_dict, **kwargs)
 
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            Delete=delete_dict,
-            MFA=mfa,
-            RequestPayer=request_payer,
-            BypassGovernanceRetention=bypass_governance_retention,
-            ExpectedBucketOwner=expected_bucket_owner,
-            ChecksumAlgorithm=checksum_algorithm,
-        )
         try:
-            response = await self._client.delete_objects(**kwargs)
+            if len(objects) <= _DELETE_OBJECTS_MAX_KEYS:
+                response = await delete_chunk(objects)
+            else:
+                chunks = [
+                    objects[i : i + _DELETE_OBJECTS_MAX_KEYS] for i in range(0, len(objects), _DELETE_OBJECTS_MAX_KEYS)
+                ]
+                results = await asyncio.gather(*(delete_chunk(chunk) for chunk in chunks), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException) and not isinstance(result, ClientError):
+                        raise result
+                responses = [result for result in results if not isinstance(result, BaseException)]
+                if not responses:
+                    raise next(result for result in results if isinstance(result, ClientError))
+                response = {
+                    "Deleted": [item for chunk_response in responses for item in chunk_response.get("Deleted", [])],
+                    "Errors": [item for chunk_response in responses for item in chunk_response.get("Errors", [])]
+                    + [
+                        obj | _client_error_details(result)
+                        for chunk, result in zip(chunks, results, strict=True)
+                        if isinstance(result, ClientError)
+                        for obj in chunk
+                    ],
+                    "RequestCharged": next(
+                        (charged for chunk_response in responses if (charged := chunk_response.get("RequestCharged"))),
+                        None,
+                    ),
+                }
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
-
-        # Build response according to S3DeleteObjectsResponse protocol
-        deleted_items = [
-            S3DeleteObjectsResponseDeletedItem(
-                key=item["Key"],
-                version_id=item.get("VersionId", ""),
-                delete_marker=item.get("DeleteMarker", False),
-                delete_marker_version_id=item.get("DeleteMarkerVersionId", ""),
-            )
-            for item in response.get("Deleted", [])
-        ]
-        error_items = [
-            S3DeleteObjectsResponseErrorItem(
-                key=item["Key"],
-                version_id=item.get("VersionId", ""),
-                code=item["Code"],
-                message=item["Message"],
-            )
-            for item in response.get("Errors", [])
-        ]
 
-        return S3DeleteObjectsResponse(
-            deleted=deleted_items,
-            error=error_items,
-            request_charged=response.get("RequestCharged"),
-        )
+        if len(response.get("Deleted", ())) + len(response.get("Errors", ())) > _THREADED_DELETE_PARSE_THRESHOLD:
+            # Parsing thousands of items would block the event loop.
+            return await asyncio.to_thread(_parse_delete_objects_response, response)
+        return _parse_delete_objects_response(response)
 
     async def get_bucket_acl(
         self,
@@ -554,36 +1326,15 @@ class Aioboto3S3Client:
         kwargs = self._build_kwargs(Bucket=bucket, ExpectedBucketOwner=expected_bucket_owner)
         try:
             response = await self._client.get_bucket_acl(**kwargs)
-            grants = None
-            if grants_data := response.get("Grants"):
-                grants = [
-                    S3Grant(
-                        grantee=S3Grantee(
-                            display_name=grant.get("Grantee", {}).get("DisplayName"),
-                            email_address=grant.get("Grantee", {}).get("EmailAddress"),
-                            id=grant.get("Grantee", {}).get("ID"),
-                            type=grant.get("Grantee", {}).get("Type"),
-                            uri=grant.get("Grantee", {}).get("URI"),
-                        )
-                        if grant.get("Grantee")
-                        else None,
-                        permission=grant.get("Permission"),
-                    )
-                    for grant in grants_data
-                ]
-            owner = None
-            if owner_data := response.get("Owner"):
-                owner = S3Owner(
-                    display_name=owner_data.get("DisplayName"),
-                    id=owner_data.get("ID"),
-                )
-            return S3GetBucketAclResponse(
-                grants=grants,
-                owner=owner,
+            # Grants and the owner are validated from the boto3 entries by their aliases.
+            return S3GetBucketAclResponse.model_validate(
+                {
+                    "grants": response.get("Grants") or None,
+                    "owner": response.get("Owner") or None,
+                }
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def get_bucket_cors(
         self,
@@ -594,25 +1345,10 @@ class Aioboto3S3Client:
         kwargs = self._build_kwargs(Bucket=bucket, ExpectedBucketOwner=expected_bucket_owner)
         try:
             response = await self._client.get_bucket_cors(**kwargs)
-            cors_rules = None
-            if cors_rules_data := response.get("CORSRules"):
-                cors_rules = [
-                    S3CORSRule(
-                        allowed_headers=rule.get("AllowedHeaders"),
-                        allowed_methods=rule.get("AllowedMethods", []),
-                        allowed_origins=rule.get("AllowedOrigins", []),
-                        expose_headers=rule.get("ExposeHeaders"),
-                        id=rule.get("ID"),
-                        max_age_seconds=rule.get("MaxAgeSeconds"),
-                    )
-                    for rule in cors_rules_data
-                ]
-            return S3GetBucketCorsResponse(
-                cors_rules=cors_rules,
-            )
+            # Rules are validated from the boto3 entries by their aliases.
+            return S3GetBucketCorsResponse.model_validate({"cors_rules": response.get("CORSRules") or None})
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def get_bucket_lifecycle_configuration(
         self,
@@ -620,69 +1356,20 @@ class Aioboto3S3Client:
         expected_bucket_owner: str | None = None,
     ) -> S3GetBucketLifecycleConfigurationResponse:
         """Get the lifecycle configuration for a bucket."""
+        expires_at = self._no_lifecycle_buckets.get((bucket, expected_bucket_owner))
+        if expires_at is not None:
+            if time.monotonic() < expires_at:
+                return S3GetBucketLifecycleConfigurationResponse.model_construct(rules=[])
+            del self._no_lifecycle_buckets[bucket, expected_bucket_owner]
         kwargs = self._build_kwargs(Bucket=bucket, ExpectedBucketOwner=expected_bucket_owner)
         try:
             response = await self._client.get_bucket_lifecycle_configuration(**kwargs)
-            rules = None
-            if rules_data := response.get("Rules"):
-                rules = [
-                    S3LifecycleRule(
-                        id=rule.get("Id", ""),
-                        status=rule.get("Status", "Enabled"),
-                        abort_incomplete_multipart_upload=rule.get("AbortIncompleteMultipartUpload"),
-                        expiration=S3LifecycleExpiration(
-                            date=rule.get("Expiration", {}).get("Date"),
-                            days=rule.get("Expiration", {}).get("Days"),
-                            expired_object_delete_marker=rule.get("Expiration", {}).get("ExpiredObjectDeleteMarker"),
-                        )
-                        if rule.get("Expiration")
-                        else None,
-                        filter=S3LifecycleRuleFilter(
-                            and_=rule.get("Filter", {}).get("And"),
-                            prefix=rule.get("Filter", {}).get("Prefix"),
-                            tag=rule.get("Filter", {}).get("Tag"),
-                            object_size_greater_than=rule.get("Filter", {}).get("ObjectSizeGreaterThan"),
-                            object_size_less_than=rule.get("Filter", {}).get("ObjectSizeLessThan"),
-                        )
-                        if rule.get("Filter")
-                        else None,
-                        noncurrent_version_expiration=S3NoncurrentVersionExpiration(
-                            noncurrent_days=rule.get("NoncurrentVersionExpiration", {}).get("NoncurrentDays"),
-                            newer_noncurrent_versions=rule.get("NoncurrentVersionExpiration", {}).get(
-                                "NewerNoncurrentVersions"
-                            ),
-                        )
-                        if rule.get("NoncurrentVersionExpiration")
-                        else None,
-                        noncurrent_version_transitions=[
-                            S3NoncurrentVersionTransition(
-                                noncurrent_days=trans.get("NoncurrentDays"),
-                                storage_class=trans.get("StorageClass"),
-                                newer_noncurrent_versions=trans.get("NewerNoncurrentVersions"),
-                            )
-                            for trans in rule.get("NoncurrentVersionTransitions", [])
-                        ]
-                        if rule.get("NoncurrentVersionTransitions")
-                        else None,
-                        transitions=[
-                            S3LifecycleTransition(
-                                date=trans.get("Date"),
-                                days=trans.get("Days"),
-                                storage_class=trans.get("StorageClass"),
-                            )
-                            for trans in rule.get("Transitions", [])
-                        ]
-                        if rule.get("Transitions")
-                        else None,
-                    )
-                    for rule in rules_data
-                ]
-            return S3GetBucketLifecycleConfigurationResponse(rules=rules)
+            return S3GetBucketLifecycleConfigurationResponse.model_validate({"rules": response.get("Rules") or None})
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchLifecycleConfiguration":
-                return S3GetBucketLifecycleConfigurationResponse(rules=[])
+                self._no_lifecycle_buckets[bucket, expected_bucket_owner] = time.monotonic() + _NO_LIFECYCLE_TTL
+                return S3GetBucketLifecycleConfigurationResponse.model_construct(rules=[])
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def get_bucket_policy(
         self,
@@ -690,7 +1377,9 @@ class Aioboto3S3Client:
         expected_bucket_owner: str | None = None,
     ) -> S3GetBucketPolicyResponse:
         """Get the policy for a bucket."""
-        kwargs = self._build_kwargs(Bucket=bucket, ExpectedBucketOwner=expected_bucket_owner)
+        kwargs: dict[str, Any] = {"Bucket": bucket}
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
         try:
             response = await self._client.get_bucket_policy(**kwargs)
             return S3GetBucketPolicyResponse(
@@ -699,7 +1388,82 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
+
+    async def get_bucket_policy_parsed(
+        self,
+        bucket: str,
+        expected_bucket_owner: str | None = None,
+    ) -> dict[str, Any]:
+        """Get the policy for a bucket as a parsed JSON document."""
+        kwargs: dict[str, Any] = {"Bucket": bucket}
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
+        try:
+            response = await self._client.get_bucket_policy(**kwargs)
+        except ClientError as e:
+            self._handle_client_error(e)
+        # pydantic-core parses JSON in Rust, a few times faster than the json module.
+        return from_json(response["Policy"])
+
+    def _get_object_kwargs(
+        self,
+        bucket: str,
+        key: str,
+        if_match: str | None = None,
+        if_modified_since: datetime | None = None,
+        if_none_match: str | None = None,
+        if_unmodified_since: datetime | None = None,
+        range_header: str | None = None,
+        response_cache_control: str | None = None,
+        response_content_disposition: str | None = None,
+        response_content_encoding: str | None = None,
+        response_content_language: str | None = None,
+        response_content_type: str | None = None,
+        response_expires: datetime | None = None,
+        version_id: str | None = None,
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        request_payer: str | None = None,
+        expected_bucket_owner: str | None = None,
+        checksum_mode: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the boto3 get_object kwargs, adding only the parameters that are set."""
+        kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
+        if if_match is not None:
+            kwargs["IfMatch"] = if_match
+        if if_modified_since is not None:
+            kwargs["IfModifiedSince"] = if_modified_since
+        if if_none_match is not None:
+            kwargs["IfNoneMatch"] = if_none_match
+        if if_unmodified_since is not None:
+            kwargs["IfUnmodifiedSince"] = if_unmodified_since
+        if range_header is not None:
+            kwargs["Range"] = range_header
+        if response_cache_control is not None:
+            kwargs["ResponseCacheControl"] = response_cache_control
+        if response_content_disposition is not None:
+            kwargs["ResponseContentDisposition"] = response_content_disposition
+        if response_content_encoding is not None:
+            kwargs["ResponseContentEncoding"] = response_content_encoding
+        if response_content_language is not None:
+            kwargs["ResponseContentLanguage"] = response_content_language
+        if response_content_type is not None:
+            kwargs["ResponseContentType"] = response_content_type
+        if response_expires is not None:
+            kwargs["ResponseExpires"] = response_expires
+        if version_id is not None:
+            kwargs["VersionId"] = version_id
+        if sse_customer_algorithm is not None:
+            kwargs["SSECustomerAlgorithm"] = sse_customer_algorithm
+        if sse_customer_key is not None:
+            kwargs["SSECustomerKey"] = sse_customer_key
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
+        if checksum_mode is not None:
+            kwargs["ChecksumMode"] = checksum_mode
+        return kwargs
 
     async def get_object(
         self,
@@ -724,72 +1488,186 @@ class Aioboto3S3Client:
         checksum_mode: str | None = None,
     ) -> S3GetObjectResponse:
         """Get an object from a bucket."""
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            Key=key,
-            IfMatch=if_match,
-            IfModifiedSince=if_modified_since,
-            IfNoneMatch=if_none_match,
-            IfUnmodifiedSince=if_unmodified_since,
-            Range=range_header,
-            ResponseCacheControl=response_cache_control,
-            ResponseContentDisposition=response_content_disposition,
-            ResponseContentEncoding=response_content_encoding,
-            ResponseContentLanguage=response_content_language,
-            ResponseContentType=response_content_type,
-            ResponseExpires=response_expires,
-            VersionId=version_id,
-            SSECustomerAlgorithm=sse_customer_algorithm,
-            SSECustomerKey=sse_customer_key,
-            RequestPayer=request_payer,
-            ExpectedBucketOwner=expected_bucket_owner,
-            ChecksumMode=checksum_mode,
+        kwargs = self._get_object_kwargs(
+            bucket=bucket,
+            key=key,
+            if_match=if_match,
+            if_modified_since=if_modified_since,
+            if_none_match=if_none_match,
+            if_unmodified_since=if_unmodified_since,
+            range_header=range_header,
+            response_cache_control=response_cache_control,
+            response_content_disposition=response_content_disposition,
+            response_content_encoding=response_content_encoding,
+            response_content_language=response_content_language,
+            response_content_type=response_content_type,
+            response_expires=response_expires,
+            version_id=version_id,
+            sse_customer_algorithm=sse_customer_algorithm,
+            sse_customer_key=sse_customer_key,
+            request_payer=request_payer,
+            expected_bucket_owner=expected_bucket_owner,
+            checksum_mode=checksum_mode,
         )
         try:
-            response = await self._client.get_object(**kwargs)
-            body = await response["Body"].read()
+            async with self._read_semaphore:
+                response = await self._client.get_object(**kwargs)
+                body = await response["Body"].read()
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
-
-        return S3GetObjectResponse(
-            body=body,
-            delete_marker=response.get("DeleteMarker"),
-            accept_ranges=response.get("AcceptRanges"),
-            expiration=response.get("Expiration"),
-            restore=response.get("Restore"),
-            last_modified=response.get("LastModified"),
-            content_length=response.get("ContentLength"),
-            etag=response.get("ETag"),
-            checksum_crc32=response.get("ChecksumCRC32"),
-            checksum_crc32c=response.get("ChecksumCRC32C"),
-            checksum_sha1=response.get("ChecksumSHA1"),
-            checksum_sha256=response.get("ChecksumSHA256"),
-            missing_meta=response.get("MissingMeta"),
-            version_id=response.get("VersionId"),
-            cache_control=response.get("CacheControl"),
-            content_disposition=response.get("ContentDisposition"),
-            content_encoding=response.get("ContentEncoding"),
-            content_language=response.get("ContentLanguage"),
-            content_range=response.get("ContentRange"),
-            content_type=response.get("ContentType"),
-            expires=response.get("Expires"),
-            website_redirect_location=response.get("WebsiteRedirectLocation"),
-            server_side_encryption=response.get("ServerSideEncryption"),
-            metadata=response.get("Metadata"),
-            sse_customer_algorithm=response.get("SSECustomerAlgorithm"),
-            sse_customer_key_md5=response.get("SSECustomerKeyMD5"),
-            sse_kms_key_id=response.get("SSEKMSKeyId"),
-            bucket_key_enabled=response.get("BucketKeyEnabled"),
-            storage_class=response.get("StorageClass"),
-            request_charged=response.get("RequestCharged"),
-            replication_status=response.get("ReplicationStatus"),
-            parts_count=response.get("PartsCount"),
-            tag_count=response.get("TagCount"),
-            object_lock_mode=response.get("ObjectLockMode"),
-            object_lock_retain_until_date=response.get("ObjectLockRetainUntilDate"),
-            object_lock_legal_hold_status=response.get("ObjectLockLegalHoldStatus"),
+
+        # The metadata is validated straight from the boto3 response by the model aliases.
+        return S3GetObjectResponse.model_validate(response | {"Body": body})
+
+    async def get_object_stream(
+        self,
+        bucket: str,
+        key: str,
+        if_match: str | None = None,
+        if_modified_since: datetime | None = None,
+        if_none_match: str | None = None,
+        if_unmodified_since: datetime | None = None,
+        range_header: str | None = None,
+        response_cache_control: str | None = None,
+        response_content_disposition: str | None = None,
+        response_content_encoding: str | None = None,
+        response_content_language: str | None = None,
+        response_content_type: str | None = None,
+        response_expires: datetime | None = None,
+        version_id: str | None = None,
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        request_payer: str | None = None,
+        expected_bucket_owner: str | None = None,
+        checksum_mode: str | None = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> S3GetObjectStreamResponse:
+        """Get an object from a bucket without buffering its body."""
+        kwargs = self._get_object_kwargs(
+            bucket=bucket,
+            key=key,
+            if_match=if_match,
+            if_modified_since=if_modified_since,
+            if_none_match=if_none_match,
+            if_unmodified_since=if_unmodified_since,
+            range_header=range_header,
+            response_cache_control=response_cache_control,
+            response_content_disposition=response_content_disposition,
+            response_content_encoding=response_content_encoding,
+            response_content_language=response_content_language,
+            response_content_type=response_content_type,
+            response_expires=response_expires,
+            version_id=version_id,
+            sse_customer_algorithm=sse_customer_algorithm,
+            sse_customer_key=sse_customer_key,
+            request_payer=request_payer,
+            expected_bucket_owner=expected_bucket_owner,
+            checksum_mode=checksum_mode,
         )
+        try:
+            async with self._read_semaphore:
+                response = await self._client.get_object(**kwargs)
+        except ClientError as e:
+            self._handle_client_error(e)
+
+        return S3GetObjectStreamResponse.model_validate(response | {"Body": _iter_body(response["Body"], chunk_size)})
+
+    async def get_object_ranged(
+        self,
+        bucket: str,
+        key: str,
+        part_size: int = _RANGED_GET_PART_SIZE,
+        max_concurrency: int = _RANGED_GET_MAX_CONCURRENCY,
+        version_id: str | None = None,
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        request_payer: str | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> S3GetObjectResponse:
+        """Get an object from a bucket with concurrent byte-range requests."""
+        kwargs = self._get_object_kwargs(
+            bucket,
+            key,
+            version_id=version_id,
+            sse_customer_algorithm=sse_customer_algorithm,
+            sse_customer_key=sse_customer_key,
+            request_payer=request_payer,
+            expected_bucket_owner=expected_bucket_owner,
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_part(start: int, end: int, **part_kwargs: Any) -> tuple[dict[str, Any], bytes]:
+            async with semaphore, self._read_semaphore:
+                response = await self._client.get_object(Range=f"bytes={start}-{end}", **kwargs, **part_kwargs)
+                return response, await response["Body"].read()
+
+        # The first part also tells the object size, so no separate HeadObject request is needed.
+        try:
+            response, first_part = await get_part(0, part_size - 1)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "InvalidRange":
+                # Empty objects cannot be requested by range.
+                return await self.get_object(
+                    bucket,
+                    key,
+                    version_id=version_id,
+                    sse_customer_algorithm=sse_customer_algorithm,
+                    sse_customer_key=sse_customer_key,
+                    request_payer=request_payer,
+                    expected_bucket_owner=expected_bucket_owner,
+                )
+            self._handle_client_error(e)
+
+        content_range = response.get("ContentRange")
+        size = int(content_range.rpartition("/")[2]) if content_range else len(first_part)
+        metadata = response | {"ContentLength": size, "ContentRange": None}
+        if size <= len(first_part):
+            return S3GetObjectResponse.model_validate(metadata | {"Body": first_part})
+
+        body = bytearray(size)
+        view = memoryview(body)
+        view[: len(first_part)] = first_part
+
+        async def download_part(start: int) -> None:
+            end = min(start + part_size, size) - 1
+            # Pin the remaining parts to the version of the first one.
+            _, part = await get_part(start, end, IfMatch=response["ETag"])
+            view[start : end + 1] = part
+
+        # A task group cancels and awaits the other parts when one fails, before the view is released.
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for start in range(len(first_part), size, part_size):
+                    task_group.create_task(download_part(start))
+        except ExceptionGroup as e:
+            error = e.exceptions[0]
+            if isinstance(error, ClientError):
+                self._handle_client_error(error)
+            raise error from None
+        finally:
+            view.release()
+
+        return S3GetObjectResponse.model_validate(metadata | {"Body": bytes(body)})
+
+    async def get_objects(
+        self,
+        bucket: str,
+        keys: Sequence[str],
+        concurrency: int = 32,
+    ) -> list[S3GetObjectResponse | S3ClientException]:
+        """Get many objects from a bucket concurrently.
+
+        Args:
+            bucket: The name of the bucket.
+            keys: The object keys.
+            concurrency: Maximum number of concurrent ``get_object`` calls.
+
+        Returns:
+            The responses, in the order of the keys. A key that could not be fetched (e.g. a
+            missing one) gets its S3 client exception instead, so it does not fail the others.
+
+        """
+        return await _gather_per_item((functools.partial(self.get_object, bucket, key) for key in keys), concurrency)
 
     async def get_object_acl(
         self,
@@ -800,46 +1678,25 @@ class Aioboto3S3Client:
         expected_bucket_owner: str | None = None,
     ) -> S3GetObjectAclResponse:
         """Get the ACL for an object."""
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            Key=key,
-            VersionId=version_id,
-            RequestPayer=request_payer,
-            ExpectedBucketOwner=expected_bucket_owner,
-        )
+        kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
+        if version_id is not None:
+            kwargs["VersionId"] = version_id
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
         try:
             response = await self._client.get_object_acl(**kwargs)
-            grants = None
-            if grants_data := response.get("Grants"):
-                grants = [
-                    S3Grant(
-                        grantee=S3Grantee(
-                            display_name=grant.get("Grantee", {}).get("DisplayName"),
-                            email_address=grant.get("Grantee", {}).get("EmailAddress"),
-                            id=grant.get("Grantee", {}).get("ID"),
-                            type=grant.get("Grantee", {}).get("Type"),
-                            uri=grant.get("Grantee", {}).get("URI"),
-                        )
-                        if grant.get("Grantee")
-                        else None,
-                        permission=grant.get("Permission"),
-                    )
-                    for grant in grants_data
-                ]
-            owner = None
-            if owner_data := response.get("Owner"):
-                owner = S3Owner(
-                    display_name=owner_data.get("DisplayName"),
-                    id=owner_data.get("ID"),
-                )
-            return S3GetObjectAclResponse(
-                grants=grants,
-                owner=owner,
-                request_charged=response.get("RequestCharged"),
+            # Grants and the owner are validated from the boto3 entries by their aliases.
+            return S3GetObjectAclResponse.model_validate(
+                {
+                    "grants": response.get("Grants") or None,
+                    "owner": response.get("Owner") or None,
+                    "request_charged": response.get("RequestCharged"),
+                }
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def list_buckets(
         self,
@@ -847,28 +1704,11 @@ class Aioboto3S3Client:
         """List all buckets owned by the authenticated sender of the request."""
         try:
             response = await self._client.list_buckets()
-            buckets = []
-            if buckets_data := response.get("Buckets"):
-                buckets = [
-                    S3Bucket(
-                        name=bucket.get("Name"),
-                        creation_date=bucket.get("CreationDate"),
-                    )
-                    for bucket in buckets_data
-                ]
-            owner = None
-            if owner_data := response.get("Owner"):
-                owner = S3Owner(
-                    display_name=owner_data.get("DisplayName"),
-                    id=owner_data.get("ID"),
-                )
-            return S3ListBucketsResponse(
-                buckets=buckets if buckets else None,
-                owner=owner,
+            return S3ListBucketsResponse.model_validate(
+                {"buckets": response.get("Buckets") or None, "owner": response.get("Owner") or None}
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def list_objects(
         self,
@@ -882,56 +1722,43 @@ class Aioboto3S3Client:
         expected_bucket_owner: str | None = None,
     ) -> S3ListObjectsResponse:
         """List some or all (up to 1,000) of the objects in a bucket."""
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            Delimiter=delimiter,
-            EncodingType=encoding_type,
-            Marker=marker,
-            MaxKeys=max_keys,
-            Prefix=prefix,
-            RequestPayer=request_payer,
-            ExpectedBucketOwner=expected_bucket_owner,
-        )
+        kwargs: dict[str, Any] = {"Bucket": bucket}
+        if delimiter is not None:
+            kwargs["Delimiter"] = delimiter
+        if encoding_type is not None:
+            kwargs["EncodingType"] = encoding_type
+        if marker is not None:
+            kwargs["Marker"] = marker
+        if max_keys is not None:
+            kwargs["MaxKeys"] = max_keys
+        if prefix is not None:
+            kwargs["Prefix"] = prefix
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
         try:
-            response = await self._client.list_objects(**kwargs)
-            contents = None
-            if contents_data := response.get("Contents"):
-                contents = [
-                    S3Object(
-                        key=obj.get("Key"),
-                        last_modified=obj.get("LastModified"),
-                        etag=obj.get("ETag"),
-                        checksum_algorithm=obj.get("ChecksumAlgorithm"),
-                        size=obj.get("Size"),
-                        storage_class=obj.get("StorageClass"),
-                        owner=S3Owner(
-                            display_name=obj.get("Owner", {}).get("DisplayName"),
-                            id=obj.get("Owner", {}).get("ID"),
-                        )
-                        if obj.get("Owner")
-                        else None,
-                    )
-                    for obj in contents_data
-                ]
-            common_prefixes = None
-            if common_prefixes_data := response.get("CommonPrefixes"):
-                common_prefixes = [S3CommonPrefix(prefix=prefix.get("Prefix")) for prefix in common_prefixes_data]
-            return S3ListObjectsResponse(
-                is_truncated=response.get("IsTruncated"),
-                marker=response.get("Marker"),
-                next_marker=response.get("NextMarker"),
-                contents=contents,
-                name=response.get("Name"),
-                prefix=response.get("Prefix"),
-                delimiter=response.get("Delimiter"),
-                max_keys=response.get("MaxKeys"),
-                common_prefixes=common_prefixes,
-                encoding_type=response.get("EncodingType"),
-                request_charged=response.get("RequestCharged"),
+            async with self._read_semaphore:
+                response = await self._client.list_objects(**kwargs)
+            # Listings hold up to 1,000 objects, so they are validated from the boto3 entries in a
+            # single call instead of building every object model from Python.
+            return S3ListObjectsResponse.model_validate(
+                {
+                    "is_truncated": response.get("IsTruncated"),
+                    "marker": response.get("Marker"),
+                    "next_marker": response.get("NextMarker"),
+                    "contents": response.get("Contents") or None,
+                    "name": response.get("Name"),
+                    "prefix": response.get("Prefix"),
+                    "delimiter": response.get("Delimiter"),
+                    "max_keys": response.get("MaxKeys"),
+                    "common_prefixes": response.get("CommonPrefixes") or None,
+                    "encoding_type": response.get("EncodingType"),
+                    "request_charged": response.get("RequestCharged"),
+                }
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def list_objects_v2(
         self,
@@ -947,60 +1774,198 @@ class Aioboto3S3Client:
         expected_bucket_owner: str | None = None,
     ) -> S3ListObjectsV2Response:
         """List some or all (up to 1,000) of the objects in a bucket using version 2 API."""
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            Delimiter=delimiter,
-            EncodingType=encoding_type,
-            MaxKeys=max_keys,
-            Prefix=prefix,
-            ContinuationToken=continuation_token,
-            FetchOwner=fetch_owner,
-            StartAfter=start_after,
-            RequestPayer=request_payer,
-            ExpectedBucketOwner=expected_bucket_owner,
-        )
+        kwargs: dict[str, Any] = {"Bucket": bucket}
+        if delimiter is not None:
+            kwargs["Delimiter"] = delimiter
+        if encoding_type is not None:
+            kwargs["EncodingType"] = encoding_type
+        if max_keys is not None:
+            kwargs["MaxKeys"] = max_keys
+        if prefix is not None:
+            kwargs["Prefix"] = prefix
+        if continuation_token is not None:
+            kwargs["ContinuationToken"] = continuation_token
+        if fetch_owner is not None:
+            kwargs["FetchOwner"] = fetch_owner
+        if start_after is not None:
+            kwargs["StartAfter"] = start_after
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
         try:
-            response = await self._client.list_objects_v2(**kwargs)
-            contents = None
-            if contents_data := response.get("Contents"):
-                contents = [
-                    S3Object(
-                        key=obj.get("Key"),
-                        last_modified=obj.get("LastModified"),
-                        etag=obj.get("ETag"),
-                        checksum_algorithm=obj.get("ChecksumAlgorithm"),
-                        size=obj.get("Size"),
-                        storage_class=obj.get("StorageClass"),
-                        owner=S3Owner(
-                            display_name=obj.get("Owner", {}).get("DisplayName"),
-                            id=obj.get("Owner", {}).get("ID"),
-                        )
-                        if obj.get("Owner")
-                        else None,
-                    )
-                    for obj in contents_data
-                ]
-            common_prefixes = None
-            if common_prefixes_data := response.get("CommonPrefixes"):
-                common_prefixes = [S3CommonPrefix(prefix=prefix.get("Prefix")) for prefix in common_prefixes_data]
-            return S3ListObjectsV2Response(
-                is_truncated=response.get("IsTruncated"),
-                contents=contents,
-                name=response.get("Name"),
-                prefix=response.get("Prefix"),
-                delimiter=response.get("Delimiter"),
-                max_keys=response.get("MaxKeys"),
-                common_prefixes=common_prefixes,
-                encoding_type=response.get("EncodingType"),
-                key_count=response.get("KeyCount"),
-                continuation_token=response.get("ContinuationToken"),
-                next_continuation_token=response.get("NextContinuationToken"),
-                start_after=response.get("StartAfter"),
-                request_charged=response.get("RequestCharged"),
+            async with self._read_semaphore:
+                response = await self._client.list_objects_v2(**kwargs)
+            return S3ListObjectsV2Response.model_validate(
+                {
+                    "is_truncated": response.get("IsTruncated"),
+                    "contents": response.get("Contents") or None,
+                    "name": response.get("Name"),
+                    "prefix": response.get("Prefix"),
+                    "delimiter": response.get("Delimiter"),
+                    "max_keys": response.get("MaxKeys"),
+                    "common_prefixes": response.get("CommonPrefixes") or None,
+                    "encoding_type": response.get("EncodingType"),
+                    "key_count": response.get("KeyCount"),
+                    "continuation_token": response.get("ContinuationToken"),
+                    "next_continuation_token": response.get("NextContinuationToken"),
+                    "start_after": response.get("StartAfter"),
+                    "request_charged": response.get("RequestCharged"),
+                }
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
+
+    async def list_objects_v2_matching(
+        self,
+        bucket: str,
+        pattern: str,
+        prefix: str | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> AsyncIterator[S3Object]:
+        """Iterate over all objects whose key matches a regular expression.
+
+        The literal prefix of the pattern is pushed down to S3 as the listing prefix, so only the
+        residual part of the pattern is matched client-side. For example, ``logs/2024-[0-9]+[.]gz``
+        only lists keys under ``logs/2024-``.
+
+        Args:
+            bucket: The name of the bucket.
+            pattern: The regular expression the keys must match, from the start of the key.
+            prefix: Limits the listing to keys that begin with the prefix, in addition to the pattern.
+            expected_bucket_owner: The account ID of the expected bucket owner.
+
+        Yields:
+            The matching objects.
+
+        """
+        pattern_prefix = _regex_literal_prefix(pattern)
+        if prefix is None or pattern_prefix.startswith(prefix):
+            prefix = pattern_prefix
+        elif not prefix.startswith(pattern_prefix):
+            return
+
+        match = re.compile(pattern).match
+        async for obj in self.iter_objects_v2(
+            bucket, prefix=prefix or None, expected_bucket_owner=expected_bucket_owner
+        ):
+            if obj.key is not None and match(obj.key):
+                yield obj
+
+    async def iter_objects_v2(
+        self,
+        bucket: str,
+        prefix: str | None = None,
+        start_after: str | None = None,
+        fetch_owner: bool | None = None,
+        request_payer: str | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> AsyncIterator[S3Object]:
+        """Iterate over all objects of a bucket, page by page.
+
+        Pages are fetched with the aiobotocore ``list_objects_v2`` paginator and objects are
+        yielded as soon as their page arrives, so consumers can stop early without paying for
+        the remaining pages.
+
+        Args:
+            bucket: The name of the bucket.
+            prefix: Limits the listing to keys that begin with the prefix.
+            start_after: The key to start listing after.
+            fetch_owner: Whether to return the owner of each object.
+            request_payer: Confirms that the requester knows that they will be charged for the request.
+            expected_bucket_owner: The account ID of the expected bucket owner.
+
+        Yields:
+            The objects, in listing order.
+
+        """
+        kwargs: dict[str, Any] = {"Bucket": bucket}
+        if prefix is not None:
+            kwargs["Prefix"] = prefix
+        if start_after is not None:
+            kwargs["StartAfter"] = start_after
+        if fetch_owner is not None:
+            kwargs["FetchOwner"] = fetch_owner
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
+
+        # Closed explicitly so that consumers stopping early do not leave the page generator pending.
+        paginator = self._client.get_paginator("list_objects_v2")
+        async with contextlib.aclosing(aiter(paginator.paginate(**kwargs))) as pages:
+            while True:
+                try:
+                    async with self._read_semaphore:
+                        page = await anext(pages, None)
+                except ClientError as e:
+                    self._handle_client_error(e)
+                if page is None:
+                    return
+                if contents := page.get("Contents"):
+                    for obj in S3ListObjectsV2Response.model_validate({"contents": contents}).contents or ():
+                        yield obj
+
+    async def list_objects_v2_projected(
+        self,
+        bucket: str,
+        projection: Sequence[str] = ("key",),
+        prefix: str | None = None,
+        start_after: str | None = None,
+        request_payer: str | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> AsyncIterator[tuple[Any, ...]]:
+        """Iterate over all objects of a bucket as tuples of the selected fields.
+
+        Fast path for large bucket scans that only need a few fields, such as keys and sizes:
+        rows are read straight from the boto3 entries, without building ``S3Object`` models.
+        Values are the raw boto3 values, so the owner is a dict with ``DisplayName`` and ``ID``.
+
+        Args:
+            bucket: The name of the bucket.
+            projection: The ``S3Object`` fields to return, in order.
+            prefix: Limits the listing to keys that begin with the prefix.
+            start_after: The key to start listing after.
+            request_payer: Confirms that the requester knows that they will be charged for the request.
+            expected_bucket_owner: The account ID of the expected bucket owner.
+
+        Yields:
+            The projected field values of each object.
+
+        Raises:
+            S3InvalidRequestClientException: If a projected field is not an ``S3Object`` field.
+
+        """
+        object_fields = S3Object.model_fields
+        unknown_fields = [field for field in projection if field not in object_fields]
+        if unknown_fields:
+            error_msg = f"Unknown object fields: {', '.join(unknown_fields)}."
+            raise S3InvalidRequestClientException(error_msg)
+        names = [object_fields[field].validation_alias for field in projection]
+
+        kwargs: dict[str, Any] = {"Bucket": bucket}
+        if prefix is not None:
+            kwargs["Prefix"] = prefix
+        if start_after is not None:
+            kwargs["StartAfter"] = start_after
+        if "owner" in projection:
+            kwargs["FetchOwner"] = True
+        if request_payer is not None:
+            kwargs["RequestPayer"] = request_payer
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
+
+        while True:
+            try:
+                async with self._read_semaphore:
+                    response = await self._client.list_objects_v2(**kwargs)
+            except ClientError as e:
+                self._handle_client_error(e)
+            for obj in response.get("Contents", ()):
+                yield tuple(obj.get(name) for name in names)
+            if not response.get("IsTruncated"):
+                return
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
 
     async def put_bucket_acl(
         self,
@@ -1020,14 +1985,12 @@ class Aioboto3S3Client:
         kwargs: dict[str, Any] = {"Bucket": bucket}
         if acl:
             kwargs["ACL"] = acl
-        if access_control_policy:
-            policy: dict[str, Any] = {}
-            if hasattr(access_control_policy, "grants") and access_control_policy.grants:
-                policy["Grants"] = access_control_policy.grants
-            if hasattr(access_control_policy, "owner") and access_control_policy.owner:
-                policy["Owner"] = access_control_policy.owner
-            if policy:
-                kwargs["AccessControlPolicy"] = policy
+        if (
+            access_control_policy
+            and access_control_policy.model_fields_set
+            and (policy := access_control_policy.model_dump(by_alias=True, exclude_none=True))
+        ):
+            kwargs["AccessControlPolicy"] = policy
         if content_md5:
             kwargs["ContentMD5"] = content_md5
         if checksum_algorithm:
@@ -1052,7 +2015,6 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def put_bucket_cors(
         self,
@@ -1063,19 +2025,19 @@ class Aioboto3S3Client:
         expected_bucket_owner: str | None = None,
     ) -> S3PutBucketCorsResponse:
         """Put the CORS configuration for a bucket."""
-        cors_dict: dict[str, Any] = {
-            "CORSRules": [
-                {
-                    "AllowedMethods": rule.allowed_methods,
-                    "AllowedOrigins": rule.allowed_origins,
-                    **({"AllowedHeaders": rule.allowed_headers} if rule.allowed_headers else {}),
-                    **({"ExposeHeaders": rule.expose_headers} if rule.expose_headers else {}),
-                    **({"Id": rule.id} if rule.id else {}),
-                    **({"MaxAgeSeconds": rule.max_age_seconds} if rule.max_age_seconds else {}),
-                }
-                for rule in cors_configuration.cors_rules
-            ]
-        }
+        cors_rules: list[dict[str, Any]] = []
+        for rule in cors_configuration.cors_rules:
+            cors_rule: dict[str, Any] = {"AllowedMethods": rule.allowed_methods, "AllowedOrigins": rule.allowed_origins}
+            if rule.allowed_headers:
+                cors_rule["AllowedHeaders"] = rule.allowed_headers
+            if rule.expose_headers:
+                cors_rule["ExposeHeaders"] = rule.expose_headers
+            if rule.id:
+                cors_rule["ID"] = rule.id
+            if rule.max_age_seconds:
+                cors_rule["MaxAgeSeconds"] = rule.max_age_seconds
+            cors_rules.append(cors_rule)
+        cors_dict: dict[str, Any] = {"CORSRules": cors_rules}
         kwargs: dict[str, Any] = {"Bucket": bucket, "CORSConfiguration": cors_dict}
         if content_md5:
             kwargs["ContentMD5"] = content_md5
@@ -1091,9 +2053,8 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
-    async def put_bucket_lifecycle_configuration(  # noqa: PLR0915
+    async def put_bucket_lifecycle_configuration(
         self,
         bucket: str,
         lifecycle_configuration: S3LifecycleConfiguration | None = None,
@@ -1103,80 +2064,9 @@ class Aioboto3S3Client:
         """Put the lifecycle configuration for a bucket."""
         kwargs: dict[str, Any] = {"Bucket": bucket}
         if lifecycle_configuration:
-            rules_list: list[dict[str, Any]] = []
-            for rule in lifecycle_configuration.rules:
-                rule_dict: dict[str, Any] = {
-                    "ID": rule.id,  # boto3 expects "ID" not "Id"
-                    "Status": rule.status,
-                }
-                if rule.abort_incomplete_multipart_upload:
-                    rule_dict["AbortIncompleteMultipartUpload"] = rule.abort_incomplete_multipart_upload
-                if rule.expiration:
-                    expiration_dict: dict[str, Any] = {}
-                    if rule.expiration.date:
-                        expiration_dict["Date"] = rule.expiration.date
-                    if rule.expiration.days is not None:
-                        expiration_dict["Days"] = rule.expiration.days
-                    if rule.expiration.expired_object_delete_marker is not None:
-                        expiration_dict["ExpiredObjectDeleteMarker"] = rule.expiration.expired_object_delete_marker
-                    if expiration_dict:
-                        rule_dict["Expiration"] = expiration_dict
-                if rule.filter:
-                    filter_dict: dict[str, Any] = {}
-                    if rule.filter.and_:
-                        filter_dict["And"] = rule.filter.and_
-                    if rule.filter.prefix is not None:
-                        filter_dict["Prefix"] = rule.filter.prefix
-                    if rule.filter.tag:
-                        filter_dict["Tag"] = rule.filter.tag
-                    if rule.filter.object_size_greater_than is not None:
-                        filter_dict["ObjectSizeGreaterThan"] = rule.filter.object_size_greater_than
-                    if rule.filter.object_size_less_than is not None:
-                        filter_dict["ObjectSizeLessThan"] = rule.filter.object_size_less_than
-                    # Only add Filter if it has at least one non-None field
-                    # Empty filter is invalid in S3
-                    if filter_dict:
-                        rule_dict["Filter"] = filter_dict
-                if rule.noncurrent_version_expiration:
-                    nve_dict: dict[str, Any] = {}
-                    if rule.noncurrent_version_expiration.noncurrent_days is not None:
-                        nve_dict["NoncurrentDays"] = rule.noncurrent_version_expiration.noncurrent_days
-                    if rule.noncurrent_version_expiration.newer_noncurrent_versions is not None:
-                        nve_dict["NewerNoncurrentVersions"] = (
-                            rule.noncurrent_version_expiration.newer_noncurrent_versions
-                        )
-                    if nve_dict:
-                        rule_dict["NoncurrentVersionExpiration"] = nve_dict
-                if rule.noncurrent_version_transitions:
-                    nvt_list: list[dict[str, Any]] = []
-                    for nvt in rule.noncurrent_version_transitions:
-                        nvt_dict: dict[str, Any] = {}
-                        if nvt.noncurrent_days is not None:
-                            nvt_dict["NoncurrentDays"] = nvt.noncurrent_days
-                        if nvt.storage_class:
-                            nvt_dict["StorageClass"] = nvt.storage_class
-                        if nvt.newer_noncurrent_versions is not None:
-                            nvt_dict["NewerNoncurrentVersions"] = nvt.newer_noncurrent_versions
-                        if nvt_dict:
-                            nvt_list.append(nvt_dict)
-                    if nvt_list:
-                        rule_dict["NoncurrentVersionTransitions"] = nvt_list
-                if rule.transitions:
-                    trans_list: list[dict[str, Any]] = []
-                    for trans in rule.transitions:
-                        trans_dict: dict[str, Any] = {}
-                        if trans.date:
-                            trans_dict["Date"] = trans.date
-                        if trans.days is not None:
-                            trans_dict["Days"] = trans.days
-                        if trans.storage_class:
-                            trans_dict["StorageClass"] = trans.storage_class
-                        if trans_dict:
-                            trans_list.append(trans_dict)
-                    if trans_list:
-                        rule_dict["Transitions"] = trans_list
-                rules_list.append(rule_dict)
-            kwargs["LifecycleConfiguration"] = {"Rules": rules_list}
+            kwargs["LifecycleConfiguration"] = _drop_empty(
+                lifecycle_configuration.model_dump(by_alias=True, exclude_none=True)
+            )
         if checksum_algorithm:
             kwargs["ChecksumAlgorithm"] = checksum_algorithm
         if expected_bucket_owner:
@@ -1184,31 +2074,34 @@ class Aioboto3S3Client:
 
         try:
             response = await self._client.put_bucket_lifecycle_configuration(**kwargs)
+            self._forget_no_lifecycle_bucket(bucket)
             return S3PutBucketLifecycleConfigurationResponse(
                 request_charged=response.get("RequestCharged"),
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def put_bucket_policy(
         self,
         bucket: str,
-        policy: str,
+        policy: str | dict[str, Any],
         content_md5: str | None = None,
         checksum_algorithm: str | None = None,
         confirm_remove_self_bucket_access: bool | None = None,
         expected_bucket_owner: str | None = None,
     ) -> S3PutBucketPolicyResponse:
         """Put the policy for a bucket."""
-        kwargs = self._build_kwargs(
-            Bucket=bucket,
-            Policy=policy,
-            ContentMD5=content_md5,
-            ChecksumAlgorithm=checksum_algorithm,
-            ConfirmRemoveSelfBucketAccess=confirm_remove_self_bucket_access,
-            ExpectedBucketOwner=expected_bucket_owner,
-        )
+        if not isinstance(policy, str):
+            policy = to_json(policy).decode()
+        kwargs: dict[str, Any] = {"Bucket": bucket, "Policy": policy}
+        if content_md5 is not None:
+            kwargs["ContentMD5"] = content_md5
+        if checksum_algorithm is not None:
+            kwargs["ChecksumAlgorithm"] = checksum_algorithm
+        if confirm_remove_self_bucket_access is not None:
+            kwargs["ConfirmRemoveSelfBucketAccess"] = confirm_remove_self_bucket_access
+        if expected_bucket_owner is not None:
+            kwargs["ExpectedBucketOwner"] = expected_bucket_owner
         try:
             response = await self._client.put_bucket_policy(**kwargs)
             return S3PutBucketPolicyResponse(
@@ -1216,13 +2109,12 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def put_object(  # noqa: PLR0915
         self,
         bucket: str,
         key: str,
-        body: bytes | str | None = None,
+        body: bytes | str | AsyncIterable[bytes] | os.PathLike[str] | None = None,
         acl: str | None = None,
         cache_control: str | None = None,
         content_disposition: str | None = None,
@@ -1257,14 +2149,21 @@ class Aioboto3S3Client:
         object_lock_legal_hold_status: str | None = None,
         expected_bucket_owner: str | None = None,
         metadata_directive: str | None = None,
+        multipart_threshold: int | None = _MULTIPART_THRESHOLD,
+        part_size: int = _MULTIPART_PART_SIZE,
+        max_concurrency: int = _MULTIPART_MAX_CONCURRENCY,
     ) -> S3PutObjectResponse:
         """Put an object into a bucket."""
         kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
-        if body is not None:
-            if isinstance(body, str):
-                kwargs["Body"] = body.encode("utf-8")
-            else:
-                kwargs["Body"] = body
+        chunks: AsyncIterable[bytes] | None = None
+        if isinstance(body, str):
+            kwargs["Body"] = body.encode("utf-8")
+        elif isinstance(body, bytes):
+            kwargs["Body"] = body
+        elif isinstance(body, os.PathLike):
+            chunks = _iter_file(body, part_size)
+        elif body is not None:
+            chunks = body
         if acl:
             kwargs["ACL"] = acl
         if cache_control:
@@ -1334,27 +2233,170 @@ class Aioboto3S3Client:
         if metadata_directive:
             kwargs["MetadataDirective"] = metadata_directive
 
+        single_request = (
+            multipart_threshold is None
+            # These describe the whole body and cannot be sent with parts.
+            or content_length is not None
+            or bool(content_md5 or checksum_crc32 or checksum_crc32c or checksum_sha1 or checksum_sha256)
+        )
+        parts: AsyncIterator[bytes | bytearray] | None = None
+        if chunks is not None:
+            if single_request:
+                kwargs["Body"] = b"".join([chunk async for chunk in chunks])
+            else:
+                # Streams of unknown size are uploaded in parts, unless they fit into a single one.
+                stream_parts = _iter_parts(chunks, part_size)
+                first_part = await anext(stream_parts, b"")
+                second_part = await anext(stream_parts, None)
+                if second_part is None:
+                    kwargs["Body"] = first_part
+                else:
+                    parts = _prepend_parts((first_part, second_part), stream_parts)
+        elif (
+            multipart_threshold is not None
+            and not single_request
+            and len(kwargs.get("Body", b"")) >= max(multipart_threshold, part_size + 1)
+        ):
+            # Parts cannot grow past the multipart upload part count limit.
+            part_size = max(part_size, -(-len(kwargs["Body"]) // _MULTIPART_MAX_PARTS))
+            parts = _split_body(kwargs.pop("Body"), part_size)
+
         try:
-            response = await self._client.put_object(**kwargs)
-            return S3PutObjectResponse(
-                etag=response.get("ETag"),
-                checksum_crc32=response.get("ChecksumCRC32"),
-                checksum_crc32c=response.get("ChecksumCRC32C"),
-                checksum_sha1=response.get("ChecksumSHA1"),
-                checksum_sha256=response.get("ChecksumSHA256"),
-                expiration=response.get("Expiration"),
-                request_charged=response.get("RequestCharged"),
-                sse_customer_algorithm=response.get("SSECustomerAlgorithm"),
-                sse_customer_key_md5=response.get("SSECustomerKeyMD5"),
-                sse_kms_key_id=response.get("SSEKMSKeyId"),
-                sse_kms_encryption_context=response.get("SSEKMSEncryptionContext"),
-                bucket_key_enabled=response.get("BucketKeyEnabled"),
-                server_side_encryption=response.get("ServerSideEncryption"),
-                version_id=response.get("VersionId"),
-            )
+            if parts is not None:
+                response = await self._put_object_multipart(kwargs, parts, max_concurrency)
+            else:
+                await _add_checksum(kwargs)
+                response = await self._call_write("put_object", **kwargs)
+            return S3PutObjectResponse.model_validate(response)
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
+
+    async def _put_object_multipart(
+        self, kwargs: dict[str, Any], parts: AsyncIterator[bytes | bytearray], max_concurrency: int
+    ) -> Any:
+        """Upload an object with a multipart upload of concurrent parts.
+
+        The next part is only read once fewer than ``max_concurrency`` parts are in flight, so
+        streamed bodies are uploaded with bounded memory.
+
+        Args:
+            kwargs: The ``put_object`` kwargs, without the body.
+            parts: The body parts. botocore rejects memoryview bodies, so parts are bytes or bytearrays.
+            max_concurrency: Maximum number of parts uploaded concurrently.
+
+        Returns:
+            The ``complete_multipart_upload`` response.
+
+        """
+        bucket_and_key = {"Bucket": kwargs["Bucket"], "Key": kwargs["Key"]}
+        part_kwargs = bucket_and_key | {name: kwargs[name] for name in _UPLOAD_PART_ARGS if name in kwargs}
+        checksum_name = f"Checksum{kwargs['ChecksumAlgorithm']}" if "ChecksumAlgorithm" in kwargs else None
+
+        upload = await self._call_write("create_multipart_upload", **kwargs)
+        upload_id = upload["UploadId"]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks: list[asyncio.Task[dict[str, Any]]] = []
+        failed = False
+
+        async def upload_part(part_number: int, body: bytes | bytearray) -> dict[str, Any]:
+            nonlocal failed
+            try:
+                request: dict[str, Any] = {
+                    "Body": body,
+                    "PartNumber": part_number,
+                    "UploadId": upload_id,
+                    **part_kwargs,
+                }
+                await _add_checksum(request)
+                response = await self._call_write("upload_part", **request)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                semaphore.release()
+            part = {"ETag": response["ETag"], "PartNumber": part_number}
+            if checksum_name is not None:
+                part[checksum_name] = response[checksum_name]
+            return part
+
+        try:
+            part_number = 0
+            async for body in parts:
+                await semaphore.acquire()
+                if failed:
+                    # Stop reading, the failure is raised by gather below.
+                    break
+                part_number += 1
+                tasks.append(asyncio.create_task(upload_part(part_number, body)))
+            completed_parts = await asyncio.gather(*tasks)
+            return await self._call_write(
+                "complete_multipart_upload",
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed_parts},
+                **bucket_and_key,
+                **{name: kwargs[name] for name in _COMPLETE_MULTIPART_UPLOAD_ARGS if name in kwargs},
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Abandoned uploads keep their parts stored (and billed) until they are aborted.
+            with contextlib.suppress(ClientError):
+                await self._client.abort_multipart_upload(
+                    UploadId=upload_id,
+                    **bucket_and_key,
+                    **{name: kwargs[name] for name in _ABORT_MULTIPART_UPLOAD_ARGS if name in kwargs},
+                )
+            raise
+
+    async def put_objects(
+        self,
+        bucket: str,
+        objects: Sequence[tuple[str, bytes | str]],
+        content_type: str | None = None,
+        concurrency: int = 32,
+    ) -> list[S3PutObjectResponse | S3ClientException]:
+        """Put many small objects into a bucket.
+
+        SHA-256 checksums of all bodies are computed in a single pass before any request is
+        sent, and passed as ``ChecksumSHA256`` so that S3 validates the uploads without the
+        client hashing each body separately in the middle of request serialization.
+
+        Args:
+            bucket: The name of the bucket.
+            objects: The object keys and bodies.
+            content_type: The content type of the objects.
+            concurrency: Maximum number of concurrent ``put_object`` calls.
+
+        Returns:
+            The responses, in the order of the objects. An object that could not be put gets its
+            S3 client exception instead, so it does not fail the others.
+
+        """
+        bodies = [body.encode("utf-8") if isinstance(body, str) else body for _, body in objects]
+        checksums = await self._batch_sha256(bodies)
+        return await _gather_per_item(
+            (
+                functools.partial(
+                    self.put_object, bucket, key, body=body, content_type=content_type, checksum_sha256=checksum
+                )
+                for (key, _), body, checksum in zip(objects, bodies, checksums, strict=True)
+            ),
+            concurrency,
+        )
+
+    @staticmethod
+    async def _batch_sha256(bodies: Sequence[bytes]) -> list[str]:
+        """Compute base64-encoded SHA-256 checksums of many bodies in one pass."""
+
+        def digest_all() -> list[str]:
+            sha256 = hashlib.sha256
+            b64encode = base64.b64encode
+            return [b64encode(sha256(memoryview(body)).digest()).decode("ascii") for body in bodies]
+
+        if sum(len(body) for body in bodies) > _THREADED_CHECKSUM_THRESHOLD:
+            return await asyncio.to_thread(digest_all)
+        return digest_all()
 
     async def put_object_acl(
         self,
@@ -1377,14 +2419,12 @@ class Aioboto3S3Client:
         kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
         if acl:
             kwargs["ACL"] = acl
-        if access_control_policy:
-            policy: dict[str, Any] = {}
-            if hasattr(access_control_policy, "grants") and access_control_policy.grants:
-                policy["Grants"] = access_control_policy.grants
-            if hasattr(access_control_policy, "owner") and access_control_policy.owner:
-                policy["Owner"] = access_control_policy.owner
-            if policy:
-                kwargs["AccessControlPolicy"] = policy
+        if (
+            access_control_policy
+            and access_control_policy.model_fields_set
+            and (policy := access_control_policy.model_dump(by_alias=True, exclude_none=True))
+        ):
+            kwargs["AccessControlPolicy"] = policy
         if content_md5:
             kwargs["ContentMD5"] = content_md5
         if checksum_algorithm:
@@ -1407,13 +2447,87 @@ class Aioboto3S3Client:
             kwargs["ExpectedBucketOwner"] = expected_bucket_owner
 
         try:
-            response = await self._client.put_object_acl(**kwargs)
+            response = await self._call_write("put_object_acl", **kwargs)
             return S3PutObjectAclResponse(
                 request_charged=response.get("RequestCharged"),
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
+
+    async def put_object_acl_bulk(
+        self,
+        bucket: str,
+        acl: str,
+        keys: Sequence[str] | None = None,
+        prefix: str | None = None,
+        role_arn: str | None = None,
+        manifest_bucket: str | None = None,
+        batch_job_threshold: int = 1000,
+        concurrency: int = 32,
+    ) -> S3PutObjectAclBulkResponse:
+        """Put a canned ACL on many objects.
+
+        Small requests are fanned out as concurrent ``put_object_acl`` calls. When more than
+        ``batch_job_threshold`` objects are affected and ``role_arn`` is set, a CSV manifest is
+        uploaded and the whole request is handed to S3 Batch Operations as a single job.
+
+        Args:
+            bucket: The name of the bucket.
+            acl: The canned ACL to apply to the objects.
+            keys: The object keys. Either keys or prefix must be set.
+            prefix: Apply the ACL to every object whose key starts with the prefix.
+            role_arn: The ARN of the IAM role used by S3 Batch Operations. If not set, a batch
+                job is never created.
+            manifest_bucket: The bucket to upload the manifest to. Defaults to the target bucket.
+            batch_job_threshold: Number of objects above which a batch job is created.
+            concurrency: Maximum number of concurrent ``put_object_acl`` calls.
+
+        Returns:
+            The per-object responses in the order of the keys, or the ID of the created batch job.
+            An object whose ACL could not be put gets its S3 client exception instead, so it does
+            not fail the others.
+
+        Raises:
+            S3InvalidRequestClientException: If neither keys nor prefix is set.
+
+        """
+        if keys is None:
+            if prefix is None:
+                raise S3InvalidRequestClientException("Either keys or prefix must be set.")
+            keys = await self._list_keys(bucket, prefix)
+
+        if role_arn is not None and len(keys) > batch_job_threshold:
+            manifest_bucket = manifest_bucket or bucket
+            manifest_key = f"batch-manifests/{uuid.uuid4()}.csv"
+            manifest_body = "".join(f"{bucket},{quote_s3_key(key)}\n" for key in keys)
+            manifest_response = await self.put_object(
+                manifest_bucket, manifest_key, body=manifest_body, content_type="text/csv"
+            )
+            job = await self.create_batch_job(
+                operation=S3BatchJobOperation(put_object_acl=S3BatchJobPutObjectAcl(acl=acl)),  # type: ignore[arg-type]
+                manifest=S3BatchJobManifest(
+                    bucket=manifest_bucket, key=manifest_key, etag=manifest_response.etag or ""
+                ),
+                role_arn=role_arn,
+                description=f"Put object ACL {acl} on {len(keys)} objects in {bucket}",
+            )
+            return S3PutObjectAclBulkResponse(job_id=job.job_id)
+
+        responses = await _gather_per_item(
+            (functools.partial(self.put_object_acl, bucket, key, acl=acl) for key in keys), concurrency
+        )
+        return S3PutObjectAclBulkResponse(responses=responses)
+
+    async def _list_keys(self, bucket: str, prefix: str) -> list[str]:
+        """List all object keys under a prefix."""
+        keys: list[str] = []
+        continuation_token: str | None = None
+        while True:
+            response = await self.list_objects_v2(bucket, prefix=prefix, continuation_token=continuation_token)
+            keys.extend(obj.key for obj in response.contents or [] if obj.key is not None)
+            if not response.is_truncated:
+                return keys
+            continuation_token = response.next_continuation_token
 
     async def put_object_legal_hold(
         self,
@@ -1427,13 +2541,23 @@ class Aioboto3S3Client:
         checksum_algorithm: str | None = None,
     ) -> S3PutObjectLegalHoldResponse:
         """Put the legal hold for an object."""
+        if (
+            self._http is not None
+            and legal_hold is not None
+            and legal_hold.status is not None
+            and not (request_payer or expected_bucket_owner or content_md5 or checksum_algorithm)
+        ):
+            native_response = await self._put_object_legal_hold_native(bucket, key, legal_hold.status, version_id)
+            if native_response is not None:
+                return native_response
+
         kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
-        if legal_hold:
-            legal_hold_dict: dict[str, Any] = {}
-            if hasattr(legal_hold, "status") and legal_hold.status:
-                legal_hold_dict["Status"] = legal_hold.status
-            if legal_hold_dict:
-                kwargs["LegalHold"] = legal_hold_dict
+        if (
+            legal_hold
+            and legal_hold.model_fields_set
+            and (legal_hold_dict := legal_hold.model_dump(by_alias=True, exclude_none=True))
+        ):
+            kwargs["LegalHold"] = legal_hold_dict
         if request_payer:
             kwargs["RequestPayer"] = request_payer
         if version_id:
@@ -1446,13 +2570,38 @@ class Aioboto3S3Client:
             kwargs["ChecksumAlgorithm"] = checksum_algorithm
 
         try:
-            response = await self._client.put_object_legal_hold(**kwargs)
+            response = await self._call_write("put_object_legal_hold", **kwargs)
             return S3PutObjectLegalHoldResponse(
                 request_charged=response.get("RequestCharged"),
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
+
+    async def put_object_legal_hold_bulk(
+        self,
+        bucket: str,
+        items: Sequence[tuple[str, S3ObjectLockLegalHold]],
+        concurrency: int = 32,
+    ) -> list[S3PutObjectLegalHoldResponse | S3ClientException]:
+        """Put legal holds on many objects concurrently.
+
+        Args:
+            bucket: The name of the bucket.
+            items: The object keys and their legal holds.
+            concurrency: Maximum number of concurrent ``put_object_legal_hold`` calls.
+
+        Returns:
+            The responses, in the order of the items. An object that could not be updated gets
+            its S3 client exception instead, so it does not fail the others.
+
+        """
+        return await _gather_per_item(
+            (
+                functools.partial(self.put_object_legal_hold, bucket, key, legal_hold=legal_hold)
+                for key, legal_hold in items
+            ),
+            concurrency,
+        )
 
     async def put_object_lock_configuration(
         self,
@@ -1466,41 +2615,12 @@ class Aioboto3S3Client:
     ) -> S3PutObjectLockConfigurationResponse:
         """Put the lock configuration for a bucket."""
         kwargs: dict[str, Any] = {"Bucket": bucket}
-        if object_lock_configuration:
-            config_dict: dict[str, Any] = {}
-            if (
-                hasattr(object_lock_configuration, "object_lock_enabled")
-                and object_lock_configuration.object_lock_enabled
-            ):
-                config_dict["ObjectLockEnabled"] = object_lock_configuration.object_lock_enabled
-            if hasattr(object_lock_configuration, "rule") and object_lock_configuration.rule:
-                rule_dict: dict[str, Any] = {}
-                if (
-                    hasattr(object_lock_configuration.rule, "default_retention")
-                    and object_lock_configuration.rule.default_retention
-                ):
-                    retention_dict: dict[str, Any] = {}
-                    if (
-                        hasattr(object_lock_configuration.rule.default_retention, "mode")
-                        and object_lock_configuration.rule.default_retention.mode
-                    ):
-                        retention_dict["Mode"] = object_lock_configuration.rule.default_retention.mode
-                    if (
-                        hasattr(object_lock_configuration.rule.default_retention, "days")
-                        and object_lock_configuration.rule.default_retention.days
-                    ):
-                        retention_dict["Days"] = object_lock_configuration.rule.default_retention.days
-                    if (
-                        hasattr(object_lock_configuration.rule.default_retention, "years")
-                        and object_lock_configuration.rule.default_retention.years
-                    ):
-                        retention_dict["Years"] = object_lock_configuration.rule.default_retention.years
-                    if retention_dict:
-                        rule_dict["DefaultRetention"] = retention_dict
-                if rule_dict:
-                    config_dict["Rule"] = rule_dict
-            if config_dict:
-                kwargs["ObjectLockConfiguration"] = config_dict
+        if (
+            object_lock_configuration
+            and object_lock_configuration.model_fields_set
+            and (config_dict := object_lock_configuration.model_dump(by_alias=True, exclude_none=True))
+        ):
+            kwargs["ObjectLockConfiguration"] = config_dict
         if request_payer:
             kwargs["RequestPayer"] = request_payer
         if token:
@@ -1519,7 +2639,6 @@ class Aioboto3S3Client:
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
     async def put_object_retention(
         self,
@@ -1535,14 +2654,12 @@ class Aioboto3S3Client:
     ) -> S3PutObjectRetentionResponse:
         """Put the retention for an object."""
         kwargs: dict[str, Any] = {"Bucket": bucket, "Key": key}
-        if retention:
-            retention_dict: dict[str, Any] = {}
-            if hasattr(retention, "mode") and retention.mode:
-                retention_dict["Mode"] = retention.mode
-            if hasattr(retention, "retain_until_date") and retention.retain_until_date:
-                retention_dict["RetainUntilDate"] = retention.retain_until_date
-            if retention_dict:
-                kwargs["Retention"] = retention_dict
+        if (
+            retention
+            and retention.model_fields_set
+            and (retention_dict := retention.model_dump(by_alias=True, exclude_none=True))
+        ):
+            kwargs["Retention"] = retention_dict
         if request_payer:
             kwargs["RequestPayer"] = request_payer
         if version_id:
@@ -1557,13 +2674,112 @@ class Aioboto3S3Client:
             kwargs["ChecksumAlgorithm"] = checksum_algorithm
 
         try:
-            response = await self._client.put_object_retention(**kwargs)
+            response = await self._call_write("put_object_retention", **kwargs)
             return S3PutObjectRetentionResponse(
                 request_charged=response.get("RequestCharged"),
             )
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
+
+    async def put_object_retention_bulk(
+        self,
+        bucket: str,
+        items: Sequence[tuple[str, S3ObjectLockRetention]],
+        bypass_governance_retention: bool | None = None,
+        concurrency: int = 32,
+    ) -> list[S3PutObjectRetentionResponse | S3ClientException]:
+        """Put retention settings on many objects concurrently.
+
+        Args:
+            bucket: The name of the bucket.
+            items: The object keys and their retention settings.
+            bypass_governance_retention: Whether to bypass governance-mode restrictions.
+            concurrency: Maximum number of concurrent ``put_object_retention`` calls.
+
+        Returns:
+            The responses, in the order of the items. An object that could not be updated gets
+            its S3 client exception instead, so it does not fail the others.
+
+        """
+        return await _gather_per_item(
+            (
+                functools.partial(
+                    self.put_object_retention,
+                    bucket,
+                    key,
+                    retention=retention,
+                    bypass_governance_retention=bypass_governance_retention,
+                )
+                for key, retention in items
+            ),
+            concurrency,
+        )
+
+    async def select_object_content(
+        self,
+        bucket: str,
+        key: str,
+        expression: str,
+        input_serialization: S3SelectInputSerialization,
+        output_serialization: S3SelectOutputSerialization,
+        expression_type: str = "SQL",
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Filter the contents of an object server-side with S3 Select."""
+        serialized_input: dict[str, Any] = {}
+        if input_serialization.csv_input:
+            serialized_input["CSV"] = self._build_kwargs(
+                FileHeaderInfo=input_serialization.csv_input.file_header_info,
+                Comments=input_serialization.csv_input.comments,
+                QuoteEscapeCharacter=input_serialization.csv_input.quote_escape_character,
+                RecordDelimiter=input_serialization.csv_input.record_delimiter,
+                FieldDelimiter=input_serialization.csv_input.field_delimiter,
+                QuoteCharacter=input_serialization.csv_input.quote_character,
+                AllowQuotedRecordDelimiter=input_serialization.csv_input.allow_quoted_record_delimiter,
+            )
+        if input_serialization.json_input:
+            serialized_input["JSON"] = {"Type": input_serialization.json_input.type}
+        if input_serialization.parquet_input:
+            serialized_input["Parquet"] = {}
+        if input_serialization.compression_type:
+            serialized_input["CompressionType"] = input_serialization.compression_type
+
+        serialized_output: dict[str, Any] = {}
+        if output_serialization.csv_output:
+            serialized_output["CSV"] = self._build_kwargs(
+                QuoteFields=output_serialization.csv_output.quote_fields,
+                QuoteEscapeCharacter=output_serialization.csv_output.quote_escape_character,
+                RecordDelimiter=output_serialization.csv_output.record_delimiter,
+                FieldDelimiter=output_serialization.csv_output.field_delimiter,
+                QuoteCharacter=output_serialization.csv_output.quote_character,
+            )
+        if output_serialization.json_output:
+            serialized_output["JSON"] = self._build_kwargs(
+                RecordDelimiter=output_serialization.json_output.record_delimiter,
+            )
+
+        kwargs = self._build_kwargs(
+            Bucket=bucket,
+            Key=key,
+            Expression=expression,
+            ExpressionType=expression_type,
+            InputSerialization=serialized_input,
+            OutputSerialization=serialized_output,
+            SSECustomerAlgorithm=sse_customer_algorithm,
+            SSECustomerKey=sse_customer_key,
+            ExpectedBucketOwner=expected_bucket_owner,
+        )
+
+        try:
+            response = await self._client.select_object_content(**kwargs)
+            # botocore decodes the event stream framing (prelude, headers, CRCs) for us.
+            async for event in response["Payload"]:
+                if records := event.get("Records"):
+                    yield records["Payload"]
+        except ClientError as e:
+            self._handle_client_error(e)
 
     async def generate_presigned_url(
         self,
@@ -1591,6 +2807,20 @@ class Aioboto3S3Client:
         if not self._client:
             raise S3ServiceClientException("Client not initialized. Use async context manager.")
 
+        if (
+            client_method == "get_object"
+            and self._presigner is not None
+            and response_content_type is None
+            and response_content_disposition is None
+            and response_content_encoding is None
+            and response_content_language is None
+            and response_cache_control is None
+            and response_expires is None
+            and sse_customer_algorithm is None
+            and sse_customer_key is None
+        ):
+            return self._presigner.presign_get_object(bucket, key, expires_in, version_id=version_id)
+
         # Note: generate_presigned_url doesn't make network calls, so it won't validate
         # bucket existence. However, for consistency with MockS3Client behavior in tests,
         # we could add a check here. But in real AWS S3, presigned URLs can be generated
@@ -1651,6 +2881,5 @@ class Aioboto3S3Client:
 
         except ClientError as e:
             self._handle_client_error(e)
-            raise  # This should never be reached, but for type checking
 
         return url
@@ -0,0 +1,165 @@
+"""Asynchronous batching of small S3 requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import Any, Self
+
+from haolib.database.files.s3.clients.abstract import AbstractS3Client
+from haolib.database.files.s3.clients.pydantic import (
+    S3GetObjectAclResponse,
+    S3GetObjectResponse,
+    S3ListObjectsResponse,
+)
+
+type _PendingCall = tuple[Callable[..., Awaitable[Any]], dict[str, Any], asyncio.Future[Any]]
+
+
+class S3BatchContext:
+    """Collector that coalesces bursts of small S3 requests.
+
+    S3 has no API-level batching for reads, so every ``get_object`` is its own request.
+    Instead of firing each call the moment it is made, calls are buffered for up to
+    ``flush_ms`` milliseconds (or until ``max_batch`` calls are pending) and dispatched
+    together, with at most ``max_concurrency`` requests in flight. Every caller awaits
+    its own result, and errors are raised to the caller that made the failing call.
+
+    Example:
+        ```python
+        async with S3BatchContext(client) as batch:
+            responses = await asyncio.gather(*(batch.get_object(bucket, key) for key in keys))
+        ```
+
+    """
+
+    def __init__(
+        self,
+        client: AbstractS3Client,
+        flush_ms: float = 1.0,
+        max_batch: int = 64,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Initialize the batch context.
+
+        Args:
+            client: The S3 client used to dispatch the calls.
+            flush_ms: Maximum time in milliseconds a call is buffered before the batch is dispatched.
+            max_batch: Number of pending calls that triggers an immediate dispatch.
+            max_concurrency: Maximum number of requests in flight. Defaults to ``max_batch``.
+
+        """
+        self._client = client
+        self._flush_delay = flush_ms / 1000
+        self._max_batch = max_batch
+        self._semaphore = asyncio.Semaphore(max_concurrency or max_batch)
+        self._pending: list[_PendingCall] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> Self:
+        """Enter the batch context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Dispatch the pending calls and wait for every dispatched batch."""
+        self.flush()
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches)
+
+    async def call[T](self, func: Callable[..., Awaitable[T]], /, **kwargs: Any) -> T:
+        """Buffer a call to an S3 operation and wait for its result.
+
+        Args:
+            func: The S3 operation to call.
+            **kwargs: The keyword arguments of the operation.
+
+        Returns:
+            The result of the operation.
+
+        """
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._pending.append((func, kwargs, future))
+        if len(self._pending) >= self._max_batch:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._flush_delay, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Dispatch the pending calls now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._dispatch(batch))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def get_object(self, bucket: str, key: str, **kwargs: Any) -> S3GetObjectResponse:
+        """Get an object from a bucket as part of the current batch.
+
+        Args:
+            bucket: The name of the bucket.
+            key: The object key.
+            **kwargs: Other arguments of ``AbstractS3Client.get_object``.
+
+        Returns:
+            The object data and metadata.
+
+        """
+        return await self.call(self._client.get_object, bucket=bucket, key=key, **kwargs)
+
+    async def get_object_acl(self, bucket: str, key: str, **kwargs: Any) -> S3GetObjectAclResponse:
+        """Get the ACL for an object as part of the current batch.
+
+        Args:
+            bucket: The name of the bucket.
+            key: The object key.
+            **kwargs: Other arguments of ``AbstractS3Client.get_object_acl``.
+
+        Returns:
+            The ACL of the object.
+
+        """
+        return await self.call(self._client.get_object_acl, bucket=bucket, key=key, **kwargs)
+
+    async def list_objects(self, bucket: str, **kwargs: Any) -> S3ListObjectsResponse:
+        """List objects in a bucket as part of the current batch.
+
+        Args:
+            bucket: The name of the bucket.
+            **kwargs: Other arguments of ``AbstractS3Client.list_objects``.
+
+        Returns:
+            The listed objects.
+
+        """
+        return await self.call(self._client.list_objects, bucket=bucket, **kwargs)
+
+    async def _dispatch(self, batch: list[_PendingCall]) -> None:
+        """Run every call of a batch under the concurrency limit."""
+        await asyncio.gather(*(self._run(func, kwargs, future) for func, kwargs, future in batch))
+
+    async def _run(
+        self, func: Callable[..., Awaitable[Any]], kwargs: dict[str, Any], future: asyncio.Future[Any]
+    ) -> None:
+        """Run a single call and resolve its future."""
+        async with self._semaphore:
+            if future.done():
+                # The caller was cancelled while the call was buffered.
+                return
+            try:
+                result = await func(**kwargs)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+        if not future.done():
+            future.set_result(result)
@@ -2,35 +2,68 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
-from typing import Literal
-
-from pydantic import BaseModel
-
-
-class S3CreateBucketConfigurationLocation(BaseModel):
+from functools import cached_property
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import from_json
+
+# Value sets shared by several models.
+S3StorageClass = Literal[
+    "STANDARD",
+    "REDUCED_REDUNDANCY",
+    "STANDARD_IA",
+    "ONEZONE_IA",
+    "INTELLIGENT_TIERING",
+    "GLACIER",
+    "DEEP_ARCHIVE",
+    "OUTPOSTS",
+    "GLACIER_IR",
+    "SNOW",
+    "EXPRESS_ONEZONE",
+]
+S3TransitionStorageClass = Literal[
+    "GLACIER", "STANDARD_IA", "ONEZONE_IA", "INTELLIGENT_TIERING", "DEEP_ARCHIVE", "GLACIER_IR"
+]
+S3ServerSideEncryption = Literal["AES256", "aws:kms", "aws:kms:dsse"]
+
+
+class S3Model(BaseModel):
+    """Base S3 client model.
+
+    Models are immutable: responses are shared between callers and request
+    models are reused across calls, so they are never modified in place.
+    Validators are built on first validation rather than at import time, since
+    most responses are created with ``model_construct``.
+    """
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class S3CreateBucketConfigurationLocation(S3Model):
     """S3 create bucket configuration location."""
 
     type: Literal["AvailabilityZone", "LocalZone"]
     name: str
 
 
-class S3CreateBucketConfigurationTag(BaseModel):
+class S3CreateBucketConfigurationTag(S3Model):
     """S3 create bucket configuration tag."""
 
     key: str
     value: str
 
 
-class S3CreateBucketConfigurationBucket(BaseModel):
+class S3CreateBucketConfigurationBucket(S3Model):
     """S3 create bucket configuration bucket."""
 
     data_redundancy: Literal["SingleAvailabilityZone", "SingleLocalZone"]
     type: Literal["Directory"]
 
 
-class S3CreateBucketConfiguration(BaseModel):
+class S3CreateBucketConfiguration(S3Model):
     """S3 create bucket configuration."""
 
     location_constraint: (
@@ -76,7 +109,7 @@ class S3CreateBucketConfiguration(BaseModel):
     tags: Sequence[S3CreateBucketConfigurationTag] | None = None
 
 
-class S3DeleteObjectsDeleteObject(BaseModel):
+class S3DeleteObjectsDeleteObject(S3Model):
     """S3 delete objects delete object."""
 
     key: str
@@ -86,32 +119,42 @@ class S3DeleteObjectsDeleteObject(BaseModel):
     size: int | None = None
 
 
-class S3DeleteObjectsDelete(BaseModel):
+class S3DeleteObjectsDelete(S3Model):
     """S3 delete objects delete."""
 
     objects: Sequence[S3DeleteObjectsDeleteObject]
     quiet: bool | None = None
 
 
-class S3DeleteObjectsResponseDeletedItem(BaseModel):
-    """S3 delete objects response deleted item."""
+class S3DeleteObjectsResponseDeletedItem(S3Model):
+    """S3 delete objects response deleted item.
 
-    key: str
-    version_id: str
-    delete_marker: bool
-    delete_marker_version_id: str
+    Items can also be validated straight from the boto3 ``Deleted`` entries.
+    """
 
+    model_config = ConfigDict(validate_by_name=True)
 
-class S3DeleteObjectsResponseErrorItem(BaseModel):
-    """S3 delete objects response error item."""
+    key: str = Field(validation_alias="Key")
+    version_id: str = Field(default="", validation_alias="VersionId")
+    delete_marker: bool = Field(default=False, validation_alias="DeleteMarker")
+    delete_marker_version_id: str = Field(default="", validation_alias="DeleteMarkerVersionId")
 
-    key: str
-    version_id: str
-    code: str
-    message: str
+
+class S3DeleteObjectsResponseErrorItem(S3Model):
+    """S3 delete objects response error item.
+
+    Items can also be validated straight from the boto3 ``Errors`` entries.
+    """
+
+    model_config = ConfigDict(validate_by_name=True)
+
+    key: str = Field(validation_alias="Key")
+    version_id: str = Field(default="", validation_alias="VersionId")
+    code: str = Field(validation_alias="Code")
+    message: str = Field(validation_alias="Message")
 
 
-class S3DeleteObjectsResponse(BaseModel):
+class S3DeleteObjectsResponse(S3Model):
     """S3 delete objects response."""
 
     deleted: Sequence[S3DeleteObjectsResponseDeletedItem]
@@ -119,45 +162,68 @@ class S3DeleteObjectsResponse(BaseModel):
     request_charged: Literal["requester"] | None = None
 
 
-class S3Owner(BaseModel):
-    """S3 owner."""
+class S3Owner(S3Model):
+    """S3 owner.
 
-    display_name: str | None = None
-    id: str | None = None
+    Owners can also be validated straight from the boto3 ``Owner`` entries.
+    """
 
+    model_config = ConfigDict(validate_by_name=True)
 
-class S3Grantee(BaseModel):
-    """S3 grantee."""
+    display_name: str | None = Field(default=None, alias="DisplayName")
+    id: str | None = Field(default=None, alias="ID")
 
-    display_name: str | None = None
-    email_address: str | None = None
-    id: str | None = None
-    type: Literal["CanonicalUser", "AmazonCustomerByEmail", "Group"]
-    uri: str | None = None
 
+class S3Grantee(S3Model):
+    """S3 grantee.
 
-class S3Grant(BaseModel):
-    """S3 grant."""
+    Grantees can also be validated straight from the boto3 ``Grantee`` entries.
+    """
 
-    grantee: S3Grantee | None = None
-    permission: Literal["FULL_CONTROL", "WRITE", "WRITE_ACP", "READ", "READ_ACP"] | None = None
+    model_config = ConfigDict(validate_by_name=True)
 
+    display_name: str | None = Field(default=None, alias="DisplayName")
+    email_address: str | None = Field(default=None, alias="EmailAddress")
+    id: str | None = Field(default=None, alias="ID")
+    type: Literal["CanonicalUser", "AmazonCustomerByEmail", "Group"] = Field(alias="Type")
+    uri: str | None = Field(default=None, alias="URI")
 
-class S3AccessControlPolicy(BaseModel):
-    """S3 access control policy."""
 
-    grants: Sequence[S3Grant] | None = None
-    owner: S3Owner | None = None
+class S3Grant(S3Model):
+    """S3 grant.
+
+    Grants can also be validated straight from the boto3 ``Grants`` entries.
+    """
+
+    model_config = ConfigDict(validate_by_name=True)
+
+    grantee: S3Grantee | None = Field(default=None, alias="Grantee")
+    permission: Literal["FULL_CONTROL", "WRITE", "WRITE_ACP", "READ", "READ_ACP"] | None = Field(
+        default=None, alias="Permission"
+    )
+
+
+class S3AccessControlPolicy(S3Model):
+    """S3 access control policy.
+
+    Fields are aliased by their boto3 keys, so ``model_dump(by_alias=True, exclude_none=True)``
+    gives the ``AccessControlPolicy`` parameter as is.
+    """
+
+    model_config = ConfigDict(validate_by_name=True)
 
+    grants: Sequence[S3Grant] | None = Field(default=None, alias="Grants")
+    owner: S3Owner | None = Field(default=None, alias="Owner")
 
-class S3GetBucketAclResponse(BaseModel):
+
+class S3GetBucketAclResponse(S3Model):
     """S3 get bucket ACL response."""
 
     grants: Sequence[S3Grant] | None = None
     owner: S3Owner | None = None
 
 
-class S3GetObjectAclResponse(BaseModel):
+class S3GetObjectAclResponse(S3Model):
     """S3 get object ACL response."""
 
     grants: Sequence[S3Grant] | None = None
@@ -165,226 +231,252 @@ class S3GetObjectAclResponse(BaseModel):
     request_charged: Literal["requester"] | None = None
 
 
-class S3CORSRule(BaseModel):
+class S3CORSRule(S3Model):
     """S3 CORS rule."""
 
-    allowed_headers: Sequence[str] | None = None
-    allowed_methods: Sequence[str]
-    allowed_origins: Sequence[str]
-    expose_headers: Sequence[str] | None = None
-    id: str | None = None
-    max_age_seconds: int | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    allowed_headers: Sequence[str] | None = Field(default=None, validation_alias="AllowedHeaders")
+    allowed_methods: Sequence[str] = Field(validation_alias="AllowedMethods")
+    allowed_origins: Sequence[str] = Field(validation_alias="AllowedOrigins")
+    expose_headers: Sequence[str] | None = Field(default=None, validation_alias="ExposeHeaders")
+    id: str | None = Field(default=None, validation_alias="ID")
+    max_age_seconds: int | None = Field(default=None, validation_alias="MaxAgeSeconds")
 
 
-class S3CORSConfiguration(BaseModel):
+class S3CORSConfiguration(S3Model):
     """S3 CORS configuration."""
 
     cors_rules: Sequence[S3CORSRule]
 
 
-class S3GetBucketCorsResponse(BaseModel):
+class S3GetBucketCorsResponse(S3Model):
     """S3 get bucket CORS response."""
 
     cors_rules: Sequence[S3CORSRule] | None = None
 
 
-class S3LifecycleExpiration(BaseModel):
+class S3LifecycleExpiration(S3Model):
     """S3 lifecycle expiration."""
 
-    date: datetime | None = None
-    days: int | None = None
-    expired_object_delete_marker: bool | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    date: datetime | None = Field(default=None, alias="Date")
+    days: int | None = Field(default=None, alias="Days")
+    expired_object_delete_marker: bool | None = Field(default=None, alias="ExpiredObjectDeleteMarker")
 
 
-class S3LifecycleTransition(BaseModel):
+class S3LifecycleTransition(S3Model):
     """S3 lifecycle transition."""
 
-    date: datetime | None = None
-    days: int | None = None
-    storage_class: (
-        Literal[
-            "GLACIER",
-            "STANDARD_IA",
-            "ONEZONE_IA",
-            "INTELLIGENT_TIERING",
-            "DEEP_ARCHIVE",
-            "GLACIER_IR",
-        ]
-        | None
-    ) = None
+    model_config = ConfigDict(validate_by_name=True)
 
+    date: datetime | None = Field(default=None, alias="Date")
+    days: int | None = Field(default=None, alias="Days")
+    storage_class: S3TransitionStorageClass | None = Field(default=None, alias="StorageClass")
 
-class S3NoncurrentVersionExpiration(BaseModel):
+
+class S3NoncurrentVersionExpiration(S3Model):
     """S3 noncurrent version expiration."""
 
-    noncurrent_days: int | None = None
-    newer_noncurrent_versions: int | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    noncurrent_days: int | None = Field(default=None, alias="NoncurrentDays")
+    newer_noncurrent_versions: int | None = Field(default=None, alias="NewerNoncurrentVersions")
 
 
-class S3NoncurrentVersionTransition(BaseModel):
+class S3NoncurrentVersionTransition(S3Model):
     """S3 noncurrent version transition."""
 
-    noncurrent_days: int | None = None
-    storage_class: (
-        Literal[
-            "GLACIER",
-            "STANDARD_IA",
-            "ONEZONE_IA",
-            "INTELLIGENT_TIERING",
-            "DEEP_ARCHIVE",
-            "GLACIER_IR",
-        ]
-        | None
-    ) = None
-    newer_noncurrent_versions: int | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    noncurrent_days: int | None = Field(default=None, alias="NoncurrentDays")
+    storage_class: S3TransitionStorageClass | None = Field(default=None, alias="StorageClass")
+    newer_noncurrent_versions: int | None = Field(default=None, alias="NewerNoncurrentVersions")
 
 
-class S3LifecycleRuleFilter(BaseModel):
+class S3LifecycleRuleFilter(S3Model):
     """S3 lifecycle rule filter."""
 
-    and_: dict | None = None  # And
-    prefix: str | None = None
-    tag: dict | None = None
-    object_size_greater_than: int | None = None
-    object_size_less_than: int | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    and_: dict | None = Field(default=None, alias="And")
+    prefix: str | None = Field(default=None, alias="Prefix")
+    tag: dict | None = Field(default=None, alias="Tag")
+    object_size_greater_than: int | None = Field(default=None, alias="ObjectSizeGreaterThan")
+    object_size_less_than: int | None = Field(default=None, alias="ObjectSizeLessThan")
 
 
-class S3LifecycleRule(BaseModel):
+class S3LifecycleRule(S3Model):
     """S3 lifecycle rule."""
 
-    id: str
-    status: Literal["Enabled", "Disabled"]
-    abort_incomplete_multipart_upload: dict | None = None
-    expiration: S3LifecycleExpiration | None = None
-    filter: S3LifecycleRuleFilter | None = None
-    noncurrent_version_expiration: S3NoncurrentVersionExpiration | None = None
-    noncurrent_version_transitions: Sequence[S3NoncurrentVersionTransition] | None = None
-    transitions: Sequence[S3LifecycleTransition] | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    id: str = Field(alias="ID")
+    status: Literal["Enabled", "Disabled"] = Field(alias="Status")
+    abort_incomplete_multipart_upload: dict | None = Field(default=None, alias="AbortIncompleteMultipartUpload")
+    expiration: S3LifecycleExpiration | None = Field(default=None, alias="Expiration")
+    filter: S3LifecycleRuleFilter | None = Field(default=None, alias="Filter")
+    noncurrent_version_expiration: S3NoncurrentVersionExpiration | None = Field(
+        default=None, alias="NoncurrentVersionExpiration"
+    )
+    noncurrent_version_transitions: Sequence[S3NoncurrentVersionTransition] | None = Field(
+        default=None, alias="NoncurrentVersionTransitions"
+    )
+    transitions: Sequence[S3LifecycleTransition] | None = Field(default=None, alias="Transitions")
+
 
+class S3LifecycleConfiguration(S3Model):
+    """S3 lifecycle configuration.
 
-class S3LifecycleConfiguration(BaseModel):
-    """S3 lifecycle configuration."""
+    Lifecycle models use the boto3 keys as aliases, so a configuration is converted to and from
+    boto3 with ``model_dump(by_alias=True, exclude_none=True)`` and ``model_validate``.
+    """
 
-    rules: Sequence[S3LifecycleRule]
+    model_config = ConfigDict(validate_by_name=True)
 
+    rules: Sequence[S3LifecycleRule] = Field(alias="Rules")
 
-class S3GetBucketLifecycleConfigurationResponse(BaseModel):
+
+class S3GetBucketLifecycleConfigurationResponse(S3Model):
     """S3 get bucket lifecycle configuration response."""
 
-    rules: Sequence[S3LifecycleRule] | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    rules: Sequence[S3LifecycleRule] | None = Field(default=None, alias="Rules")
 
 
-class S3GetBucketPolicyResponse(BaseModel):
+class S3GetBucketPolicyResponse(S3Model):
     """S3 get bucket policy response."""
 
     policy: str | None = None
     revision_id: str | None = None
 
-
-class S3GetObjectResponse(BaseModel):
+    @cached_property
+    def policy_dict(self) -> dict[str, Any] | None:
+        """The policy as a parsed JSON document, parsed on first access."""
+        return from_json(self.policy) if self.policy else None
+
+
+class S3GetObjectMetadata(S3Model):
+    """S3 get object response metadata.
+
+    Responses can also be validated straight from the boto3 ``get_object`` response.
+    """
+
+    model_config = ConfigDict(validate_by_name=True)
+
+    delete_marker: bool | None = Field(default=None, validation_alias="DeleteMarker")
+    accept_ranges: str | None = Field(default=None, validation_alias="AcceptRanges")
+    expiration: str | None = Field(default=None, validation_alias="Expiration")
+    restore: str | None = Field(default=None, validation_alias="Restore")
+    last_modified: datetime | None = Field(default=None, validation_alias="LastModified")
+    content_length: int | None = Field(default=None, validation_alias="ContentLength")
+    etag: str | None = Field(default=None, validation_alias="ETag")
+    checksum_crc32: str | None = Field(default=None, validation_alias="ChecksumCRC32")
+    checksum_crc32c: str | None = Field(default=None, validation_alias="ChecksumCRC32C")
+    checksum_sha1: str | None = Field(default=None, validation_alias="ChecksumSHA1")
+    checksum_sha256: str | None = Field(default=None, validation_alias="ChecksumSHA256")
+    missing_meta: int | None = Field(default=None, validation_alias="MissingMeta")
+    version_id: str | None = Field(default=None, validation_alias="VersionId")
+    cache_control: str | None = Field(default=None, validation_alias="CacheControl")
+    content_disposition: str | None = Field(default=None, validation_alias="ContentDisposition")
+    content_encoding: str | None = Field(default=None, validation_alias="ContentEncoding")
+    content_language: str | None = Field(default=None, validation_alias="ContentLanguage")
+    content_range: str | None = Field(default=None, validation_alias="ContentRange")
+    content_type: str | None = Field(default=None, validation_alias="ContentType")
+    expires: datetime | None = Field(default=None, validation_alias="Expires")
+    website_redirect_location: str | None = Field(default=None, validation_alias="WebsiteRedirectLocation")
+    server_side_encryption: S3ServerSideEncryption | None = Field(default=None, validation_alias="ServerSideEncryption")
+    metadata: dict[str, str] | None = Field(default=None, validation_alias="Metadata")
+    sse_customer_algorithm: str | None = Field(default=None, validation_alias="SSECustomerAlgorithm")
+    sse_customer_key_md5: str | None = Field(default=None, validation_alias="SSECustomerKeyMD5")
+    sse_kms_key_id: str | None = Field(default=None, validation_alias="SSEKMSKeyId")
+    bucket_key_enabled: bool | None = Field(default=None, validation_alias="BucketKeyEnabled")
+    storage_class: S3StorageClass | None = Field(default=None, validation_alias="StorageClass")
+    request_charged: Literal["requester"] | None = Field(default=None, validation_alias="RequestCharged")
+    replication_status: Literal["COMPLETE", "PENDING", "FAILED", "REPLICA"] | None = Field(
+        default=None, validation_alias="ReplicationStatus"
+    )
+    parts_count: int | None = Field(default=None, validation_alias="PartsCount")
+    tag_count: int | None = Field(default=None, validation_alias="TagCount")
+    object_lock_mode: Literal["GOVERNANCE", "COMPLIANCE"] | None = Field(
+        default=None, validation_alias="ObjectLockMode"
+    )
+    object_lock_retain_until_date: datetime | None = Field(default=None, validation_alias="ObjectLockRetainUntilDate")
+    object_lock_legal_hold_status: Literal["ON", "OFF"] | None = Field(
+        default=None, validation_alias="ObjectLockLegalHoldStatus"
+    )
+
+
+class S3GetObjectResponse(S3GetObjectMetadata):
     """S3 get object response."""
 
-    body: bytes
-    delete_marker: bool | None = None
-    accept_ranges: str | None = None
-    expiration: str | None = None
-    restore: str | None = None
-    last_modified: datetime | None = None
-    content_length: int | None = None
-    etag: str | None = None
-    checksum_crc32: str | None = None
-    checksum_crc32c: str | None = None
-    checksum_sha1: str | None = None
-    checksum_sha256: str | None = None
-    missing_meta: int | None = None
-    version_id: str | None = None
-    cache_control: str | None = None
-    content_disposition: str | None = None
-    content_encoding: str | None = None
-    content_language: str | None = None
-    content_range: str | None = None
-    content_type: str | None = None
-    expires: datetime | None = None
-    website_redirect_location: str | None = None
-    server_side_encryption: Literal["AES256", "aws:kms", "aws:kms:dsse"] | None = None
-    metadata: dict[str, str] | None = None
-    sse_customer_algorithm: str | None = None
-    sse_customer_key_md5: str | None = None
-    sse_kms_key_id: str | None = None
-    bucket_key_enabled: bool | None = None
-    storage_class: (
-        Literal[
-            "STANDARD",
-            "REDUCED_REDUNDANCY",
-            "STANDARD_IA",
-            "ONEZONE_IA",
-            "INTELLIGENT_TIERING",
-            "GLACIER",
-            "DEEP_ARCHIVE",
-            "OUTPOSTS",
-            "GLACIER_IR",
-            "SNOW",
-            "EXPRESS_ONEZONE",
-        ]
-        | None
-    ) = None
-    request_charged: Literal["requester"] | None = None
-    replication_status: Literal["COMPLETE", "PENDING", "FAILED", "REPLICA"] | None = None
-    parts_count: int | None = None
-    tag_count: int | None = None
-    object_lock_mode: Literal["GOVERNANCE", "COMPLIANCE"] | None = None
-    object_lock_retain_until_date: datetime | None = None
-    object_lock_legal_hold_status: Literal["ON", "OFF"] | None = None
+    body: bytes = Field(validation_alias="Body")
 
 
-class S3Bucket(BaseModel):
-    """S3 bucket."""
+class S3GetObjectStreamResponse(S3GetObjectMetadata):
+    """S3 get object response with a streamed body.
 
-    name: str | None = None
-    creation_date: datetime | None = None
+    The body yields the object in chunks as they arrive and must be consumed
+    (or closed with ``aclose``) to release the connection.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    body: AsyncIterator[bytes] = Field(validation_alias="Body")
+
+
+class S3Bucket(S3Model):
+    """S3 bucket.
+
+    Buckets can also be validated straight from the boto3 ``Buckets`` entries.
+    """
 
+    model_config = ConfigDict(validate_by_name=True)
 
-class S3ListBucketsResponse(BaseModel):
+    name: str | None = Field(default=None, validation_alias="Name")
+    creation_date: datetime | None = Field(default=None, validation_alias="CreationDate")
+
+
+class S3ListBucketsResponse(S3Model):
     """S3 list buckets response."""
 
     buckets: Sequence[S3Bucket] | None = None
     owner: S3Owner | None = None
 
 
-class S3Object(BaseModel):
-    """S3 object."""
+class S3Object(S3Model):
+    """S3 object.
 
-    key: str | None = None
-    last_modified: datetime | None = None
-    etag: str | None = None
-    checksum_algorithm: Sequence[Literal["CRC32", "CRC32C", "SHA1", "SHA256"]] | None = None
-    size: int | None = None
-    storage_class: (
-        Literal[
-            "STANDARD",
-            "REDUCED_REDUNDANCY",
-            "STANDARD_IA",
-            "ONEZONE_IA",
-            "INTELLIGENT_TIERING",
-            "GLACIER",
-            "DEEP_ARCHIVE",
-            "OUTPOSTS",
-            "GLACIER_IR",
-            "SNOW",
-            "EXPRESS_ONEZONE",
-        ]
-        | None
-    ) = None
-    owner: S3Owner | None = None
+    Objects can also be validated straight from the boto3 ``Contents`` entries.
+    """
 
+    model_config = ConfigDict(validate_by_name=True)
 
-class S3CommonPrefix(BaseModel):
-    """S3 common prefix."""
+    key: str | None = Field(default=None, validation_alias="Key")
+    last_modified: datetime | None = Field(default=None, validation_alias="LastModified")
+    etag: str | None = Field(default=None, validation_alias="ETag")
+    checksum_algorithm: Sequence[Literal["CRC32", "CRC32C", "SHA1", "SHA256"]] | None = Field(
+        default=None, validation_alias="ChecksumAlgorithm"
+    )
+    size: int | None = Field(default=None, validation_alias="Size")
+    storage_class: S3StorageClass | None = Field(default=None, validation_alias="StorageClass")
+    owner: S3Owner | None = Field(default=None, validation_alias="Owner")
 
-    prefix: str | None = None
 
+class S3CommonPrefix(S3Model):
+    """S3 common prefix.
+
+    Prefixes can also be validated straight from the boto3 ``CommonPrefixes`` entries.
+    """
+
+    model_config = ConfigDict(validate_by_name=True)
+
+    prefix: str | None = Field(default=None, validation_alias="Prefix")
 
-class S3ListObjectsResponse(BaseModel):
+
+class S3ListObjectsResponse(S3Model):
     """S3 list objects response."""
 
     is_truncated: bool | None = None
@@ -400,7 +492,7 @@ class S3ListObjectsResponse(BaseModel):
     request_charged: Literal["requester"] | None = None
 
 
-class S3ListObjectsV2Response(BaseModel):
+class S3ListObjectsV2Response(S3Model):
     """S3 list objects v2 response."""
 
     is_truncated: bool | None = None
@@ -418,108 +510,127 @@ class S3ListObjectsV2Response(BaseModel):
     request_charged: Literal["requester"] | None = None
 
 
-class S3PutObjectResponse(BaseModel):
-    """S3 put object response."""
+class S3PutObjectResponse(S3Model):
+    """S3 put object response.
 
-    etag: str | None = None
-    checksum_crc32: str | None = None
-    checksum_crc32c: str | None = None
-    checksum_sha1: str | None = None
-    checksum_sha256: str | None = None
-    expiration: str | None = None
-    request_charged: Literal["requester"] | None = None
-    sse_customer_algorithm: str | None = None
-    sse_customer_key_md5: str | None = None
-    sse_kms_key_id: str | None = None
-    sse_kms_encryption_context: str | None = None
-    bucket_key_enabled: bool | None = None
-    server_side_encryption: Literal["AES256", "aws:kms", "aws:kms:dsse"] | None = None
-    version_id: str | None = None
+    Responses can also be validated straight from the boto3 ``put_object`` response.
+    """
+
+    model_config = ConfigDict(validate_by_name=True)
+
+    etag: str | None = Field(default=None, validation_alias="ETag")
+    checksum_crc32: str | None = Field(default=None, validation_alias="ChecksumCRC32")
+    checksum_crc32c: str | None = Field(default=None, validation_alias="ChecksumCRC32C")
+    checksum_sha1: str | None = Field(default=None, validation_alias="ChecksumSHA1")
+    checksum_sha256: str | None = Field(default=None, validation_alias="ChecksumSHA256")
+    expiration: str | None = Field(default=None, validation_alias="Expiration")
+    request_charged: Literal["requester"] | None = Field(default=None, validation_alias="RequestCharged")
+    sse_customer_algorithm: str | None = Field(default=None, validation_alias="SSECustomerAlgorithm")
+    sse_customer_key_md5: str | None = Field(default=None, validation_alias="SSECustomerKeyMD5")
+    sse_kms_key_id: str | None = Field(default=None, validation_alias="SSEKMSKeyId")
+    sse_kms_encryption_context: str | None = Field(default=None, validation_alias="SSEKMSEncryptionContext")
+    bucket_key_enabled: bool | None = Field(default=None, validation_alias="BucketKeyEnabled")
+    server_side_encryption: S3ServerSideEncryption | None = Field(default=None, validation_alias="ServerSideEncryption")
+    version_id: str | None = Field(default=None, validation_alias="VersionId")
 
 
-class S3PutObjectAclResponse(BaseModel):
+class S3PutObjectAclResponse(S3Model):
     """S3 put object ACL response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3PutBucketAclResponse(BaseModel):
+class S3PutBucketAclResponse(S3Model):
     """S3 put bucket ACL response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3PutBucketCorsResponse(BaseModel):
+class S3PutBucketCorsResponse(S3Model):
     """S3 put bucket CORS response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3PutBucketLifecycleConfigurationResponse(BaseModel):
+class S3PutBucketLifecycleConfigurationResponse(S3Model):
     """S3 put bucket lifecycle configuration response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3PutBucketPolicyResponse(BaseModel):
+class S3PutBucketPolicyResponse(S3Model):
     """S3 put bucket policy response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3ObjectLockLegalHold(BaseModel):
+class S3ObjectLockLegalHold(S3Model):
     """S3 object lock legal hold."""
 
-    status: Literal["ON", "OFF"] | None = None
+    model_config = ConfigDict(validate_by_name=True)
 
+    status: Literal["ON", "OFF"] | None = Field(default=None, alias="Status")
 
-class S3PutObjectLegalHoldResponse(BaseModel):
+
+class S3PutObjectLegalHoldResponse(S3Model):
     """S3 put object legal hold response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3DefaultRetention(BaseModel):
+class S3DefaultRetention(S3Model):
     """S3 default retention."""
 
-    mode: Literal["GOVERNANCE", "COMPLIANCE"] | None = None
-    days: int | None = None
-    years: int | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    mode: Literal["GOVERNANCE", "COMPLIANCE"] | None = Field(default=None, alias="Mode")
+    days: int | None = Field(default=None, alias="Days")
+    years: int | None = Field(default=None, alias="Years")
 
 
-class S3ObjectLockRule(BaseModel):
+class S3ObjectLockRule(S3Model):
     """S3 object lock rule."""
 
-    default_retention: S3DefaultRetention | None = None
+    model_config = ConfigDict(validate_by_name=True)
 
+    default_retention: S3DefaultRetention | None = Field(default=None, alias="DefaultRetention")
 
-class S3ObjectLockConfiguration(BaseModel):
-    """S3 object lock configuration."""
 
-    object_lock_enabled: Literal["Enabled"] | None = None
-    rule: S3ObjectLockRule | None = None
+class S3ObjectLockConfiguration(S3Model):
+    """S3 object lock configuration.
 
+    Fields are aliased by their boto3 keys, so ``model_dump(by_alias=True, exclude_none=True)``
+    gives the ``ObjectLockConfiguration`` parameter as is.
+    """
 
-class S3PutObjectLockConfigurationResponse(BaseModel):
+    model_config = ConfigDict(validate_by_name=True)
+
+    object_lock_enabled: Literal["Enabled"] | None = Field(default=None, alias="ObjectLockEnabled")
+    rule: S3ObjectLockRule | None = Field(default=None, alias="Rule")
+
+
+class S3PutObjectLockConfigurationResponse(S3Model):
     """S3 put object lock configuration response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3ObjectLockRetention(BaseModel):
+class S3ObjectLockRetention(S3Model):
     """S3 object lock retention."""
 
-    mode: Literal["GOVERNANCE", "COMPLIANCE"] | None = None
-    retain_until_date: datetime | None = None
+    model_config = ConfigDict(validate_by_name=True)
+
+    mode: Literal["GOVERNANCE", "COMPLIANCE"] | None = Field(default=None, alias="Mode")
+    retain_until_date: datetime | None = Field(default=None, alias="RetainUntilDate")
 
 
-class S3PutObjectRetentionResponse(BaseModel):
+class S3PutObjectRetentionResponse(S3Model):
     """S3 put object retention response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3CopyObjectResult(BaseModel):
+class S3CopyObjectResult(S3Model):
     """S3 copy object result."""
 
     etag: str | None = None
@@ -530,14 +641,14 @@ class S3CopyObjectResult(BaseModel):
     checksum_sha256: str | None = None
 
 
-class S3CopyObjectResponse(BaseModel):
+class S3CopyObjectResponse(S3Model):
     """S3 copy object response."""
 
     copy_object_result: S3CopyObjectResult | None = None
     copy_source_version_id: str | None = None
     expiration: str | None = None
     request_charged: Literal["requester"] | None = None
-    server_side_encryption: Literal["AES256", "aws:kms", "aws:kms:dsse"] | None = None
+    server_side_encryption: S3ServerSideEncryption | None = None
     sse_customer_algorithm: str | None = None
     sse_customer_key_md5: str | None = None
     sse_kms_key_id: str | None = None
@@ -546,39 +657,161 @@ class S3CopyObjectResponse(BaseModel):
     version_id: str | None = None
 
 
-class S3CreateBucketResponse(BaseModel):
+class S3CreateBucketResponse(S3Model):
     """S3 create bucket response."""
 
     location: str | None = None
 
 
-class S3DeleteBucketResponse(BaseModel):
+class S3DeleteBucketResponse(S3Model):
     """S3 delete bucket response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3DeleteBucketCorsResponse(BaseModel):
+class S3DeleteBucketCorsResponse(S3Model):
     """S3 delete bucket CORS response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3DeleteBucketLifecycleResponse(BaseModel):
+class S3DeleteBucketLifecycleResponse(S3Model):
     """S3 delete bucket lifecycle response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3DeleteBucketPolicyResponse(BaseModel):
+class S3DeleteBucketPolicyResponse(S3Model):
     """S3 delete bucket policy response."""
 
     request_charged: Literal["requester"] | None = None
 
 
-class S3DeleteObjectResponse(BaseModel):
+class S3DeleteObjectResponse(S3Model):
     """S3 delete object response."""
 
     delete_marker: bool | None = None
     version_id: str | None = None
     request_charged: Literal["requester"] | None = None
+
+
+class S3BatchJobManifest(S3Model):
+    """S3 Batch Operations job manifest.
+
+    Points to a CSV object that lists the objects the job operates on.
+    """
+
+    bucket: str
+    key: str
+    etag: str
+    fields: Sequence[Literal["Bucket", "Key", "VersionId"]] = ("Bucket", "Key")
+
+
+class S3BatchJobReport(S3Model):
+    """S3 Batch Operations job completion report."""
+
+    enabled: bool = False
+    bucket: str | None = None
+    prefix: str | None = None
+    report_scope: Literal["AllTasks", "FailedTasksOnly"] | None = None
+
+
+class S3BatchJobPutObjectAcl(S3Model):
+    """S3 Batch Operations put object ACL operation."""
+
+    acl: Literal[
+        "private",
+        "public-read",
+        "public-read-write",
+        "authenticated-read",
+        "aws-exec-read",
+        "bucket-owner-read",
+        "bucket-owner-full-control",
+    ]
+
+
+class S3BatchJobOperation(S3Model):
+    """S3 Batch Operations job operation.
+
+    Exactly one of the operations must be set.
+    """
+
+    put_object_acl: S3BatchJobPutObjectAcl | None = None
+    put_object_legal_hold: S3ObjectLockLegalHold | None = None
+    put_object_retention: S3ObjectLockRetention | None = None
+
+
+class S3CreateBatchJobResponse(S3Model):
+    """S3 create batch job response."""
+
+    job_id: str | None = None
+
+
+class S3PutObjectAclBulkResponse(S3Model):
+    """S3 put object ACL bulk response.
+
+    Contains either the per-object responses (small requests) or the ID of the
+    S3 Batch Operations job the request was handed to (large requests). An object
+    whose ACL could not be put gets its S3 client exception instead of a response.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    responses: Sequence[S3PutObjectAclResponse | Exception] | None = None
+    job_id: str | None = None
+
+
+class S3SelectCSVInput(S3Model):
+    """S3 Select CSV input serialization."""
+
+    file_header_info: Literal["USE", "IGNORE", "NONE"] | None = None
+    comments: str | None = None
+    quote_escape_character: str | None = None
+    record_delimiter: str | None = None
+    field_delimiter: str | None = None
+    quote_character: str | None = None
+    allow_quoted_record_delimiter: bool | None = None
+
+
+class S3SelectJSONInput(S3Model):
+    """S3 Select JSON input serialization."""
+
+    type: Literal["DOCUMENT", "LINES"]
+
+
+class S3SelectInputSerialization(S3Model):
+    """S3 Select input serialization.
+
+    Exactly one of csv_input, json_input and parquet_input must be set.
+    """
+
+    csv_input: S3SelectCSVInput | None = None
+    json_input: S3SelectJSONInput | None = None
+    parquet_input: bool = False
+    compression_type: Literal["NONE", "GZIP", "BZIP2"] | None = None
+
+
+class S3SelectCSVOutput(S3Model):
+    """S3 Select CSV output serialization."""
+
+    quote_fields: Literal["ALWAYS", "ASNEEDED"] | None = None
+    quote_escape_character: str | None = None
+    record_delimiter: str | None = None
+    field_delimiter: str | None = None
+    quote_character: str | None = None
+
+
+class S3SelectJSONOutput(S3Model):
+    """S3 Select JSON output serialization."""
+
+    record_delimiter: str | None = None
+
+
+class S3SelectOutputSerialization(S3Model):
+    """S3 Select output serialization.
+
+    Exactly one of csv_output and json_output must be set.
+    """
+
+    csv_output: S3SelectCSVOutput | None = None
+    json_output: S3SelectJSONOutput | None = None
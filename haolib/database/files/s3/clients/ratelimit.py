@@ -0,0 +1,209 @@
+"""Adaptive rate limiting for S3 clients."""
+
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
+_THROTTLE_ERROR_CODES = frozenset({"SlowDown", "503", "ServiceUnavailable", "Throttling", "ThrottlingException"})
+
+
+def is_throttle_error(error: ClientError) -> bool:
+    """Check whether a boto3 ClientError is an S3 throttling response.
+
+    Args:
+        error: The boto3 ClientError to check.
+
+    Returns:
+        True if S3 asked the client to slow down (503 SlowDown and friends).
+
+    """
+    response = error.response
+    if response.get("Error", {}).get("Code") in _THROTTLE_ERROR_CODES:
+        return True
+    return response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 503  # noqa: PLR2004
+
+
+class S3AdaptiveRateLimiter:
+    """Adaptive (AIMD) token bucket for S3 request bursts.
+
+    Requests are paced by a token bucket whose refill rate follows additive-increase /
+    multiplicative-decrease: every successful request adds ``increase_step`` to the rate,
+    and a throttling response (503 SlowDown) halves it once the rolling ratio of throttled
+    requests exceeds ``throttle_ratio_threshold``. Throttled requests are retried with full
+    jitter exponential back-off, so bursts converge to the actual per-prefix limit of S3
+    instead of compounding the storm.
+
+    One limiter is meant to be shared by every write operation of a client (and may be shared
+    between clients that hit the same prefix).
+
+    Example:
+        ```python
+        limiter = S3AdaptiveRateLimiter(on_update=lambda rate, queued: gauge.set(queued))
+        async with Aioboto3S3Client(..., rate_limiter=limiter) as client:
+            await asyncio.gather(*(client.put_object(bucket, key, body=body) for key in keys))
+        ```
+
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 100.0,
+        min_rate: float = 1.0,
+        max_rate: float = 3500.0,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        throttle_ratio_threshold: float = 0.05,
+        window_size: int = 100,
+        max_attempts: int = 5,
+        base_backoff: float = 0.05,
+        max_backoff: float = 20.0,
+        on_update: Callable[[float, int], None] | None = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            initial_rate: Initial number of requests per second.
+            min_rate: Lower bound of the request rate.
+            max_rate: Upper bound of the request rate. Defaults to the S3 per-prefix PUT limit.
+            increase_step: Requests per second added to the rate on every successful request.
+            decrease_factor: Multiplicative rate reduction applied on throttling.
+            throttle_ratio_threshold: Rolling ratio of throttled requests above which the rate is reduced.
+            window_size: Number of recent requests used to compute the throttle ratio.
+            max_attempts: Maximum number of attempts for a throttled request.
+            base_backoff: Base back-off in seconds for the first retry.
+            max_backoff: Maximum back-off in seconds.
+            on_update: Monitoring callback called with the current rate and queued depth.
+
+        """
+        self._rate = initial_rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._throttle_ratio_threshold = throttle_ratio_threshold
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._throttled = 0
+        self._max_attempts = max_attempts
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._on_update = on_update
+
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._queued = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current request rate (requests per second)."""
+        return self._rate
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a token."""
+        return self._queued
+
+    @property
+    def throttle_ratio(self) -> float:
+        """Rolling ratio of throttled requests."""
+        if not self._outcomes:
+            return 0.0
+        return self._throttled / len(self._outcomes)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        self._queued += 1
+        self._notify()
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    # The bucket holds at most one second worth of tokens.
+                    self._tokens = min(self._rate, self._tokens + (now - self._last_refill) * self._rate)
+                    self._last_refill = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+        finally:
+            self._queued -= 1
+            self._notify()
+
+    def record_success(self) -> None:
+        """Record a successful request and additively grow the rate."""
+        self._record(throttled=False)
+        self._rate = min(self._max_rate, self._rate + self._increase_step)
+        self._notify()
+
+    def record_throttle(self) -> None:
+        """Record a throttled request and multiplicatively shrink the rate if needed."""
+        self._record(throttled=True)
+        if self.throttle_ratio > self._throttle_ratio_threshold:
+            self._rate = max(self._min_rate, self._rate * self._decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+        self._notify()
+
+    def backoff(self, attempt: int) -> float:
+        """Get the jittered back-off delay for a retry attempt.
+
+        Args:
+            attempt: The retry attempt number, starting from 1.
+
+        Returns:
+            The delay in seconds.
+
+        """
+        return random.uniform(0, min(self._max_backoff, self._base_backoff * 2**attempt))  # noqa: S311
+
+    async def call[T](self, func: Callable[..., Awaitable[T]], /, **kwargs: Any) -> T:
+        """Call an S3 operation under the rate limiter.
+
+        Throttled calls are retried with jittered back-off up to ``max_attempts`` times.
+
+        Args:
+            func: The S3 operation to call.
+            **kwargs: The keyword arguments of the operation.
+
+        Returns:
+            The result of the operation.
+
+        Raises:
+            ClientError: If the operation fails with a non-throttling error or is still
+                throttled after the last attempt.
+
+        """
+        attempt = 0
+        while True:
+            await self.acquire()
+            try:
+                result = await func(**kwargs)
+            except ClientError as e:
+                if not is_throttle_error(e):
+                    raise
+                self.record_throttle()
+                attempt += 1
+                if attempt >= self._max_attempts:
+                    raise
+                await asyncio.sleep(self.backoff(attempt))
+                continue
+
+            self.record_success()
+            return result
+
+    def _record(self, throttled: bool) -> None:
+        """Push an outcome into the rolling window."""
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._throttled -= 1
+        self._outcomes.append(throttled)
+        if throttled:
+            self._throttled += 1
+
+    def _notify(self) -> None:
+        """Report the current rate and queued depth to the monitoring callback."""
+        if self._on_update is not None:
+            self._on_update(self._rate, self._queued)
@@ -0,0 +1,210 @@
+"""SigV4 query presigning for S3."""
+
+import hashlib
+import hmac
+import re
+from datetime import UTC, datetime
+from typing import Literal
+from urllib.parse import urlsplit
+
+_UNRESERVED = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~")
+
+# Map every latin-1 code point (i.e. every UTF-8 byte) to its literal or %XX form.
+# Lists are indexed directly by str.translate, which is cheaper than dict lookups.
+_S3_KEY_QUOTE = [chr(i) if i in _UNRESERVED or i == ord("/") else f"%{i:02X}" for i in range(256)]
+_S3_QUERY_QUOTE = [chr(i) if i in _UNRESERVED else f"%{i:02X}" for i in range(256)]
+
+_is_safe_key = re.compile(r"[A-Za-z0-9\-_.~/]*").fullmatch
+
+_DNS_COMPATIBLE_BUCKET = re.compile(r"^[a-z0-9][a-z0-9\-]{1,61}[a-z0-9]$")
+
+
+def quote_s3_key(key: str) -> str:
+    """Percent-encode an object key for an S3 URL path.
+
+    Equivalent to ``urllib.parse.quote(key, safe="/~")`` but done with a single
+    ``str.translate`` over the UTF-8 bytes of the key.
+
+    Args:
+        key: Object key.
+
+    Returns:
+        The encoded key.
+
+    """
+    if _is_safe_key(key):
+        return key
+    return key.encode("utf-8").decode("latin-1").translate(_S3_KEY_QUOTE)
+
+
+def quote_s3_query_value(value: str) -> str:
+    """Percent-encode a query string value the way SigV4 canonicalizes it.
+
+    Equivalent to ``urllib.parse.quote(value, safe="~")``.
+
+    Args:
+        value: Query string value.
+
+    Returns:
+        The encoded value.
+
+    """
+    return value.encode("utf-8").decode("latin-1").translate(_S3_QUERY_QUOTE)
+
+
+def _sign(key: bytes, msg: str) -> bytes:
+    """Compute HMAC-SHA256 of a message."""
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+class S3QueryPresigner:
+    """SigV4 query presigner for plain S3 object URLs.
+
+    Builds the same URLs as botocore's ``generate_presigned_url`` with the ``s3v4``
+    signature version, for the common ``(bucket, key, expires_in)`` case, without going
+    through the generic request serialization pipeline. Everything that does not depend
+    on the call (host, credential prefix, signing key for the current day) is computed once.
+
+    Only static credentials are supported, since the signing key is cached.
+    """
+
+    def __init__(
+        self,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        region_name: str,
+        aws_session_token: str | None = None,
+        endpoint_url: str | None = None,
+        use_ssl: bool = True,
+        addressing_style: Literal["auto", "virtual", "path"] = "auto",
+    ) -> None:
+        """Initialize the presigner.
+
+        Args:
+            aws_access_key_id: AWS access key ID.
+            aws_secret_access_key: AWS secret access key.
+            region_name: AWS region name.
+            aws_session_token: AWS session token.
+            endpoint_url: Custom endpoint URL. If set, path-style URLs are generated.
+            use_ssl: Whether to use SSL.
+            addressing_style: botocore's S3 addressing style. With ``auto``, DNS compatible buckets
+                are addressed on the global ``s3.amazonaws.com`` host, with ``virtual`` on the
+                regional one. Other buckets and ``path`` use path-style URLs on the regional host.
+
+        Raises:
+            ValueError: If virtual addressing is requested for a custom endpoint.
+
+        """
+        if endpoint_url and addressing_style == "virtual":
+            msg = "Virtual addressing is not supported for custom endpoints"
+            raise ValueError(msg)
+
+        self._access_key_id = aws_access_key_id
+        self._secret_key = ("AWS4" + aws_secret_access_key).encode("utf-8")
+        self._region_name = region_name
+        self._security_token = quote_s3_query_value(aws_session_token) if aws_session_token else None
+
+        self._addressing_style = addressing_style
+        if endpoint_url:
+            parts = urlsplit(endpoint_url)
+            self._scheme = parts.scheme
+            self._host: str | None = parts.netloc
+        else:
+            self._scheme = "https" if use_ssl else "http"
+            self._host = None
+        # botocore keeps the legacy global endpoint for us-east-1.
+        self._regional_host = "s3.amazonaws.com" if region_name == "us-east-1" else f"s3.{region_name}.amazonaws.com"
+        self._virtual_host_suffix = "s3.amazonaws.com" if addressing_style == "auto" else self._regional_host
+
+        self._date_stamp = ""
+        self._credential_prefix = ""
+        self._signing_key = b""
+
+    def _refresh_signing_key(self, date_stamp: str) -> None:
+        """Derive the signing key and credential scope for a day."""
+        scope = f"{date_stamp}/{self._region_name}/s3/aws4_request"
+        key = _sign(self._secret_key, date_stamp)
+        key = _sign(key, self._region_name)
+        key = _sign(key, "s3")
+        self._signing_key = _sign(key, "aws4_request")
+        self._credential_prefix = quote_s3_query_value(f"{self._access_key_id}/{scope}")
+        self._date_stamp = date_stamp
+
+    def _host_and_path(self, bucket: str, quoted_key: str) -> tuple[str, str]:
+        """Get the host and the canonical path for an object."""
+        if self._host is not None:
+            return self._host, f"/{bucket}/{quoted_key}"
+        if self._addressing_style != "path" and _DNS_COMPATIBLE_BUCKET.match(bucket) and "--" not in bucket:
+            return f"{bucket}.{self._virtual_host_suffix}", f"/{quoted_key}"
+        return self._regional_host, f"/{bucket}/{quoted_key}"
+
+    def presign_get_object(
+        self, bucket: str, key: str, expires_in: int, version_id: str | None = None, now: datetime | None = None
+    ) -> str:
+        """Generate a presigned ``GetObject`` URL.
+
+        Args:
+            bucket: Bucket name.
+            key: Object key.
+            expires_in: Expiration time in seconds.
+            version_id: Version ID of the object.
+            now: Signing time. Defaults to the current time.
+
+        Returns:
+            The presigned URL.
+
+        """
+        return self.presign("GET", bucket, key, expires_in, {"versionId": version_id} if version_id else None, now)
+
+    def presign(
+        self,
+        method: str,
+        bucket: str,
+        key: str,
+        expires_in: int,
+        params: dict[str, str] | None = None,
+        now: datetime | None = None,
+    ) -> str:
+        """Generate a presigned URL for an object request.
+
+        Args:
+            method: HTTP method.
+            bucket: Bucket name.
+            key: Object key.
+            expires_in: Expiration time in seconds.
+            params: Subresources and request parameters, e.g. ``{"legal-hold": ""}``. Their names must
+                start with a lowercase letter, so that they sort after the ``X-Amz-*`` parameters.
+            now: Signing time. Defaults to the current time.
+
+        Returns:
+            The presigned URL.
+
+        """
+        now = now or datetime.now(UTC)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        if date_stamp != self._date_stamp:
+            self._refresh_signing_key(date_stamp)
+
+        host, path = self._host_and_path(bucket, quote_s3_key(key))
+
+        # Parameters are already in canonical (byte-wise sorted) order.
+        query = (
+            f"X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Credential={self._credential_prefix}"
+            f"&X-Amz-Date={amz_date}&X-Amz-Expires={expires_in}"
+        )
+        if self._security_token is not None:
+            query += f"&X-Amz-Security-Token={self._security_token}"
+        query += "&X-Amz-SignedHeaders=host"
+        if params:
+            for name, value in sorted(params.items()):
+                query += f"&{quote_s3_query_value(name)}={quote_s3_query_value(value)}"
+
+        canonical_request = f"{method}\n{path}\n{query}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign = (
+            f"AWS4-HMAC-SHA256\n{amz_date}\n{date_stamp}/{self._region_name}/s3/aws4_request\n"
+            f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}"
+        )
+        signature = hmac.new(self._signing_key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+
+        return f"{self._scheme}://{host}{path}?{query}&X-Amz-Signature={signature}"
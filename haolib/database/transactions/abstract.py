@@ -5,7 +5,13 @@ from typing import Any, Protocol, Self
 
 
 class AbstractDatabaseTransaction[DBManipulator: Any](Protocol):
-    """Abstract database transaction."""
+    """Abstract database transaction.
+
+    Transactions are created per unit of work, so implementations should declare ``__slots__``.
+    The protocol declares empty slots, so a slotted implementation gets no instance ``__dict__``.
+    """
+
+    __slots__ = ()
 
     async def __aenter__(self) -> Self:
         """Enter the transaction."""
@@ -12,6 +12,8 @@ from haolib.database.transactions.abstract import AbstractDatabaseTransaction, D
 class SQLAlchemyTransaction(AbstractDatabaseTransaction[AsyncSession]):
     """SQLAlchemy transaction."""
 
+    __slots__ = ("_session",)
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize the transaction.
 
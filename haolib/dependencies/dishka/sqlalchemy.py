@@ -1,25 +1,70 @@
 """SQLAlchemy providers."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 
 from dishka import Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import NullPool
 
 from haolib.configs.sqlalchemy import SQLAlchemyConfig
 from haolib.database.transactions.sqlalchemy import SQLAlchemyTransaction
 
 
+async def _warm_up_pool(engine: AsyncEngine, size: int) -> None:
+    """Open ``size`` pooled connections concurrently and return them to the pool.
+
+    Args:
+        engine (AsyncEngine): The db engine.
+        size (int): The number of connections to open.
+
+    """
+    results = await asyncio.gather(*(engine.connect().start() for _ in range(size)), return_exceptions=True)
+    await asyncio.gather(*(result.close() for result in results if isinstance(result, AsyncConnection)))
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 class SQLAlchemyProvider(Provider):
     """SQLAlchemy provider."""
 
     @provide(scope=Scope.APP)
-    async def db_engine(self, sqlalchemy_config: SQLAlchemyConfig) -> AsyncEngine:
-        """Get db engine."""
-        if sqlalchemy_config.use_pool:
-            return create_async_engine(sqlalchemy_config.url)
+    async def db_engine(self, sqlalchemy_config: SQLAlchemyConfig) -> AsyncGenerator[AsyncEngine]:
+        """Get db engine.
+
+        The pooled connections are opened upfront if pool_warmup is set, and closed when the container is closed.
 
-        return create_async_engine(sqlalchemy_config.url, poolclass=NullPool)
+        Args:
+            sqlalchemy_config (SQLAlchemyConfig): The sqlalchemy configuration.
+
+        Returns:
+            AsyncEngine: The db engine.
+
+        """
+        if sqlalchemy_config.use_pool:
+            engine = create_async_engine(
+                sqlalchemy_config.url,
+                pool_size=sqlalchemy_config.pool_size,
+                max_overflow=sqlalchemy_config.max_overflow,
+                pool_timeout=sqlalchemy_config.pool_timeout,
+                pool_recycle=sqlalchemy_config.pool_recycle,
+                pool_pre_ping=sqlalchemy_config.pool_pre_ping,
+            )
+        else:
+            engine = create_async_engine(sqlalchemy_config.url, poolclass=NullPool)
+        try:
+            if sqlalchemy_config.use_pool and sqlalchemy_config.pool_warmup:
+                await _warm_up_pool(engine, sqlalchemy_config.pool_size)
+            yield engine
+        finally:
+            await engine.dispose()
 
     @provide(scope=Scope.APP)
     async def db_session_maker(self, db_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -4,10 +4,18 @@ import abc
 
 
 class HasId[T_Id](abc.ABC):
-    """Has id."""
+    """Has id.
+
+    The entity base classes declare empty ``__slots__``, so subclasses that declare their own
+    ``__slots__`` get instances without a ``__dict__``.
+    """
+
+    __slots__ = ()
 
     id: T_Id
 
 
 class BaseEntity[T_Id](HasId[T_Id], abc.ABC):
     """Entity."""
+
+    __slots__ = ()
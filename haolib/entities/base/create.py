@@ -1,6 +1,7 @@
 """Entities create."""
 
 import abc
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from haolib.batches.batch import Batch
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 class BaseEntityCreate[T_Id, T_Entity: BaseEntity](abc.ABC):
     """Base entity create."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     async def create_entity(self, *args: Any, **kwargs: Any) -> T_Entity:
         """Create entity and return the created entity."""
@@ -25,9 +28,66 @@ class BaseBulkEntityCreate[T_Id, T_Entity: BaseEntity, T_EntityCreate: BaseEntit
     async def get_entity_creates(self) -> Iterable[T_EntityCreate]:
         """Get entities to create."""
 
-    async def create_batch(self, *args: Any, **kwargs: Any) -> Batch[T_Id, T_Entity]:
-        """Create entities and return batch of the created entities."""
+    async def create_batch(self, *args: Any, concurrency_limit: int = 1, **kwargs: Any) -> Batch[T_Id, T_Entity]:
+        """Create entities and return batch of the created entities.
+
+        Args:
+            *args: Arguments passed to ``create_entities``.
+            concurrency_limit: Maximum number of ``create_entity`` calls running at once. Defaults to 1,
+                i.e. one after another. Raise it only if the arguments (e.g. a database session)
+                can be used by concurrent calls. It is passed to ``create_entities`` only if it is
+                not 1, so overrides that create all the entities at once need not accept it.
+            **kwargs: Keyword arguments passed to ``create_entities``.
+
+        Raises:
+            ValueError: If ``concurrency_limit`` is less than 1.
+
+        """
+        if concurrency_limit < 1:
+            msg = f"concurrency_limit must be at least 1, got {concurrency_limit}."
+            raise ValueError(msg)
+        if concurrency_limit != 1:
+            kwargs["concurrency_limit"] = concurrency_limit
+        entities = await self.create_entities(await self.get_entity_creates(), *args, **kwargs)
+        return Batch[T_Id, T_Entity](key_getter=lambda entity: entity.id).merge_list(entities)
+
+    async def create_entities(
+        self, entity_creates: Iterable[T_EntityCreate], *args: Any, concurrency_limit: int = 1, **kwargs: Any
+    ) -> list[T_Entity]:
+        """Create entities, in the order of the entity creates.
+
+        Calls ``create_entity`` of every entity create. Override it to create all the entities in a single
+        round trip instead, e.g. with one multi-row ``INSERT ... RETURNING``.
+
+        Args:
+            entity_creates: The entity creates.
+            *args: Arguments passed to every ``create_entity`` call.
+            concurrency_limit: Maximum number of ``create_entity`` calls running at once.
+            **kwargs: Keyword arguments passed to every ``create_entity`` call.
+
+        Returns:
+            The created entities.
+
+        Raises:
+            ValueError: If ``concurrency_limit`` is less than 1.
+
+        """
+        if concurrency_limit < 1:
+            msg = f"concurrency_limit must be at least 1, got {concurrency_limit}."
+            raise ValueError(msg)
+        if concurrency_limit == 1:
+            return [await entity_create.create_entity(*args, **kwargs) for entity_create in entity_creates]
+
+        semaphore = asyncio.Semaphore(concurrency_limit)
+
+        async def create_entity(entity_create: T_EntityCreate) -> T_Entity:
+            async with semaphore:
+                return await entity_create.create_entity(*args, **kwargs)
 
-        return Batch[T_Id, T_Entity](key_getter=lambda entity: entity.id).merge_list(
-            [await entity_create.create_entity(*args, **kwargs) for entity_create in await self.get_entity_creates()]
-        )
+        # The calls usually share a session, so a failed one cancels the others and its error is raised.
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(create_entity(entity_create)) for entity_create in entity_creates]
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
+        return [task.result() for task in tasks]
@@ -2,6 +2,7 @@
 
 import abc
 from collections.abc import Iterable
+from typing import Any
 
 from haolib.entities.base import BaseEntity, HasId
 
@@ -9,6 +10,8 @@ from haolib.entities.base import BaseEntity, HasId
 class BaseEntityDelete[T_Id, T_Entity: BaseEntity](HasId[T_Id], abc.ABC):
     """Base entity delete."""
 
+    __slots__ = ()
+
 
 class BaseBulkEntityDelete[T_Id, T_Entity: BaseEntity, T_EntityDelete: BaseEntityDelete](abc.ABC):
     """Base bulk entity delete."""
@@ -16,3 +19,32 @@ class BaseBulkEntityDelete[T_Id, T_Entity: BaseEntity, T_EntityDelete: BaseEntit
     @abc.abstractmethod
     async def get_entity_deletes(self) -> Iterable[T_EntityDelete]:
         """Get entities to delete."""
+
+
+class BaseBatchEntityDelete[T_Id, T_Entity: BaseEntity, T_EntityDelete: BaseEntityDelete](
+    BaseBulkEntityDelete[T_Id, T_Entity, T_EntityDelete]
+):
+    """Base bulk entity delete that deletes the entities in batches of ids."""
+
+    @abc.abstractmethod
+    async def delete_entities(self, entity_ids: list[T_Id], *args: Any, **kwargs: Any) -> int:
+        """Delete the entities with the given ids and return the number of deleted entities.
+
+        Delete all of them in a single round trip, e.g. with one ``DELETE ... WHERE id IN (...)``.
+        """
+
+    async def delete_batch(self, *args: Any, chunk_size: int = 1000, **kwargs: Any) -> int:
+        """Delete entities and return the number of deleted entities.
+
+        Args:
+            *args: Arguments passed to every ``delete_entities`` call.
+            chunk_size: Maximum number of ids passed to one ``delete_entities`` call, which keeps
+                the statements under the bind parameter limits of the database drivers.
+            **kwargs: Keyword arguments passed to every ``delete_entities`` call.
+
+        """
+        entity_ids = [entity_delete.id for entity_delete in await self.get_entity_deletes()]
+        deleted = 0
+        for start in range(0, len(entity_ids), chunk_size):
+            deleted += await self.delete_entities(entity_ids[start : start + chunk_size], *args, **kwargs)
+        return deleted
@@ -7,5 +7,7 @@ from datetime import datetime
 class DateTimeEntity(abc.ABC):
     """DateTime mixin."""
 
+    __slots__ = ()
+
     created_at: datetime
     updated_at: datetime
@@ -10,6 +10,8 @@ from haolib.entities.base import BaseEntity
 class BaseEntityRead[T_Id, T_Entity: BaseEntity](abc.ABC):
     """Base entity read."""
 
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     async def from_entity(cls, entity: T_Entity, *args: Any, **kwargs: Any) -> Self:
@@ -1,6 +1,7 @@
 """Entities update."""
 
 import abc
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from haolib.batches.batch import Batch
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 class BaseEntityUpdate[T_Id, T_Entity: BaseEntity](HasId[T_Id], abc.ABC):
     """Base entity update."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     async def update_entity(self, entity: T_Entity, *args: Any, **kwargs: Any) -> T_Entity:
         """Update entity and return the updated entity."""
@@ -29,15 +32,49 @@ class BaseBulkEntityUpdate[T_Id, T_Entity: BaseEntity, T_EntityUpdate: BaseEntit
         self,
         batch: Batch[T_Id, T_Entity],
         *args: Any,
+        concurrency_limit: int = 1,
         **kwargs: Any,
     ) -> Batch[T_Id, T_Entity]:
-        """Update entities in batch and return the updated batch."""
+        """Update entities in batch and return the updated batch.
+
+        Args:
+            batch: The entities to update.
+            *args: Arguments passed to every ``update_entity`` call.
+            concurrency_limit: Maximum number of ``update_entity`` calls running at once. Defaults to 1,
+                i.e. one after another. Raise it only if the arguments (e.g. a database session)
+                can be used by concurrent calls.
+            **kwargs: Keyword arguments passed to every ``update_entity`` call.
+
+        Raises:
+            ValueError: If ``concurrency_limit`` is less than 1.
 
-        return Batch[T_Id, T_Entity](key_getter=lambda entity: entity.id).merge_list(
-            [
+        """
+        if concurrency_limit < 1:
+            msg = f"concurrency_limit must be at least 1, got {concurrency_limit}."
+            raise ValueError(msg)
+        entity_updates = await self.get_entity_updates()
+        if concurrency_limit == 1:
+            entities = [
                 await entity_update.update_entity(
                     batch.get_by_key(entity_update.id, exception=ValueError), *args, **kwargs
                 )
-                for entity_update in await self.get_entity_updates()
+                for entity_update in entity_updates
             ]
-        )
+        else:
+            semaphore = asyncio.Semaphore(concurrency_limit)
+
+            async def update_entity(entity_update: T_EntityUpdate) -> T_Entity:
+                async with semaphore:
+                    return await entity_update.update_entity(
+                        batch.get_by_key(entity_update.id, exception=ValueError), *args, **kwargs
+                    )
+
+            # The calls usually share a session, so a failed one cancels the others and its error is raised.
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [task_group.create_task(update_entity(entity_update)) for entity_update in entity_updates]
+            except ExceptionGroup as e:
+                raise e.exceptions[0] from None
+            entities = [task.result() for task in tasks]
+
+        return Batch[T_Id, T_Entity](key_getter=lambda entity: entity.id).merge_list(entities)
@@ -1,11 +1,115 @@
 """Entrypoints for the application."""
 
-from asyncio import TaskGroup
+import multiprocessing
+import signal
+from asyncio import (
+    CancelledError,
+    TaskGroup,
+    current_task,
+    gather,
+    get_running_loop,
+    run,
+)
 from collections.abc import Sequence
-from typing import Self
+from contextlib import suppress
+from threading import Thread
+from typing import TYPE_CHECKING, NoReturn, Self
 
 from haolib.entrypoints.abstract import AbstractEntrypoint
 
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+
+def _raise_errors(message: str, errors: list[BaseException]) -> NoReturn:
+    """Raise a single error as is, or several errors in an exception group.
+
+    Errors that are not exceptions, like cancellation, are raised as is before any others.
+    """
+    exceptions: list[Exception] = []
+    for error in errors:
+        if not isinstance(error, Exception):
+            raise error
+        exceptions.append(error)
+
+    if len(exceptions) == 1:
+        raise exceptions[0]
+
+    raise ExceptionGroup(message, exceptions)
+
+
+async def _run_entrypoint_lifecycle(entrypoint: AbstractEntrypoint) -> None:
+    """Start up, run and shut down an entrypoint, cancelling the run on SIGTERM."""
+    task = current_task()
+    if task is not None:
+        # Signal handlers are not supported by the event loops on Windows.
+        with suppress(NotImplementedError):
+            get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+
+    await entrypoint.startup()
+    try:
+        await entrypoint.run()
+    finally:
+        await entrypoint.shutdown()
+
+
+def _run_entrypoint_process(entrypoint: AbstractEntrypoint) -> None:
+    """Run the full lifecycle of an entrypoint in its own event loop, in a child process."""
+    with suppress(CancelledError):
+        run(_run_entrypoint_lifecycle(entrypoint))
+
+
+async def _wait_for_process(process: BaseProcess) -> None:
+    """Wait for a child process to exit without blocking the event loop or its default executor."""
+    loop = get_running_loop()
+    exited = loop.create_future()
+
+    def set_exited() -> None:
+        if not exited.done():
+            exited.set_result(None)
+
+    try:
+        loop.add_reader(process.sentinel, set_exited)
+    except NotImplementedError:
+        # Proactor event loops on Windows cannot watch the sentinel, so a dedicated thread waits instead.
+        def join() -> None:
+            process.join()
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(set_exited)
+
+        Thread(target=join, daemon=True).start()
+        await exited
+    else:
+        try:
+            await exited
+        finally:
+            loop.remove_reader(process.sentinel)
+
+    process.join()
+
+
+async def _run_in_process(entrypoint: AbstractEntrypoint) -> None:
+    """Run an entrypoint in a child process and wait for it to exit.
+
+    The child process is terminated if the waiting task is cancelled.
+
+    Raises:
+        ChildProcessError: If the child process exits with a non-zero exit code.
+
+    """
+    process = multiprocessing.Process(target=_run_entrypoint_process, args=(entrypoint,))
+    process.start()
+    try:
+        await _wait_for_process(process)
+    finally:
+        if process.is_alive():
+            process.terminate()
+            await _wait_for_process(process)
+
+    if process.exitcode:
+        msg = f"Entrypoint process exited with code {process.exitcode}"
+        raise ChildProcessError(msg)
+
 
 class HAOrchestrator:
     """HAOrchestrator allows you to create a HAO (Humanlessly Autonomously Orchestrated) application.
@@ -16,9 +120,13 @@ class HAOrchestrator:
 
     Lifecycle:
         1. Validation - Validates all entrypoints before starting
-        2. Startup - Calls startup() on all entrypoints in order
+        2. Startup - Calls startup() on all entrypoints concurrently
         3. Execution - Runs all entrypoints concurrently using TaskGroup
-        4. Shutdown - Calls shutdown() on all entrypoints in reverse order
+        4. Shutdown - Calls shutdown() on all entrypoints concurrently
+
+    Entrypoints added with ``process_isolated=True`` go through the whole lifecycle in a
+    child process with its own event loop instead, so CPU-bound work in them does not
+    starve the other entrypoints.
 
     Example:
         ```python
@@ -36,19 +144,37 @@ class HAOrchestrator:
         ```
 
     Attributes:
-        _entrypoints: List of entrypoints to orchestrate.
+        _entrypoints: List of entrypoints to orchestrate, each with whether it runs in a child process.
+        _eager_tasks: Whether the entrypoint tasks start eagerly.
 
     """
 
-    def __init__(self) -> None:
-        """Initialize the HAOrchestrator."""
-        self._entrypoints: list[AbstractEntrypoint] = []
+    def __init__(self, *, eager_tasks: bool = False) -> None:
+        """Initialize the HAOrchestrator.
+
+        Args:
+            eager_tasks: Whether to start the tasks running the entrypoints eagerly. Each entrypoint
+                then runs synchronously until its first suspension as soon as its task is created,
+                instead of on the next event loop iteration. Tasks created by the entrypoints
+                themselves and the event loop's task factory are left as they are. Defaults to False.
+
+        """
+        self._entrypoints: list[tuple[AbstractEntrypoint, bool]] = []
+        self._eager_tasks = eager_tasks
 
-    def add_entrypoint(self, entrypoint: AbstractEntrypoint) -> Self:
+    def add_entrypoint(self, entrypoint: AbstractEntrypoint, *, process_isolated: bool = False) -> Self:
         """Add an entrypoint to be orchestrated.
 
         Args:
             entrypoint: The entrypoint to add. Must implement AbstractEntrypoint protocol.
+            process_isolated: Whether to run the entrypoint in a child process. Add the entrypoint
+                several times to run it in several processes. Defaults to False.
+
+                Unless multiprocessing uses the fork start method, the entrypoint is pickled when
+                its process starts. Spawn and forkserver are the defaults on Windows, macOS and,
+                from Python 3.14, Linux, so such an entrypoint must not hold state that cannot be
+                pickled, like a DI container, a lock or an open connection; create it in
+                ``startup()`` instead. Otherwise ``run_entrypoints()`` fails when the process starts.
 
         Returns:
             Self for method chaining.
@@ -63,26 +189,28 @@ class HAOrchestrator:
             ```
 
         """
-        self._entrypoints.append(entrypoint)
+        self._entrypoints.append((entrypoint, process_isolated))
         return self
 
-    async def run_entrypoints(self, entrypoints: Sequence[AbstractEntrypoint] | None = None) -> None:  # noqa: C901
+    async def run_entrypoints(self, entrypoints: Sequence[AbstractEntrypoint] | None = None) -> None:
         """Run the entrypoints with full lifecycle management.
 
         Orchestrates entrypoints through their complete lifecycle:
         1. Validates all entrypoints
-        2. Calls startup() on all entrypoints
+        2. Calls startup() on all entrypoints concurrently
         3. Runs all entrypoints concurrently
-        4. Calls shutdown() on all entrypoints (even if errors occur)
+        4. Calls shutdown() on all entrypoints concurrently (even if errors occur)
 
         Args:
             entrypoints: Optional list of entrypoints to run. If None, uses
                 entrypoints added via add_entrypoint(). If provided, replaces
-                any previously added entrypoints.
+                any previously added entrypoints and runs all of them in this process.
 
         Raises:
             EntrypointInconsistencyError: If any entrypoint validation fails.
-            ExceptionGroup: If multiple entrypoints fail during execution.
+            ExceptionGroup: If several entrypoints fail in the same phase. A single failure is
+                raised as is.
+            ChildProcessError: If a process-isolated entrypoint exits with a non-zero exit code.
 
         Example:
             ```python
@@ -98,45 +226,62 @@ class HAOrchestrator:
         """
         # Use provided entrypoints or previously added ones
         if entrypoints is not None:
-            self._entrypoints = list(entrypoints)
+            self._entrypoints = [(entrypoint, False) for entrypoint in entrypoints]
 
         if not self._entrypoints:
             return
 
-        # Startup phase - initialize all entrypoints
-        startup_errors: list[Exception] = []
-        for entrypoint in self._entrypoints:
-            try:
-                await entrypoint.startup()
-            except Exception as e:
-                startup_errors.append(e)
+        # Process-isolated entrypoints start up and shut down in their own process
+        in_process_entrypoints = [
+            entrypoint for entrypoint, process_isolated in self._entrypoints if not process_isolated
+        ]
+
+        # Startup phase - initialize all entrypoints, overlapping their I/O
+        startup_results = await gather(
+            *(entrypoint.startup() for entrypoint in in_process_entrypoints), return_exceptions=True
+        )
+        startup_errors = [result for result in startup_results if isinstance(result, BaseException)]
 
         if startup_errors:
-            # Shutdown any entrypoints that started successfully
-            for entrypoint in reversed(self._entrypoints[: len(startup_errors)]):
-                startup_shutdown_errors: list[Exception] = []
-                try:
-                    await entrypoint.shutdown()
-                except Exception as e:
-                    startup_shutdown_errors.append(e)
+            # Shutdown only the entrypoints that started successfully
+            started_entrypoints = [
+                entrypoint
+                for entrypoint, result in zip(in_process_entrypoints, startup_results, strict=True)
+                if not isinstance(result, BaseException)
+            ]
+            startup_shutdown_results = await gather(
+                *(entrypoint.shutdown() for entrypoint in reversed(started_entrypoints)), return_exceptions=True
+            )
+            startup_shutdown_errors = [
+                result for result in startup_shutdown_results if isinstance(result, BaseException)
+            ]
 
             if startup_shutdown_errors:
-                raise ExceptionGroup("Errors during startup and shutdown", startup_errors + startup_shutdown_errors)
+                _raise_errors("Errors during startup and shutdown", startup_errors + startup_shutdown_errors)
 
-            raise ExceptionGroup("Errors during startup", startup_errors)
+            _raise_errors("Errors during startup", startup_errors)
 
         # Execution phase - run all entrypoints concurrently
-        async with TaskGroup() as task_group:
-            for entrypoint in self._entrypoints:
-                task_group.create_task(entrypoint.run())
-
-        # Shutdown phase - cleanup all entrypoints (reverse order)
-        shutdown_errors: list[Exception] = []
-        for entrypoint in reversed(self._entrypoints):
-            try:
-                await entrypoint.shutdown()
-            except Exception as e:
-                shutdown_errors.append(e)
+        # eager_start is only passed when enabled, so the loop's own task factory applies otherwise
+        task_kwargs = {"eager_start": True} if self._eager_tasks else {}
+        try:
+            async with TaskGroup() as task_group:
+                for entrypoint, process_isolated in self._entrypoints:
+                    if process_isolated:
+                        task_group.create_task(_run_in_process(entrypoint), **task_kwargs)
+                    else:
+                        task_group.create_task(entrypoint.run(), **task_kwargs)
+        except BaseExceptionGroup as e:
+            if len(e.exceptions) == 1:
+                raise e.exceptions[0] from None
+
+            raise
+
+        # Shutdown phase - cleanup all entrypoints, overlapping their I/O
+        shutdown_results = await gather(
+            *(entrypoint.shutdown() for entrypoint in reversed(in_process_entrypoints)), return_exceptions=True
+        )
+        shutdown_errors = [result for result in shutdown_results if isinstance(result, BaseException)]
 
         if shutdown_errors:
-            raise ExceptionGroup("Errors during shutdown", shutdown_errors)
+            _raise_errors("Errors during shutdown", shutdown_errors)
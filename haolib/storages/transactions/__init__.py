@@ -18,6 +18,8 @@ class Transaction(Protocol):
     Transactions are now internal to storage implementations.
     """
 
+    __slots__ = ()
+
     async def __aenter__(self) -> Self:
         """Enter transaction context."""
         ...
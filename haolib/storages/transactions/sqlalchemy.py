@@ -15,6 +15,8 @@ class SQLAlchemyStorageTransaction(Transaction):
     Wraps AsyncSession to provide Transaction protocol.
     """
 
+    __slots__ = ("_in_transaction", "_session")
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize the transaction.
 
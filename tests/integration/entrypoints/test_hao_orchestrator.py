@@ -3,7 +3,12 @@
 import asyncio
 import contextlib
 import io
+import multiprocessing
+import os
+import threading
 from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Self
 from unittest.mock import MagicMock, patch
 
@@ -31,6 +36,68 @@ def _create_mock_stdio() -> MagicMock:
     return mock_stdio
 
 
+class PidRecordingEntrypoint:
+    """Entrypoint that records the pid of the process running each lifecycle step."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    async def startup(self) -> None:
+        """Record the startup."""
+        (self.path / f"startup-{os.getpid()}").touch()
+
+    async def run(self) -> None:
+        """Record the run."""
+        (self.path / f"run-{os.getpid()}").touch()
+
+    async def shutdown(self) -> None:
+        """Record the shutdown."""
+        (self.path / f"shutdown-{os.getpid()}").touch()
+
+
+def _recorded_steps(path: Path) -> list[tuple[str, str]]:
+    """Get the recorded lifecycle steps with the pids that ran them."""
+    return [tuple(entry.name.split("-")) for entry in path.iterdir()]  # type: ignore[misc]
+
+
+class StartupFailingEntrypoint:
+    """Entrypoint that records its shutdown and optionally fails on startup."""
+
+    def __init__(self, *, fail: bool = False, error_type: type[BaseException] = EntrypointInconsistencyError) -> None:
+        self.fail = fail
+        self.error_type = error_type
+        self.shut_down = False
+
+    async def startup(self) -> None:
+        """Start up, failing if requested."""
+        if self.fail:
+            raise self.error_type("Startup failed")
+
+    async def run(self) -> None:
+        """Run."""
+
+    async def shutdown(self) -> None:
+        """Record the shutdown."""
+        self.shut_down = True
+
+
+@dataclass
+class DataclassEntrypoint:
+    """Unhashable entrypoint, since dataclasses with eq set __hash__ to None."""
+
+    ran: bool = False
+
+    async def startup(self) -> None:
+        """Start up."""
+
+    async def run(self) -> None:
+        """Record the run."""
+        self.ran = True
+
+    async def shutdown(self) -> None:
+        """Shut down."""
+
+
 class TestHAOInitialization:
     """Test HAO initialization."""
 
@@ -191,6 +258,41 @@ class TestHAORunEntrypoints:
         # The exact state depends on implementation, but shutdown should be idempotent
 
 
+class TaskFactoryRecordingEntrypoint:
+    """Entrypoint that records the task factory of the loop it runs on."""
+
+    def __init__(self) -> None:
+        self.task_factory: Any = None
+
+    async def startup(self) -> None:
+        """Start up."""
+
+    async def run(self) -> None:
+        """Record the task factory."""
+        self.task_factory = asyncio.get_running_loop().get_task_factory()
+
+    async def shutdown(self) -> None:
+        """Shut down."""
+
+
+class TestHAOEagerTasks:
+    """Test HAO eager task execution."""
+
+    @pytest.mark.asyncio
+    async def test_eager_tasks_starts_entrypoint_tasks_eagerly(self) -> None:
+        """Test that eager_tasks starts the entrypoint tasks eagerly without changing the loop's task factory."""
+        entrypoint = TaskFactoryRecordingEntrypoint()
+        task_factory = asyncio.get_running_loop().get_task_factory()
+
+        with patch.object(
+            asyncio.TaskGroup, "create_task", autospec=True, side_effect=asyncio.TaskGroup.create_task
+        ) as create_task:
+            await HAOrchestrator(eager_tasks=True).run_entrypoints([entrypoint])  # type: ignore[list-item]
+
+        assert [call.kwargs for call in create_task.call_args_list] == [{"eager_start": True}]
+        assert entrypoint.task_factory is task_factory
+
+
 class TestHAOErrorHandling:
     """Test HAO error handling."""
 
@@ -220,10 +322,88 @@ class TestHAOErrorHandling:
         invalid_entrypoint: AbstractEntrypoint = InvalidEntrypoint()  # type: ignore[assignment]
         hao = HAOrchestrator()
 
-        with pytest.raises(ExceptionGroup) as exc_info:
+        # A single startup error is raised as is
+        with pytest.raises(EntrypointInconsistencyError, match="Invalid configuration"):
             await hao.run_entrypoints([invalid_entrypoint])
 
-        # Verify that the ExceptionGroup contains EntrypointInconsistencyError
-        assert len(exc_info.value.exceptions) == 1
-        assert isinstance(exc_info.value.exceptions[0], EntrypointInconsistencyError)
-        assert str(exc_info.value.exceptions[0]) == "Invalid configuration"
+    @pytest.mark.asyncio
+    async def test_run_entrypoints_shuts_down_only_started_entrypoints_on_startup_error(self) -> None:
+        """Test that a startup error shuts down exactly the entrypoints that started."""
+        entrypoints = [StartupFailingEntrypoint(), StartupFailingEntrypoint(), StartupFailingEntrypoint(fail=True)]
+
+        with pytest.raises(EntrypointInconsistencyError):
+            await HAOrchestrator().run_entrypoints(entrypoints)  # type: ignore[arg-type]
+
+        assert [entrypoint.shut_down for entrypoint in entrypoints] == [True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_run_entrypoints_groups_multiple_startup_errors(self) -> None:
+        """Test that several startup errors are raised in an exception group."""
+        entrypoints = [StartupFailingEntrypoint(fail=True), StartupFailingEntrypoint(fail=True)]
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await HAOrchestrator().run_entrypoints(entrypoints)  # type: ignore[arg-type]
+
+        assert len(exc_info.value.exceptions) == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_run_entrypoints_reraises_startup_cancellation_after_rollback(self) -> None:
+        """Test that a startup cancellation rolls back the started entrypoints and is raised as is."""
+        entrypoints = [
+            StartupFailingEntrypoint(),
+            StartupFailingEntrypoint(fail=True),
+            StartupFailingEntrypoint(fail=True, error_type=asyncio.CancelledError),
+        ]
+
+        with pytest.raises(asyncio.CancelledError):
+            await HAOrchestrator().run_entrypoints(entrypoints)  # type: ignore[arg-type]
+
+        assert [entrypoint.shut_down for entrypoint in entrypoints] == [True, False, False]
+
+
+class TestHAOProcessIsolation:
+    """Test HAO process-isolated entrypoints."""
+
+    @pytest.mark.asyncio
+    async def test_process_isolated_entrypoint_runs_in_child_process(self, tmp_path: Path) -> None:
+        """Test that the whole lifecycle of a process-isolated entrypoint runs in a child process."""
+        entrypoint: AbstractEntrypoint = PidRecordingEntrypoint(tmp_path)  # type: ignore[assignment]
+
+        await HAOrchestrator().add_entrypoint(entrypoint, process_isolated=True).run_entrypoints()
+
+        steps = _recorded_steps(tmp_path)
+        pids = {pid for _, pid in steps}
+        assert {step for step, _ in steps} == {"startup", "run", "shutdown"}
+        assert len(pids) == 1
+        assert str(os.getpid()) not in pids
+
+    @pytest.mark.asyncio
+    async def test_unhashable_entrypoints_run(self) -> None:
+        """Test that entrypoints do not need to be hashable, whether they are process-isolated or not."""
+        entrypoint = DataclassEntrypoint()
+        isolated_entrypoint = DataclassEntrypoint()
+
+        await (
+            HAOrchestrator()
+            .add_entrypoint(entrypoint)  # type: ignore[arg-type]
+            .add_entrypoint(isolated_entrypoint, process_isolated=True)  # type: ignore[arg-type]
+            .run_entrypoints()
+        )
+
+        assert entrypoint.ran
+        # The isolated entrypoint ran on a copy in the child process
+        assert not isolated_entrypoint.ran
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_process_isolated_entrypoint_fails_to_start(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an entrypoint holding unpicklable state fails when its process is spawned."""
+        entrypoint = PidRecordingEntrypoint(tmp_path)
+        entrypoint.lock = threading.Lock()  # type: ignore[attr-defined]
+        monkeypatch.setattr("haolib.entrypoints.multiprocessing", multiprocessing.get_context("spawn"))
+
+        with pytest.raises(TypeError, match="pickle"):
+            await HAOrchestrator().add_entrypoint(entrypoint, process_isolated=True).run_entrypoints()  # type: ignore[arg-type]
+
+        assert _recorded_steps(tmp_path) == []
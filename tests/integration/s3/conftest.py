@@ -1,8 +1,13 @@
 """Conftest for S3 tests."""
 
+import asyncio
+import json
+import os
 import urllib.parse
-from collections.abc import AsyncGenerator
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
 from datetime import UTC, datetime
+from pathlib import Path
 from types import TracebackType
 from typing import Any, Literal, Self
 
@@ -14,6 +19,7 @@ from haolib.database.files.s3.clients.abstract import (
     AbstractS3Client,
     S3BucketAlreadyExistsClientException,
     S3BucketNotEmptyClientException,
+    S3InvalidRequestClientException,
     S3NoSuchBucketClientException,
     S3NoSuchCORSConfigurationClientException,
     S3NoSuchKeyClientException,
@@ -25,11 +31,15 @@ from haolib.database.files.s3.clients.aioboto3 import (
 )
 from haolib.database.files.s3.clients.pydantic import (
     S3AccessControlPolicy,
+    S3BatchJobManifest,
+    S3BatchJobOperation,
+    S3BatchJobReport,
     S3Bucket,
     S3CopyObjectResponse,
     S3CopyObjectResult,
     S3CORSConfiguration,
     S3CORSRule,
+    S3CreateBatchJobResponse,
     S3CreateBucketConfiguration,
     S3CreateBucketResponse,
     S3DefaultRetention,
@@ -48,6 +58,7 @@ from haolib.database.files.s3.clients.pydantic import (
     S3GetBucketPolicyResponse,
     S3GetObjectAclResponse,
     S3GetObjectResponse,
+    S3GetObjectStreamResponse,
     S3LifecycleConfiguration,
     S3LifecycleExpiration,
     S3LifecycleRule,
@@ -73,6 +84,8 @@ from haolib.database.files.s3.clients.pydantic import (
     S3PutObjectLockConfigurationResponse,
     S3PutObjectResponse,
     S3PutObjectRetentionResponse,
+    S3SelectInputSerialization,
+    S3SelectOutputSerialization,
 )
 from tests.integration.conftest import MockAppConfig
 
@@ -195,6 +208,34 @@ class MockS3Client(AbstractS3Client):
             version_id="mock-version-id",
         )
 
+    async def create_batch_job(
+        self,
+        operation: S3BatchJobOperation,
+        manifest: S3BatchJobManifest,
+        role_arn: str,
+        account_id: str | None = None,
+        report: S3BatchJobReport | None = None,
+        priority: int = 10,
+        confirmation_required: bool = False,
+        client_request_token: str | None = None,
+        description: str | None = None,
+    ) -> S3CreateBatchJobResponse:
+        """Create batch job (runs the job synchronously)."""
+        if (manifest.bucket, manifest.key) not in self._objects:
+            raise S3NoSuchKeyClientException(f"Object {manifest.key} does not exist in bucket {manifest.bucket}")
+
+        for line in self._objects[(manifest.bucket, manifest.key)]["body"].decode("utf-8").splitlines():
+            bucket, key = line.split(",")[:2]
+            key = urllib.parse.unquote(key)
+            if operation.put_object_acl:
+                await self.put_object_acl(bucket, key, acl=operation.put_object_acl.acl)
+            if operation.put_object_legal_hold:
+                await self.put_object_legal_hold(bucket, key, legal_hold=operation.put_object_legal_hold)
+            if operation.put_object_retention:
+                await self.put_object_retention(bucket, key, retention=operation.put_object_retention)
+
+        return S3CreateBatchJobResponse(job_id=str(uuid.uuid4()))
+
     async def create_bucket(
         self,
         bucket: str,
@@ -402,6 +443,15 @@ class MockS3Client(AbstractS3Client):
 
         return self._bucket_policies[bucket]
 
+    async def get_bucket_policy_parsed(
+        self,
+        bucket: str,
+        expected_bucket_owner: str | None = None,
+    ) -> dict[str, Any]:
+        """Get bucket policy as a parsed JSON document."""
+        response = await self.get_bucket_policy(bucket, expected_bucket_owner)
+        return json.loads(response.policy or "{}")
+
     async def get_object(
         self,
         bucket: str,
@@ -441,6 +491,53 @@ class MockS3Client(AbstractS3Client):
             content_type=obj.get("content_type", "application/octet-stream"),
         )
 
+    async def get_object_stream(
+        self,
+        bucket: str,
+        key: str,
+        if_match: str | None = None,
+        if_modified_since: datetime | None = None,
+        if_none_match: str | None = None,
+        if_unmodified_since: datetime | None = None,
+        range_header: str | None = None,
+        response_cache_control: str | None = None,
+        response_content_disposition: str | None = None,
+        response_content_encoding: str | None = None,
+        response_content_language: str | None = None,
+        response_content_type: str | None = None,
+        response_expires: datetime | None = None,
+        version_id: str | None = None,
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        request_payer: Literal["requester", "requester_payer"] | None = None,
+        expected_bucket_owner: str | None = None,
+        checksum_mode: Literal["ENABLED"] | None = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> S3GetObjectStreamResponse:
+        """Get an object with a streamed body."""
+        response = await self.get_object(bucket, key)
+
+        async def iter_body() -> AsyncIterator[bytes]:
+            for offset in range(0, len(response.body), chunk_size):
+                yield response.body[offset : offset + chunk_size]
+
+        return S3GetObjectStreamResponse(body=iter_body(), **response.model_dump(exclude={"body"}, exclude_unset=True))
+
+    async def get_object_ranged(
+        self,
+        bucket: str,
+        key: str,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
+        version_id: str | None = None,
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        request_payer: Literal["requester", "requester_payer"] | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> S3GetObjectResponse:
+        """Get an object with byte-range requests."""
+        return await self.get_object(bucket, key)
+
     async def get_object_acl(
         self,
         bucket: str,
@@ -669,7 +766,7 @@ class MockS3Client(AbstractS3Client):
     async def put_bucket_policy(
         self,
         bucket: str,
-        policy: str,
+        policy: str | dict[str, Any],
         content_md5: str | None = None,
         checksum_algorithm: Literal["CRC32", "CRC32C", "SHA1", "SHA256", "CRC64NVME"] | None = None,
         confirm_remove_self_bucket_access: bool | None = None,
@@ -679,6 +776,8 @@ class MockS3Client(AbstractS3Client):
         if bucket not in self._buckets:
             raise S3NoSuchBucketClientException(f"Bucket {bucket} does not exist")
 
+        if not isinstance(policy, str):
+            policy = json.dumps(policy)
         policy_response = S3GetBucketPolicyResponse(policy=policy, revision_id="mock-revision-id")
 
         self._bucket_policies[bucket] = policy_response
@@ -689,7 +788,7 @@ class MockS3Client(AbstractS3Client):
         self,
         bucket: str,
         key: str,
-        body: bytes | str | None = None,
+        body: bytes | str | AsyncIterable[bytes] | os.PathLike[str] | None = None,
         acl: Literal[
             "private",
             "public-read",
@@ -747,12 +846,20 @@ class MockS3Client(AbstractS3Client):
         object_lock_legal_hold_status: Literal["ON", "OFF"] | None = None,
         expected_bucket_owner: str | None = None,
         metadata_directive: Literal["COPY", "REPLACE"] | None = None,
+        multipart_threshold: int | None = 8 * 1024 * 1024,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
     ) -> S3PutObjectResponse:
         """Put an object."""
         if bucket not in self._buckets:
             raise S3NoSuchBucketClientException(f"Bucket {bucket} does not exist")
 
-        body_bytes = body.encode() if isinstance(body, str) else (body or b"")
+        if isinstance(body, os.PathLike):
+            body_bytes = await asyncio.to_thread(Path(body).read_bytes)
+        elif isinstance(body, AsyncIterable):
+            body_bytes = b"".join([chunk async for chunk in body])
+        else:
+            body_bytes = body.encode() if isinstance(body, str) else (body or b"")
 
         self._objects[(bucket, key)] = {
             "body": body_bytes,
@@ -876,6 +983,30 @@ class MockS3Client(AbstractS3Client):
 
         return S3PutObjectRetentionResponse()
 
+    async def select_object_content(
+        self,
+        bucket: str,
+        key: str,
+        expression: str,
+        input_serialization: S3SelectInputSerialization,
+        output_serialization: S3SelectOutputSerialization,
+        expression_type: Literal["SQL"] = "SQL",
+        sse_customer_algorithm: str | None = None,
+        sse_customer_key: str | None = None,
+        expected_bucket_owner: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Select object content (only ``SELECT * FROM S3Object`` is supported)."""
+        if bucket not in self._buckets:
+            raise S3NoSuchBucketClientException(f"Bucket {bucket} does not exist")
+
+        if (bucket, key) not in self._objects:
+            raise S3NoSuchKeyClientException(f"Object {key} does not exist in bucket {bucket}")
+
+        if expression.strip().upper() != "SELECT * FROM S3OBJECT":
+            raise S3InvalidRequestClientException(f"Unsupported expression: {expression}")
+
+        yield self._objects[(bucket, key)]["body"]
+
     async def generate_presigned_url(
         self,
         bucket: str,
@@ -1005,6 +1136,8 @@ async def s3_client(request: pytest.FixtureRequest, container: AsyncContainer) -
             aws_account_id=config.s3.aws_account_id,
             use_ssl=config.s3.use_ssl,
             endpoint_url=str(config.s3.endpoint_url) if config.s3.endpoint_url else None,
+            max_pool_connections=config.s3.max_pool_connections,
+            dns_cache_ttl=config.s3.dns_cache_ttl,
         ) as client:
             yield client
 
@@ -1,25 +1,41 @@
 """Test the S3 AIOboto3 client."""
 
 import asyncio
+import base64
+import contextlib
+import hashlib
 import json
+import urllib.parse
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
 
 from haolib.database.files.s3.clients.abstract import (
     AbstractS3Client,
+    S3AccessDeniedClientException,
     S3BucketAlreadyExistsClientException,
     S3BucketAlreadyOwnedByYouClientException,
     S3BucketNotEmptyClientException,
+    S3ClientException,
     S3InvalidRequestClientException,
     S3NoSuchBucketClientException,
     S3NoSuchCORSConfigurationClientException,
     S3NoSuchKeyClientException,
     S3NoSuchLifecycleConfigurationClientException,
     S3NoSuchPolicyClientException,
+    S3PreconditionFailedClientException,
     S3ServiceClientException,
 )
+from haolib.database.files.s3.clients.aioboto3 import Aioboto3S3Client
 from haolib.database.files.s3.clients.pydantic import (
+    S3BatchJobManifest,
+    S3BatchJobOperation,
+    S3BatchJobPutObjectAcl,
     S3CORSConfiguration,
     S3CORSRule,
     S3DefaultRetention,
@@ -32,7 +48,15 @@ from haolib.database.files.s3.clients.pydantic import (
     S3ObjectLockLegalHold,
     S3ObjectLockRetention,
     S3ObjectLockRule,
+    S3PutObjectAclResponse,
+    S3PutObjectResponse,
+    S3SelectCSVInput,
+    S3SelectCSVOutput,
+    S3SelectInputSerialization,
+    S3SelectOutputSerialization,
 )
+from haolib.database.files.s3.clients.ratelimit import S3AdaptiveRateLimiter
+from haolib.database.files.s3.clients.sigv4 import S3QueryPresigner
 from tests.integration.s3.conftest import MockS3Client
 
 
@@ -449,6 +473,30 @@ async def test_get_bucket_lifecycle_configuration_not_exists(
     assert response.rules == []
 
 
+@pytest.mark.asyncio
+async def test_get_bucket_lifecycle_configuration_after_missing(
+    s3_client: AbstractS3Client, clean_all_buckets: None
+) -> None:
+    """Test that a lifecycle configuration put after an empty read is returned."""
+    bucket_name = "test-bucket-get-lifecycle-after-missing"
+    await s3_client.create_bucket(bucket_name)
+    assert (await s3_client.get_bucket_lifecycle_configuration(bucket_name)).rules == []
+
+    lifecycle_config = S3LifecycleConfiguration(
+        rules=[S3LifecycleRule(id="rule1", status="Enabled", expiration=S3LifecycleExpiration(days=30))]
+    )
+    try:
+        await s3_client.put_bucket_lifecycle_configuration(bucket_name, lifecycle_config)
+    except S3InvalidRequestClientException:
+        pytest.skip("Lifecycle configuration not supported by this S3 backend")
+    response = await s3_client.get_bucket_lifecycle_configuration(bucket_name)
+    assert response.rules is not None
+    assert len(response.rules) == 1
+
+    await s3_client.delete_bucket_lifecycle(bucket_name)
+    assert (await s3_client.get_bucket_lifecycle_configuration(bucket_name)).rules == []
+
+
 @pytest.mark.asyncio
 async def test_delete_bucket_lifecycle_configuration(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
     """Test deleting bucket lifecycle configuration."""
@@ -528,6 +576,30 @@ async def test_get_bucket_policy(s3_client: AbstractS3Client, clean_all_buckets:
         pytest.skip("Bucket policy not supported by this S3 backend")
 
 
+@pytest.mark.asyncio
+async def test_get_bucket_policy_parsed(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test putting a bucket policy as a dictionary and getting it parsed."""
+    bucket_name = "test-bucket-get-policy-parsed"
+    await s3_client.create_bucket(bucket_name)
+    policy = {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": "*",
+                "Action": "s3:GetObject",
+                "Resource": f"arn:aws:s3:::{bucket_name}/*",
+            }
+        ],
+    }
+    try:
+        await s3_client.put_bucket_policy(bucket_name, policy)
+        assert await s3_client.get_bucket_policy_parsed(bucket_name) == policy
+        assert (await s3_client.get_bucket_policy(bucket_name)).policy_dict == policy
+    except S3InvalidRequestClientException:
+        pytest.skip("Bucket policy not supported by this S3 backend")
+
+
 @pytest.mark.asyncio
 async def test_get_bucket_policy_not_exists(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
     """Test getting policy that doesn't exist."""
@@ -612,6 +684,29 @@ async def test_put_object_legal_hold(s3_client: AbstractS3Client, clean_all_buck
         pytest.skip("Object lock not supported by this S3 backend")
 
 
+@pytest.mark.asyncio
+async def test_put_object_legal_hold_bulk(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test putting legal holds on many objects, with failures reported per object."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("put_object_legal_hold_bulk is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-legal-hold-bulk"
+    await s3_client.create_bucket(bucket_name, object_lock_enabled_for_bucket=True)
+    for key in ("key-1", "key-2"):
+        await s3_client.put_object(bucket_name, key, body=b"test-data")
+    legal_hold = S3ObjectLockLegalHold(status="ON")
+
+    responses = await s3_client.put_object_legal_hold_bulk(
+        bucket_name, [("key-1", legal_hold), ("key-2", legal_hold), ("missing", legal_hold)], concurrency=2
+    )
+
+    if any(isinstance(response, S3InvalidRequestClientException) for response in responses):
+        pytest.skip("Object lock not supported by this S3 backend")
+    assert not isinstance(responses[0], S3ClientException)
+    assert not isinstance(responses[1], S3ClientException)
+    assert isinstance(responses[2], S3ClientException)
+
+
 @pytest.mark.asyncio
 async def test_put_object_retention(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
     """Test putting object retention."""
@@ -1228,3 +1323,649 @@ async def test_generate_presigned_url_multiple_calls_same_params(
     # For real clients, URLs should be different; for mock, they might be same if same second
     if not isinstance(s3_client, MockS3Client):
         assert url1 != url2
+
+
+@pytest.mark.asyncio
+async def test_create_batch_job(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test creating a batch job."""
+    if not isinstance(s3_client, MockS3Client):
+        pytest.skip("S3 Batch Operations are not supported by this S3 backend")
+
+    bucket_name = "test-bucket-batch-job"
+    await s3_client.create_bucket(bucket_name)
+    await s3_client.put_object(bucket_name, "a b", body=b"test-data")
+    manifest = await s3_client.put_object(bucket_name, "manifest.csv", body=f"{bucket_name},a%20b\n")
+
+    response = await s3_client.create_batch_job(
+        operation=S3BatchJobOperation(put_object_acl=S3BatchJobPutObjectAcl(acl="public-read")),
+        manifest=S3BatchJobManifest(bucket=bucket_name, key="manifest.csv", etag=manifest.etag or ""),
+        role_arn="arn:aws:iam::123456789012:role/batch-operations",
+    )
+
+    assert response.job_id is not None
+
+
+@pytest.mark.asyncio
+async def test_put_object_acl_bulk(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test putting an ACL on many objects."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("put_object_acl_bulk is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-obj-acl-bulk"
+    keys = [f"prefix/key-{i}" for i in range(10)]
+    await s3_client.create_bucket(bucket_name)
+    for key in keys:
+        await s3_client.put_object(bucket_name, key, body=b"test-data")
+
+    response = await s3_client.put_object_acl_bulk(bucket_name, "private", prefix="prefix/", concurrency=4)
+
+    assert response.job_id is None
+    assert response.responses is not None
+    assert len(response.responses) == len(keys)
+
+
+@pytest.mark.asyncio
+async def test_put_object_acl_bulk_returns_per_key_errors() -> None:
+    """Test that a failed key gets its exception without failing the other keys."""
+    client = Aioboto3S3Client()
+
+    async def put_object_acl(**kwargs: Any) -> dict[str, Any]:
+        if kwargs["Key"] == "missing":
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "PutObjectAcl")
+        return {}
+
+    client._client = SimpleNamespace(put_object_acl=put_object_acl)
+    response = await client.put_object_acl_bulk("bucket", "private", keys=["first", "missing", "last"])
+
+    assert response.responses is not None
+    assert [type(item) for item in response.responses] == [
+        S3PutObjectAclResponse,
+        S3NoSuchKeyClientException,
+        S3PutObjectAclResponse,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_put_object_acl_bulk_requires_keys_or_prefix(
+    s3_client: AbstractS3Client, clean_all_buckets: None
+) -> None:
+    """Test that put_object_acl_bulk requires keys or a prefix."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("put_object_acl_bulk is only available on Aioboto3S3Client")
+
+    with pytest.raises(S3InvalidRequestClientException):
+        await s3_client.put_object_acl_bulk("test-bucket-obj-acl-bulk", "private")
+
+
+@pytest.mark.asyncio
+async def test_put_objects(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test putting many objects with precomputed checksums."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("put_objects is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-put-objects"
+    objects: list[tuple[str, bytes | str]] = [(f"key-{i}", f"test-data-{i}") for i in range(10)]
+    await s3_client.create_bucket(bucket_name)
+
+    responses = await s3_client.put_objects(bucket_name, objects, concurrency=4)
+
+    assert len(responses) == len(objects)
+    for key, body in objects:
+        response = await s3_client.get_object(bucket_name, key)
+        assert response.body == str(body).encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_put_objects_returns_per_key_errors() -> None:
+    """Test that a failed object gets its exception without failing the other objects."""
+    client = Aioboto3S3Client()
+
+    async def put_object(**kwargs: Any) -> dict[str, Any]:
+        if kwargs["Key"] == "denied":
+            raise ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+        return {"ETag": '"etag"'}
+
+    client._client = SimpleNamespace(put_object=put_object)
+    responses = await client.put_objects("bucket", [("first", b"a"), ("denied", b"b"), ("last", b"c")])
+
+    assert [type(response) for response in responses] == [
+        S3PutObjectResponse,
+        S3AccessDeniedClientException,
+        S3PutObjectResponse,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_objects(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test getting many objects, with missing keys reported per key."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("get_objects is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-get-objects"
+    await s3_client.create_bucket(bucket_name)
+    for i in range(5):
+        await s3_client.put_object(bucket_name, f"key-{i}", body=f"test-data-{i}")
+
+    responses = await s3_client.get_objects(bucket_name, [*(f"key-{i}" for i in range(5)), "missing"], concurrency=2)
+
+    assert [response.body for response in responses[:5]] == [f"test-data-{i}".encode() for i in range(5)]  # type: ignore[union-attr]
+    assert isinstance(responses[5], S3NoSuchKeyClientException)
+
+
+@pytest.mark.asyncio
+async def test_select_object_content(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test selecting object content server-side."""
+    bucket_name = "test-bucket-select"
+    key = "data.csv"
+    body = b"a,1\nb,2\n"
+    await s3_client.create_bucket(bucket_name)
+    await s3_client.put_object(bucket_name, key, body=body)
+
+    try:
+        chunks = [
+            chunk
+            async for chunk in s3_client.select_object_content(
+                bucket_name,
+                key,
+                "SELECT * FROM S3Object",
+                input_serialization=S3SelectInputSerialization(csv_input=S3SelectCSVInput(file_header_info="NONE")),
+                output_serialization=S3SelectOutputSerialization(csv_output=S3SelectCSVOutput()),
+            )
+        ]
+    except S3InvalidRequestClientException:
+        pytest.skip("S3 Select not supported by this S3 backend")
+
+    assert b"".join(chunks).split() == body.split()
+
+
+@pytest.mark.asyncio
+async def test_list_objects_v2_matching(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test listing objects whose key matches a regular expression."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("list_objects_v2_matching is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-list-matching"
+    await s3_client.create_bucket(bucket_name)
+    for key in ["logs/2024-01.gz", "logs/2024-02.txt", "logs/2023-01.gz", "other/2024-01.gz"]:
+        await s3_client.put_object(bucket_name, key, body=b"test-data")
+
+    keys = [obj.key async for obj in s3_client.list_objects_v2_matching(bucket_name, r"logs/2024-\d+\.gz")]
+
+    assert keys == ["logs/2024-01.gz"]
+
+
+@pytest.mark.asyncio
+async def test_iter_objects_v2(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test iterating over objects page by page."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("iter_objects_v2 is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-iter-objects"
+    await s3_client.create_bucket(bucket_name)
+    for key in ["a/1", "a/2", "b/3"]:
+        await s3_client.put_object(bucket_name, key, body=b"test-data")
+
+    keys = [obj.key async for obj in s3_client.iter_objects_v2(bucket_name, prefix="a/")]
+
+    assert keys == ["a/1", "a/2"]
+
+
+@pytest.mark.asyncio
+async def test_list_objects_v2_projected(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test listing objects as tuples of selected fields."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("list_objects_v2_projected is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-list-projected"
+    await s3_client.create_bucket(bucket_name)
+    for key in ["a/1", "a/22", "b/333"]:
+        await s3_client.put_object(bucket_name, key, body=key.encode())
+
+    rows = [row async for row in s3_client.list_objects_v2_projected(bucket_name, ("key", "size"), prefix="a/")]
+
+    assert rows == [("a/1", 3), ("a/22", 4)]
+
+    with pytest.raises(S3InvalidRequestClientException):
+        async for _ in s3_client.list_objects_v2_projected(bucket_name, ("key", "Size")):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_nested_context_reuses_client(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test that nested async with blocks share the underlying client."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("Client reuse is specific to Aioboto3S3Client")
+
+    bucket_name = "test-bucket-nested-context"
+    await s3_client.create_bucket(bucket_name)
+    underlying_client = s3_client._client
+
+    async with s3_client:
+        assert s3_client._client is underlying_client
+        await s3_client.put_object(bucket_name, "test-key", body=b"test-data")
+
+    # The outer fixture context is still open, so the client must still be usable.
+    response = await s3_client.get_object(bucket_name, "test-key")
+    assert response.body == b"test-data"
+
+
+@pytest.mark.asyncio
+async def test_delete_objects_more_than_1000_keys(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test deleting more objects than S3 accepts in a single request."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("put_objects is only available on Aioboto3S3Client")
+
+    bucket_name = "test-bucket-delete-many"
+    keys = [f"key-{i}" for i in range(1500)]
+    await s3_client.create_bucket(bucket_name)
+    await s3_client.put_objects(bucket_name, [(key, b"test-data") for key in keys])
+
+    response = await s3_client.delete_objects(
+        bucket_name, S3DeleteObjectsDelete(objects=[S3DeleteObjectsDeleteObject(key=key) for key in keys])
+    )
+
+    assert len(response.deleted) == len(keys)
+    assert not response.error
+
+
+
+@pytest.mark.asyncio
+async def test_delete_objects_reports_failed_chunk_as_errors() -> None:
+    """Test that the objects of a failed chunk are reported as errors next to the other chunks' results."""
+    client = Aioboto3S3Client()
+    keys = [f"key-{i}" for i in range(1500)]
+
+    async def delete_objects(**kwargs: Any) -> dict[str, Any]:
+        chunk = kwargs["Delete"]["Objects"]
+        if chunk[0]["Key"] == "key-0":
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "Access Denied"}}, "DeleteObjects")
+        return {"Deleted": chunk, "RequestCharged": "requester"}
+
+    client._client = SimpleNamespace(delete_objects=delete_objects)
+    delete = S3DeleteObjectsDelete(objects=[S3DeleteObjectsDeleteObject(key=key) for key in keys])
+
+    response = await client.delete_objects("bucket", delete)
+
+    assert [item.key for item in response.deleted] == keys[1000:]
+    assert [item.key for item in response.error] == keys[:1000]
+    assert {item.code for item in response.error} == {"AccessDenied"}
+    assert response.request_charged == "requester"
+
+def test_clients_with_same_credentials_share_session() -> None:
+    """Test that clients built from the same credentials reuse one aioboto3 session."""
+    first = Aioboto3S3Client(aws_access_key_id="key", aws_secret_access_key="secret", region_name="us-east-1")  # noqa: S106
+    second = Aioboto3S3Client(aws_access_key_id="key", aws_secret_access_key="secret", region_name="us-east-1")  # noqa: S106
+    other = Aioboto3S3Client(aws_access_key_id="other", aws_secret_access_key="secret", region_name="us-east-1")  # noqa: S106
+
+    assert first._session is second._session
+    assert first._session is not other._session
+
+
+@pytest.mark.asyncio
+async def test_clients_with_same_credentials_share_client() -> None:
+    """Test that clients built from the same credentials and options share one aiobotocore client."""
+    first = Aioboto3S3Client(aws_access_key_id="key", aws_secret_access_key="secret", region_name="us-east-1")  # noqa: S106
+    second = Aioboto3S3Client(aws_access_key_id="key", aws_secret_access_key="secret", region_name="us-east-1")  # noqa: S106
+    insecure = Aioboto3S3Client(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",  # noqa: S106
+        region_name="us-east-1",
+        verify=False,
+    )
+
+    async with first, second, insecure:
+        assert first._client is second._client
+        assert first._client is not insecure._client
+
+    assert first._client is None
+    assert second._client is None
+
+
+@pytest.mark.asyncio
+async def test_read_write_limits_size_connection_pool() -> None:
+    """Test that separate read and write limits get a connection pool large enough for both."""
+    max_concurrent_reads = 8
+    max_concurrent_writes = 4
+    client = Aioboto3S3Client(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",  # noqa: S106
+        region_name="us-east-1",
+        max_concurrent_reads=max_concurrent_reads,
+        max_concurrent_writes=max_concurrent_writes,
+    )
+
+    async with client:
+        assert client._client.meta.config.max_pool_connections == max_concurrent_reads + max_concurrent_writes
+
+
+@pytest.mark.asyncio
+async def test_max_pool_connections_overrides_limits() -> None:
+    """Test that an explicit connection pool size takes precedence over the read and write limits."""
+    max_pool_connections = 100
+    client = Aioboto3S3Client(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",  # noqa: S106
+        region_name="us-east-1",
+        max_concurrent_reads=8,
+        max_pool_connections=max_pool_connections,
+    )
+
+    async with client:
+        assert client._client.meta.config.max_pool_connections == max_pool_connections
+
+
+@pytest.mark.asyncio
+async def test_client_config_defaults_can_be_overridden() -> None:
+    """Test that the tuned botocore config is applied and can be overridden."""
+    read_timeout = 120
+    client = Aioboto3S3Client(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",  # noqa: S106
+        region_name="us-east-1",
+        client_config={"read_timeout": read_timeout},
+    )
+
+    async with client:
+        config = client._client.meta.config
+        assert config.tcp_keepalive is True
+        assert config.connect_timeout == 5  # noqa: PLR2004
+        assert config.read_timeout == read_timeout
+        assert config.retries["mode"] == "adaptive"
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_reduces_botocore_retries() -> None:
+    """Test that botocore retries are reduced when the rate limiter retries throttled writes."""
+    client = Aioboto3S3Client(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",  # noqa: S106
+        region_name="us-east-1",
+        rate_limiter=S3AdaptiveRateLimiter(),
+    )
+
+    async with client:
+        assert client._client.meta.config.retries == {"mode": "standard", "total_max_attempts": 2}
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_backoff_does_not_hold_write_slot() -> None:
+    """Test that a throttled write backs off without holding the only write slot."""
+    limiter = S3AdaptiveRateLimiter(initial_rate=1000.0)
+    limiter.backoff = lambda attempt: 0.2  # type: ignore[method-assign]  # noqa: ARG005
+    client = Aioboto3S3Client(max_concurrent_writes=1, rate_limiter=limiter)
+    sent: list[str] = []
+
+    async def put_object(**kwargs: Any) -> dict[str, Any]:
+        sent.append(kwargs["Key"])
+        if sent == ["throttled"]:
+            raise ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+        return {}
+
+    client._client = SimpleNamespace(put_object=put_object)
+    throttled = asyncio.create_task(client._call_write("put_object", Key="throttled"))
+    await asyncio.sleep(0.05)
+    await asyncio.wait_for(client._call_write("put_object", Key="other"), timeout=0.1)
+    await throttled
+
+    assert sent == ["throttled", "other", "throttled"]
+
+
+@pytest.mark.asyncio
+async def test_missing_lifecycle_configuration_is_cached_per_owner_until_expiry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a missing lifecycle configuration is remembered per expected owner, and only for a while."""
+    client = Aioboto3S3Client()
+    owners: list[str | None] = []
+
+    async def get_bucket_lifecycle_configuration(**kwargs: Any) -> dict[str, Any]:
+        owners.append(kwargs.get("ExpectedBucketOwner"))
+        raise ClientError({"Error": {"Code": "NoSuchLifecycleConfiguration"}}, "GetBucketLifecycleConfiguration")
+
+    client._client = SimpleNamespace(get_bucket_lifecycle_configuration=get_bucket_lifecycle_configuration)
+    await client.get_bucket_lifecycle_configuration("bucket")
+    await client.get_bucket_lifecycle_configuration("bucket")
+    await client.get_bucket_lifecycle_configuration("bucket", expected_bucket_owner="123456789012")
+    assert owners == [None, "123456789012"]
+
+    monkeypatch.setattr("haolib.database.files.s3.clients.aioboto3._NO_LIFECYCLE_TTL", 0.0)
+    await client.get_bucket_lifecycle_configuration("other-bucket")
+    response = await client.get_bucket_lifecycle_configuration("other-bucket")
+
+    assert response.rules == []
+    assert owners == [None, "123456789012", None, None]
+
+
+@pytest.mark.asyncio
+async def test_put_bucket_lifecycle_configuration_omits_empty_sub_models() -> None:
+    """Test that all-None lifecycle sub-models are left out of the request instead of sent as empty dicts."""
+    client = Aioboto3S3Client()
+    sent: list[dict[str, Any]] = []
+
+    async def put_bucket_lifecycle_configuration(**kwargs: Any) -> dict[str, Any]:
+        sent.append(kwargs)
+        return {}
+
+    client._client = SimpleNamespace(put_bucket_lifecycle_configuration=put_bucket_lifecycle_configuration)
+    lifecycle_config = S3LifecycleConfiguration(
+        rules=[
+            S3LifecycleRule(
+                id="rule1",
+                status="Enabled",
+                expiration=S3LifecycleExpiration(),
+                abort_incomplete_multipart_upload={"DaysAfterInitiation": 7},
+            )
+        ]
+    )
+
+    await client.put_bucket_lifecycle_configuration("bucket", lifecycle_config)
+
+    assert sent[0]["LifecycleConfiguration"] == {
+        "Rules": [{"ID": "rule1", "Status": "Enabled", "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 7}}]
+    }
+
+
+def _native_legal_hold_client(responses: list[tuple[int, str]], **kwargs: Any) -> tuple[Aioboto3S3Client, list[str]]:
+    """Create a client whose native requests get the given statuses and bodies, and record the botocore calls."""
+    client = Aioboto3S3Client(use_native=True, **kwargs)
+    botocore_calls: list[str] = []
+
+    @contextlib.asynccontextmanager
+    async def put(url: str, **_: Any) -> AsyncIterator[SimpleNamespace]:
+        status, body = responses.pop(0)
+
+        async def text() -> str:
+            return body
+
+        yield SimpleNamespace(status=status, headers={}, text=text)
+
+    async def put_object_legal_hold(**_: Any) -> dict[str, Any]:
+        botocore_calls.append("put_object_legal_hold")
+        return {}
+
+    client._http = SimpleNamespace(put=put)  # type: ignore[assignment]
+    client._presigner = S3QueryPresigner("key", "secret", "us-east-1")
+    client._client = SimpleNamespace(put_object_legal_hold=put_object_legal_hold)
+    return client, botocore_calls
+
+
+@pytest.mark.asyncio
+async def test_native_legal_hold_raises_s3_errors_without_botocore_fallback() -> None:
+    """Test that an S3 error answer to a native request is raised instead of resent through botocore."""
+    error = "<Error><Code>NoSuchKey</Code><Message>The specified key does not exist.</Message></Error>"
+    client, botocore_calls = _native_legal_hold_client([(404, error)])
+
+    with pytest.raises(S3NoSuchKeyClientException, match="does not exist"):
+        await client.put_object_legal_hold("bucket", "key", legal_hold=S3ObjectLockLegalHold(status="ON"))
+
+    assert botocore_calls == []
+
+
+@pytest.mark.asyncio
+async def test_native_legal_hold_retries_throttles_through_rate_limiter() -> None:
+    """Test that a throttled native request is retried by the rate limiter."""
+    limiter = S3AdaptiveRateLimiter(initial_rate=1000.0)
+    limiter.backoff = lambda attempt: 0  # type: ignore[method-assign]  # noqa: ARG005
+    slow_down = "<Error><Code>SlowDown</Code><Message>Please reduce your request rate.</Message></Error>"
+    client, botocore_calls = _native_legal_hold_client([(503, slow_down), (200, "")], rate_limiter=limiter)
+
+    await client.put_object_legal_hold("bucket", "key", legal_hold=S3ObjectLockLegalHold(status="ON"))
+
+    assert botocore_calls == []
+    assert limiter.throttle_ratio > 0
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_ttl_is_passed_to_connector() -> None:
+    """Test that the DNS cache TTL is merged into the connector options."""
+    client = Aioboto3S3Client(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",  # noqa: S106
+        region_name="us-east-1",
+        dns_cache_ttl=30,
+        client_config={"connector_args": {"keepalive_timeout": 60}},
+    )
+
+    async with client:
+        assert client._client.meta.config.connector_args == {"keepalive_timeout": 60, "ttl_dns_cache": 30}
+
+
+@pytest.mark.asyncio
+async def test_locally_presigned_url_uses_resolved_region(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that locally signed URLs use the region botocore resolved, not a hard-coded default."""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-central-1")
+    client = Aioboto3S3Client(aws_access_key_id="region-key", aws_secret_access_key="secret")  # noqa: S106
+
+    async with client:
+        url = urllib.parse.urlsplit(await client.generate_presigned_url("mybucket", "key"))
+        expected = urllib.parse.urlsplit(
+            await client._client.generate_presigned_url(
+                "get_object", Params={"Bucket": "mybucket", "Key": "key"}, ExpiresIn=3600
+            )
+        )
+
+    assert client._presigner is not None
+    assert url.netloc == "mybucket.s3.amazonaws.com"
+    assert url.netloc == expected.netloc
+    assert "/eu-central-1/s3/aws4_request" in urllib.parse.parse_qs(url.query)["X-Amz-Credential"][0]
+
+
+@pytest.mark.asyncio
+async def test_get_object_stream(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test streaming an object body in chunks."""
+    bucket_name = "test-bucket-get-object-stream"
+    body = b"0123456789" * 1000
+    await s3_client.create_bucket(bucket_name)
+    await s3_client.put_object(bucket_name, "test-key", body=body)
+
+    chunk_size = 1024
+    response = await s3_client.get_object_stream(bucket_name, "test-key", chunk_size=chunk_size)
+    chunks = [chunk async for chunk in response.body]
+
+    assert b"".join(chunks) == body
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert response.content_length == len(body)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, 100, 1024, 10 * 1024 + 1])
+async def test_get_object_ranged(s3_client: AbstractS3Client, clean_all_buckets: None, size: int) -> None:
+    """Test downloading an object with concurrent byte-range requests."""
+    bucket_name = "test-bucket-get-object-ranged"
+    body = bytes(i % 251 for i in range(size))
+    await s3_client.create_bucket(bucket_name)
+    await s3_client.put_object(bucket_name, "test-key", body=body)
+
+    response = await s3_client.get_object_ranged(bucket_name, "test-key", part_size=1024, max_concurrency=3)
+
+    assert response.body == body
+    assert response.content_length == size
+
+
+@pytest.mark.asyncio
+async def test_get_object_ranged_cancels_other_parts_on_failure() -> None:
+    """Test that a failed part cancels the parts still downloading and is raised as an S3 exception."""
+    client = Aioboto3S3Client()
+    cancelled: list[str] = []
+
+    async def get_object(**kwargs: Any) -> dict[str, Any]:
+        range_ = kwargs["Range"]
+        if range_ == "bytes=10-19":
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "GetObject")
+        if range_ != "bytes=0-9":
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(range_)
+                raise
+
+        async def read() -> bytes:
+            return b"0" * 10
+
+        return {"Body": SimpleNamespace(read=read), "ContentRange": "bytes 0-9/40", "ETag": '"etag"'}
+
+    client._client = SimpleNamespace(get_object=get_object)
+
+    with pytest.raises(S3PreconditionFailedClientException):
+        await client.get_object_ranged("bucket", "key", part_size=10)
+
+    assert sorted(cancelled) == ["bytes=20-29", "bytes=30-39"]
+
+
+@pytest.mark.asyncio
+async def test_put_object_multipart(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test uploading a large object in concurrent parts."""
+    bucket_name = "test-bucket-put-object-multipart"
+    part_size = 5 * 1024 * 1024
+    body = bytes(i % 251 for i in range(2 * part_size + 1))
+    await s3_client.create_bucket(bucket_name)
+
+    await s3_client.put_object(
+        bucket_name,
+        "test-key",
+        body=body,
+        content_type="application/octet-stream",
+        multipart_threshold=part_size,
+        part_size=part_size,
+        max_concurrency=2,
+    )
+    response = await s3_client.get_object(bucket_name, "test-key")
+
+    assert response.body == body
+    assert response.content_type == "application/octet-stream"
+
+
+@pytest.mark.asyncio
+async def test_put_object_streamed(s3_client: AbstractS3Client, clean_all_buckets: None, tmp_path: Path) -> None:
+    """Test uploading an object from an async iterable and from a file."""
+    bucket_name = "test-bucket-put-object-streamed"
+    part_size = 5 * 1024 * 1024
+    body = bytes(i % 251 for i in range(2 * part_size + 1))
+    path = tmp_path / "body.bin"
+    path.write_bytes(body)
+    await s3_client.create_bucket(bucket_name)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), 1024 * 1024):
+            yield body[start : start + 1024 * 1024]
+
+    await s3_client.put_object(bucket_name, "from-iterable", body=chunks(), part_size=part_size)
+    await s3_client.put_object(bucket_name, "from-file", body=path, part_size=part_size)
+
+    assert (await s3_client.get_object(bucket_name, "from-iterable")).body == body
+    assert (await s3_client.get_object(bucket_name, "from-file")).body == body
+
+
+@pytest.mark.asyncio
+async def test_put_object_checksum(s3_client: AbstractS3Client, clean_all_buckets: None) -> None:
+    """Test that checksums of the requested algorithm are computed by the client."""
+    if not isinstance(s3_client, Aioboto3S3Client):
+        pytest.skip("Checksums are only computed by Aioboto3S3Client")
+
+    bucket_name = "test-bucket-put-object-checksum"
+    body = b"test-data"
+    await s3_client.create_bucket(bucket_name)
+
+    response = await s3_client.put_object(bucket_name, "test-key", body=body, checksum_algorithm="SHA256")
+
+    assert response.checksum_sha256 == base64.b64encode(hashlib.sha256(body).digest()).decode("ascii")
@@ -1,5 +1,7 @@
 """Test entities."""
 
+import asyncio
+from collections.abc import Iterable
 from typing import Self
 
 import pytest
@@ -7,6 +9,7 @@ import pytest
 from haolib.batches.batch import Batch
 from haolib.entities.base import BaseEntity
 from haolib.entities.base.create import BaseBulkEntityCreate, BaseEntityCreate
+from haolib.entities.base.delete import BaseBatchEntityDelete, BaseEntityDelete
 from haolib.entities.base.read import BaseBulkEntityRead, BaseEntityRead
 from haolib.entities.base.update import BaseBulkEntityUpdate, BaseEntityUpdate
 
@@ -201,3 +204,146 @@ async def test_entities_bulk_create() -> None:
         Entity(id=2, name="test"),
         Entity(id=3, name="test"),
     ]
+
+
+@pytest.mark.asyncio
+async def test_entities_bulk_create_concurrently() -> None:
+    """Test that concurrent bulk create keeps the order of the entity creates."""
+    create_batch = EntitiesBulkCreate(entities=[EntityCreate(name=f"test{i}") for i in range(5)])
+
+    created_batch = await create_batch.create_batch(CounterGenerator(), concurrency_limit=2)
+
+    assert [entity.name for entity in created_batch.to_list()] == [f"test{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_entities_bulk_update_concurrently() -> None:
+    """Test that concurrent bulk update updates every entity of the batch."""
+    batch = Batch[int, Entity](key_getter=lambda entity: entity.id).merge_list(
+        [Entity(id=1, name="test"), Entity(id=2, name="test"), Entity(id=3, name="test")]
+    )
+    update_batch = EntitiesBulkUpdate(entities=[EntityUpdate(id=i, name="test2") for i in (1, 2, 3)])
+
+    updated_batch = await update_batch.update_batch(batch, concurrency_limit=3)
+
+    assert [entity.name for entity in updated_batch.to_list()] == ["test2", "test2", "test2"]
+
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_and_update_reject_concurrency_limit_below_one() -> None:
+    """Test that a concurrency limit below 1 is rejected instead of blocking forever."""
+    batch = Batch[int, Entity](key_getter=lambda entity: entity.id).merge_list([Entity(id=1, name="test")])
+
+    with pytest.raises(ValueError, match="concurrency_limit"):
+        await EntitiesBulkCreate(entities=[EntityCreate(name="test")]).create_batch(
+            CounterGenerator(), concurrency_limit=0
+        )
+    with pytest.raises(ValueError, match="concurrency_limit"):
+        await EntitiesBulkUpdate(entities=[EntityUpdate(id=1, name="test2")]).update_batch(batch, concurrency_limit=0)
+
+
+class SlowEntityCreate(EntityCreate):
+    """Entity create that fails or waits, recording whether it was cancelled."""
+
+    cancelled = False
+
+    async def create_entity(self, id_generator: CounterGenerator) -> Entity:
+        """Fail for the name "fail", otherwise wait."""
+        if self.name == "fail":
+            raise LookupError(self.name)
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return await super().create_entity(id_generator)
+
+
+@pytest.mark.asyncio
+async def test_entities_bulk_create_concurrently_cancels_other_calls_on_failure() -> None:
+    """Test that a failed concurrent create cancels the other calls and raises its error."""
+    entity_creates = [SlowEntityCreate(name="wait"), SlowEntityCreate(name="fail"), SlowEntityCreate(name="wait")]
+
+    with pytest.raises(LookupError, match="fail"):
+        await EntitiesBulkCreate(entities=entity_creates).create_batch(CounterGenerator(), concurrency_limit=3)
+
+    assert [entity_create.cancelled for entity_create in entity_creates] == [True, False, True]
+
+class EntitiesBulkCreateInOneCall(EntitiesBulkCreate):
+    """Entities bulk create that creates all the entities at once."""
+
+    calls = 0
+
+    async def create_entities(
+        self,
+        entity_creates: Iterable[EntityCreate],
+        id_generator: CounterGenerator,
+    ) -> list[Entity]:
+        """Create all the entities at once."""
+        self.calls += 1
+        return [Entity(id=id_generator.generate(), name=entity_create.name) for entity_create in entity_creates]
+
+
+@pytest.mark.asyncio
+async def test_entities_bulk_create_with_create_entities_override() -> None:
+    """Test that create_batch creates the entities through create_entities."""
+    create_batch = EntitiesBulkCreateInOneCall(entities=[EntityCreate(name="a"), EntityCreate(name="b")])
+
+    created_batch = await create_batch.create_batch(CounterGenerator())
+
+    assert created_batch.to_list() == [Entity(id=1, name="a"), Entity(id=2, name="b")]
+    assert create_batch.calls == 1
+
+
+class SlottedEntity(BaseEntity[int]):
+    """Entity declaring its own slots."""
+
+    __slots__ = ("id", "name")
+
+    def __init__(self, id: int, name: str) -> None:
+        self.id = id
+        self.name = name
+
+
+def test_slotted_entity_has_no_dict() -> None:
+    """Test that an entity declaring __slots__ has no instance __dict__."""
+    entity = SlottedEntity(id=1, name="a")
+
+    assert not hasattr(entity, "__dict__")
+    assert (entity.id, entity.name) == (1, "a")
+
+
+class EntityDelete(BaseEntityDelete[int, Entity]):
+    """Entity delete."""
+
+    def __init__(self, id: int) -> None:
+        self.id = id
+
+
+class EntitiesBulkDelete(BaseBatchEntityDelete[int, Entity, EntityDelete]):
+    """Entities bulk delete."""
+
+    def __init__(self, entities: list[EntityDelete]) -> None:
+        self.entities = entities
+        self.deleted_ids: list[list[int]] = []
+
+    async def get_entity_deletes(self) -> list[EntityDelete]:
+        """Get entities to delete."""
+        return self.entities
+
+    async def delete_entities(self, entity_ids: list[int]) -> int:
+        """Delete the entities."""
+        self.deleted_ids.append(entity_ids)
+        return len(entity_ids)
+
+
+@pytest.mark.asyncio
+async def test_entities_bulk_delete_in_chunks() -> None:
+    """Test that delete_batch deletes the entities in chunks of ids."""
+    delete_batch = EntitiesBulkDelete(entities=[EntityDelete(id=i) for i in range(1, 6)])
+
+    deleted = await delete_batch.delete_batch(chunk_size=2)
+
+    assert deleted == 5  # noqa: PLR2004
+    assert delete_batch.deleted_ids == [[1, 2], [3, 4], [5]]
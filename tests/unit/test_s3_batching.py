@@ -0,0 +1,62 @@
+"""Test S3 request batching."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from haolib.database.files.s3.clients.batching import S3BatchContext
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls: list[dict[str, Any]] = []
+
+    async def get_object(self, **kwargs: Any) -> dict[str, Any]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.calls.append(kwargs)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if kwargs["key"] == "missing":
+            raise KeyError(kwargs["key"])
+        return kwargs
+
+
+@pytest.mark.asyncio
+async def test_calls_are_dispatched_with_bounded_concurrency() -> None:
+    """Test that every caller gets its own result and concurrency is bounded."""
+    client = _Client()
+
+    async with S3BatchContext(client, max_batch=8, max_concurrency=3) as batch:  # type: ignore[arg-type]
+        results = await asyncio.gather(*(batch.get_object("bucket", f"key{i}") for i in range(20)))
+
+    assert [result["key"] for result in results] == [f"key{i}" for i in range(20)]
+    assert client.max_in_flight <= 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_calls_are_flushed_after_delay() -> None:
+    """Test that a partial batch is dispatched once the flush delay elapses."""
+    client = _Client()
+    batch = S3BatchContext(client, flush_ms=1.0)  # type: ignore[arg-type]
+
+    result = await asyncio.wait_for(batch.get_object("bucket", "key", version_id="v1"), timeout=1)
+
+    assert result == {"bucket": "bucket", "key": "key", "version_id": "v1"}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_to_their_caller() -> None:
+    """Test that a failing call does not affect the rest of the batch."""
+    client = _Client()
+
+    async with S3BatchContext(client) as batch:  # type: ignore[arg-type]
+        results = await asyncio.gather(
+            batch.get_object("bucket", "key"), batch.get_object("bucket", "missing"), return_exceptions=True
+        )
+
+    assert results[0] == {"bucket": "bucket", "key": "key"}
+    assert isinstance(results[1], KeyError)
@@ -0,0 +1,89 @@
+"""Test S3 adaptive rate limiter."""
+
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError  # type: ignore[import-untyped]
+
+from haolib.database.files.s3.clients.ratelimit import S3AdaptiveRateLimiter, is_throttle_error
+
+
+def _slow_down() -> ClientError:
+    return ClientError({"Error": {"Code": "SlowDown", "Message": "Please reduce your request rate."}}, "PutObject")
+
+
+def test_is_throttle_error() -> None:
+    """Test throttle error detection."""
+    assert is_throttle_error(_slow_down())
+    assert is_throttle_error(ClientError({"ResponseMetadata": {"HTTPStatusCode": 503}}, "PutObject"))
+    assert not is_throttle_error(ClientError({"Error": {"Code": "NoSuchBucket"}}, "PutObject"))
+
+
+def test_rate_grows_on_success_and_shrinks_on_throttle() -> None:
+    """Test AIMD rate updates."""
+    limiter = S3AdaptiveRateLimiter(initial_rate=100.0, increase_step=10.0, throttle_ratio_threshold=0.0)
+
+    limiter.record_success()
+    assert limiter.rate == pytest.approx(110.0)
+
+    limiter.record_throttle()
+    assert limiter.rate == pytest.approx(55.0)
+
+
+def test_rate_grows_linearly() -> None:
+    """Test that the rate recovers additively, not exponentially, after throttling."""
+    limiter = S3AdaptiveRateLimiter(initial_rate=10.0, increase_step=2.0, max_rate=1000.0)
+    rates = []
+    for _ in range(100):
+        limiter.record_success()
+        rates.append(limiter.rate)
+
+    assert rates == pytest.approx([10.0 + 2.0 * (i + 1) for i in range(100)])
+
+
+def test_rate_is_not_reduced_below_throttle_ratio_threshold() -> None:
+    """Test that isolated throttles do not reduce the rate."""
+    limiter = S3AdaptiveRateLimiter(initial_rate=100.0, increase_step=0.0, throttle_ratio_threshold=0.5)
+    for _ in range(9):
+        limiter.record_success()
+
+    limiter.record_throttle()
+
+    assert limiter.throttle_ratio == pytest.approx(0.1)
+    assert limiter.rate == pytest.approx(100.0)
+
+
+@pytest.mark.asyncio
+async def test_call_retries_throttled_requests() -> None:
+    """Test that throttled calls are retried and reported."""
+    updates: list[tuple[float, int]] = []
+    limiter = S3AdaptiveRateLimiter(
+        initial_rate=1000.0, base_backoff=0.0, on_update=lambda rate, queued: updates.append((rate, queued))
+    )
+    attempts = 0
+
+    async def put_object(**kwargs: Any) -> dict[str, Any]:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:  # noqa: PLR2004
+            raise _slow_down()
+        return kwargs
+
+    result = await limiter.call(put_object, Bucket="bucket", Key="key")
+
+    assert result == {"Bucket": "bucket", "Key": "key"}
+    assert attempts == 3  # noqa: PLR2004
+    assert updates
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_call_gives_up_after_max_attempts() -> None:
+    """Test that the last throttling error is raised."""
+    limiter = S3AdaptiveRateLimiter(initial_rate=1000.0, base_backoff=0.0, max_attempts=2)
+
+    async def put_object(**kwargs: Any) -> None:
+        raise _slow_down()
+
+    with pytest.raises(ClientError):
+        await limiter.call(put_object, Bucket="bucket", Key="key")